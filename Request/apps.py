@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class RequestConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Request'
+
+    def ready(self):
+        from django.db.models.signals import pre_save, post_save, post_delete
+        from .models import Task
+        from .search import task_search
+        from .images import task_images
+        from . import signals  # noqa: F401  (응답 캐시 무효화)
+
+        pre_save.connect(task_search.pre_save, sender=Task, dispatch_uid='task_search_pre_save')
+        post_save.connect(task_search.post_save, sender=Task, dispatch_uid='task_search_post_save')
+        post_save.connect(task_images.post_save, sender=Task, dispatch_uid='task_images_post_save')
+        post_delete.connect(task_images.post_delete, sender=Task, dispatch_uid='task_images_post_delete')
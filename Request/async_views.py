@@ -0,0 +1,35 @@
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from utils.async_views import AsyncAPIView
+from utils.pagination import KeysetPagination
+from .models import Task
+from .serializers import TaskSerializer, task_list_renderer
+from .views import TaskListCreateView, task_list_queryset, task_full_queryset, task_list_fields, task_fields
+
+# 요청 목록/상세의 async 버전 (ASGI에서 /request/async/... 로 제공)
+
+
+class TaskListAsync(AsyncAPIView):
+    filter_backends = TaskListCreateView.filter_backends
+    search_index = TaskListCreateView.search_index
+    ordering_fields = TaskListCreateView.ordering_fields
+    cursor_ordering_fields = TaskListCreateView.cursor_ordering_fields
+
+    async def get(self, request, format=None):
+        fields = task_list_fields.select(request)
+        queryset = self.filter_queryset(task_list_queryset().filter(status=Task.TaskStatus.PENDING))
+        paginator = KeysetPagination()
+        queryset = task_list_renderer.values(queryset, fields, [paginator.default_ordering])
+        page = await paginator.apaginate_queryset(queryset, request, view=self)
+        return {'next': paginator.get_next_link(), 'results': task_list_renderer.render(page, request, fields)}, status.HTTP_200_OK
+
+
+class TaskDetailAsync(AsyncAPIView):
+    async def get(self, request, pk, format=None):
+        fields = task_fields.select(request)
+        try:
+            task = await task_fields.queryset(task_full_queryset(), fields).aget(pk=pk)
+        except Task.DoesNotExist:
+            raise NotFound('해당 요청을 찾을 수 없습니다.')
+        serializer = task_fields.apply(TaskSerializer(task, context={'request': request}), fields)
+        return serializer.data, status.HTTP_200_OK
@@ -0,0 +1,8 @@
+from utils.images import ImageDerivatives
+from .models import Task
+
+task_images = ImageDerivatives(
+    Task, 'photo', 'photo_variants',
+    namespaces=lambda pk: [f'task:{pk}'],
+    touch='updated_at',
+)
@@ -0,0 +1,82 @@
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from accounts.models import User
+from accounts.services import JWTService
+from Request.models import Task
+
+
+def _init_worker():
+    # spawn 방식 자식 프로세스용 (fork면 이미 준비되어 있음). 부모의 DB 연결은 쓰지 않는다.
+    import django
+    import logging
+    django.setup()
+    connections.close_all()
+    logging.getLogger("django.request").setLevel(logging.ERROR)  # 패자의 400 경고는 출력하지 않는다.
+
+
+def _contend(token, task_ids):
+    """한 도우미가 모든 요청을 같은 순서로 수락 시도 → [(task_id, status_code)]"""
+    from django.test import Client
+    client = Client(SERVER_NAME="localhost", HTTP_AUTHORIZATION=f"Bearer {token}")
+    try:
+        return [(task_id, client.post(f"/request/{task_id}/accept/").status_code) for task_id in task_ids]
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "요청 수락 경합 테스트: 여러 프로세스가 같은 요청들을 동시에 수락해 요청마다 승자가 정확히 한 명인지 확인하고 "
+        "처리량을 측정합니다. 임시 계정/요청을 만들고 끝나면 지웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=50)
+        parser.add_argument("--helpers", type=int, default=8, help="동시에 수락하는 프로세스(도우미) 수")
+
+    def handle(self, *args, **options):
+        tag = uuid.uuid4().hex[:12]
+        requester = User.objects.create_user(email=f"bench-accept-{tag}@example.com", password=None, name="bench")
+        helpers = [
+            User.objects.create_user(email=f"bench-accept-{tag}-{i}@example.com", password=None, name="bench")
+            for i in range(options["helpers"])
+        ]
+        tasks = Task.objects.bulk_create([
+            Task(requester=requester, title=f"수락 경합 {i}", content="bench") for i in range(options["tasks"])
+        ])
+        task_ids = [task.pk for task in tasks]
+        tokens = [JWTService().post(helper)["access"]["token"] for helper in helpers]
+
+        connections.close_all()  # fork 전에 닫아 자식과 연결을 공유하지 않는다.
+        try:
+            started = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=len(helpers), initializer=_init_worker) as pool:
+                results = list(pool.map(_contend, tokens, [task_ids] * len(tokens)))
+            elapsed = time.perf_counter() - started
+
+            winners = defaultdict(int)
+            codes = Counter()
+            for attempts in results:
+                for task_id, code in attempts:
+                    codes[code] += 1
+                    if code == 200:
+                        winners[task_id] += 1
+            accepted = dict(Task.objects.filter(pk__in=task_ids).values_list("pk", "helper_id"))
+        finally:
+            Task.objects.filter(pk__in=task_ids).delete()
+            User.objects.filter(pk__in=[requester.pk, *(helper.pk for helper in helpers)]).delete()
+
+        attempts = sum(codes.values())
+        self.stdout.write(
+            f"{attempts} attempts on {len(task_ids)} tasks by {len(helpers)} processes in {elapsed:.2f}s: "
+            f"{dict(sorted(codes.items()))}\n"
+            f"{attempts / elapsed:.1f} attempts/s, {codes[200] / elapsed:.1f} accepts/s"
+        )
+        bad = [task_id for task_id in task_ids if winners.get(task_id, 0) != 1 or accepted.get(task_id) is None]
+        if bad:
+            raise CommandError(f"승자가 정확히 한 명이 아닌 요청: {bad}")
+        self.stdout.write("ok: 요청마다 승자 1명")
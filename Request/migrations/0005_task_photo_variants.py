@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Request', '0004_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='photo_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.6 on 2026-10-18 20:31
+
+import re
+from collections import Counter
+from django.db import migrations
+
+_WORD_RE = re.compile(r'[^\W_]+')
+FIELDS = {'title': 2, 'content': 1}
+
+
+def index_tokens(text):
+    # utils.search.index_tokens와 같은 토큰화 (글자 unigram + bigram)
+    tokens = []
+    for word in _WORD_RE.findall((text or '').lower()):
+        tokens.extend(word)
+        if len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def rebuild_search_document(apps, schema_editor):
+    # 기존 행의 검색 문서/역색인을 새 토큰화로 다시 채운다. (manage.py rebuild_search_index와 같은 처리, 과거 모델 사용)
+    Task = apps.get_model('Request', 'Task')
+    TaskSearchToken = apps.get_model('Request', 'TaskSearchToken')
+    use_token_table = schema_editor.connection.vendor != 'postgresql'
+    last_pk = 0
+    while True:
+        batch = list(Task.objects.filter(pk__gt=last_pk).order_by('pk').only(*FIELDS)[:1000])
+        if not batch:
+            return
+        for task in batch:
+            task.search_document = ' '.join(
+                token for field, weight in FIELDS.items() for token in index_tokens(getattr(task, field)) * weight
+            )
+        Task.objects.bulk_update(batch, ['search_document'])
+        if use_token_table:
+            TaskSearchToken.objects.filter(task__in=batch).delete()
+            TaskSearchToken.objects.bulk_create([
+                TaskSearchToken(task=task, token=token, weight=weight)
+                for task in batch for token, weight in Counter(task.search_document.split()).items()
+            ], batch_size=1000)
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Request', '0006_task_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_search_document, migrations.RunPython.noop),
+    ]
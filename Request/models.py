@@ -1,7 +1,8 @@
 from django.db import models
 from django.conf import settings
+from utils.concurrency import VersionedModel
 
-class Task(models.Model):
+class Task(VersionedModel):
     class TaskStatus(models.TextChoices):
         PENDING = 'PENDING', '대기중'
         ACCEPTED = 'ACCEPTED', '수락됨'
@@ -11,20 +12,51 @@ class Task(models.Model):
     title = models.CharField(max_length=100)
     content = models.TextField()
     photo = models.ImageField(upload_to='task_photos/', blank=True, null=True)
+    # 썸네일 파생본 이름 (utils.images가 백그라운드에서 기록)
+    photo_variants = models.JSONField(default=dict, blank=True, editable=False)
     status = models.CharField(max_length=10, choices=TaskStatus.choices, default=TaskStatus.PENDING)
     #Personal info who accepts task
     helper = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='helper_tasks')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 검색 문서(제목/내용 글자·bigram 토큰). utils.search가 저장 시 갱신
+    search_document = models.TextField(blank=True, default='', editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='task_status_created_idx'),
+            # 대기중 목록(TaskListCreateView)은 부분 인덱스
+            models.Index(
+                fields=['created_at'], name='task_pending_created_idx',
+                condition=models.Q(status='PENDING'),
+            ),
+            models.Index(fields=['requester', '-created_at'], name='task_requester_created_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
+class TaskSearchToken(models.Model):
+    # 검색 역색인 (Postgres 외 DB용)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='search_tokens')
+    token = models.CharField(max_length=2)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['token', 'task'], name='task_search_token_idx'),
+        ]
+
 class Comment(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='comments')
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'created_at'], name='comment_task_created_idx'),
+        ]
+
     def __str__(self):
         return f'Comment by {self.author.email} on {self.task.title}'
\ No newline at end of file
@@ -0,0 +1,8 @@
+from utils.search import SearchIndex
+from .models import Task, TaskSearchToken
+
+task_search = SearchIndex(
+    Task, TaskSearchToken,
+    fields={'title': 2, 'content': 1},
+    token_fk='task',
+)
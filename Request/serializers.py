@@ -1,7 +1,23 @@
 from rest_framework import serializers
+from utils.images import ImageVariantsField
+from utils.renderers import ValuesRenderer, Computed
+from .images import task_images
 from .models import Task, Comment
 from accounts.serializers import UserSerializer 
 
+def comment_count(task):
+    """
+    댓글 수: 뷰에서 annotate한 comment_count → prefetch된 comments → COUNT 순으로 사용
+    (뷰의 쿼리 계획에 따라 행마다 추가 쿼리가 나가지 않도록)
+    """
+    annotated = getattr(task, 'comment_count', None)
+    if annotated is not None:
+        return annotated
+    prefetched = getattr(task, '_prefetched_objects_cache', {})
+    if 'comments' in prefetched:
+        return len(prefetched['comments'])
+    return task.comments.count()
+
 class CommentSerializer(serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
 
@@ -12,10 +28,11 @@ class CommentSerializer(serializers.ModelSerializer):
 class TaskListSerializer(serializers.ModelSerializer):
     
     requester = UserSerializer(read_only=True)
+    photo_urls = ImageVariantsField(task_images)  # 크기별 썸네일(webp/jpeg)
     comment_count = serializers.SerializerMethodField()
 
     def get_comment_count(self, obj):
-        return obj.comments.count()
+        return comment_count(obj)
 
     class Meta:
         model = Task
@@ -24,11 +41,17 @@ class TaskListSerializer(serializers.ModelSerializer):
             'title',
             'content',
             'photo',
+            'photo_urls',
             'requester',
             'created_at',
             'comment_count',
             ]
 
+# 목록 빠른 경로 (TaskListSerializer와 같은 출력, values() 행 사용. comment_count는 annotate 필요)
+task_list_renderer = ValuesRenderer(TaskListSerializer, overrides={
+    'comment_count': Computed(['comment_count'], lambda row, context: row['comment_count']),
+})
+
 class TaskDetailSerializer(serializers.ModelSerializer):
     requester = UserSerializer(read_only=True)
     comments = CommentSerializer(many=True, read_only=True)
@@ -44,16 +67,17 @@ class TaskDetailSerializer(serializers.ModelSerializer):
 class TaskSerializer(serializers.ModelSerializer):
     requester = UserSerializer(read_only=True)
     helper = UserSerializer(read_only=True)
+    photo_urls = ImageVariantsField(task_images)
     comments = CommentSerializer(many=True, read_only=True)
     comment_count = serializers.SerializerMethodField()
 
     def get_comment_count(self, obj):
-        return obj.comments.count()
+        return comment_count(obj)
     
     class Meta:
         model = Task
         fields = [
-            'id', 'requester', 'helper', 'title', 'content', 'photo',
-            'status', 'created_at', 'updated_at', 'comments', 'comment_count'
+            'id', 'requester', 'helper', 'title', 'content', 'photo', 'photo_urls',
+            'status', 'created_at', 'updated_at', 'comments', 'comment_count', 'version'
         ]
         read_only_fields = ['requester', 'helper', 'status', 'comments']
\ No newline at end of file
@@ -0,0 +1,47 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from accounts.services import UserStatsService
+from utils.cache import bump
+from utils.concurrency import VersionConflict
+from .models import Task
+
+
+def accept_task(user, task, expected_version=None) -> Task:
+    """
+    요청 수락 (조건부 UPDATE 한 번, 행 잠금 없음)
+      - PENDING 상태이고 요청자가 본인이 아닐 때만 helper/status를 바꾼다.
+      - 동시에 여러 명이 눌러도 DB가 한 명만 통과시킨다. (나머지는 0행 갱신 → 거절)
+    task: 뷰가 미리 읽은 Task. 성공하면 갱신한 값을 이 인스턴스에 반영해 돌려준다. (다시 조회하지 않음)
+    expected_version: 주면 그 버전일 때만 바꾼다. (UPDATE 조건에 version 포함, 그 사이 수정됐으면 VersionConflict)
+    수락할 수 없으면 ValueError
+    save()를 거치지 않으므로 post_save 신호 대신 응답 캐시를 직접 무효화한다.
+    (검색 문서/이미지/미디어 참조는 바뀌는 컬럼이 없어 갱신할 것이 없다)
+    """
+    if task.status != Task.TaskStatus.PENDING:
+        raise ValueError("이미 수락되었거나 마감된 요청입니다.")
+    if task.requester_id == user.pk:
+        raise ValueError("자신이 올린 요청은 수락할 수 없습니다.")
+
+    now = timezone.now()
+    candidates = Task.objects.filter(pk=task.pk, status=Task.TaskStatus.PENDING).exclude(requester_id=user.pk)
+    if expected_version is not None:
+        candidates = candidates.filter(version=expected_version)
+    with transaction.atomic():
+        updated = candidates.update(
+            helper_id=user.pk, status=Task.TaskStatus.ACCEPTED, updated_at=now, version=F('version') + 1,
+        )
+        if updated:
+            UserStatsService.increment(user.pk, tasks_helped_count=1)
+    if not updated:
+        still_pending = Task.objects.filter(pk=task.pk, status=Task.TaskStatus.PENDING)
+        if expected_version is not None and still_pending.exclude(version=expected_version).exists():
+            raise VersionConflict()  # 수락할 수 있는 상태지만 읽은 뒤 수정됨
+        raise ValueError("이미 수락되었거나 마감된 요청입니다.")
+
+    bump(f'task:{task.pk}')
+    task.helper = user
+    task.status = Task.TaskStatus.ACCEPTED
+    task.updated_at = now
+    task.version += 1
+    return task
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from utils.cache import bump
+from supply.models import SupplyPost
+from .models import Task, Comment
+
+# 응답 캐시 무효화 (utils.cache 세대 카운터)
+#   task:<pk> : 요청 상세 (댓글 포함)
+#   supply:<pk> : 요청글을 카드로 보여주는 공급글 상세
+
+
+@receiver([post_save, post_delete], sender=Task)
+def invalidate_task(sender, instance, created=False, **kwargs):
+    namespaces = [f'task:{instance.pk}']
+    if not created:
+        supply_ids = SupplyPost.objects.filter(request_id=instance.pk).values_list('id', flat=True)
+        namespaces += [f'supply:{supply_id}' for supply_id in supply_ids]
+    bump(*namespaces)
+
+
+@receiver([post_save, post_delete], sender=Comment)
+def invalidate_task_comment(sender, instance, **kwargs):
+    bump(f'task:{instance.task_id}')
@@ -1,3 +1,265 @@
-from django.test import TestCase
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
+from django.core.cache import cache
+from django.db import OperationalError, connection, connections
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+from accounts.models import User, UserStats
+from utils.concurrency import VersionConflict
+from utils.testing import QueryBudgetMixin, ValuesRendererMixin
+from .models import Task, Comment
+from .serializers import task_list_renderer
+from .services import accept_task
+from .views import task_list_queryset
 
-# Create your tests here.
+
+@skipUnless(connection.vendor == 'sqlite', 'EXPLAIN QUERY PLAN 형식은 SQLite 기준')
+class HotQueryIndexTests(TestCase):
+    """요청 목록/댓글 쿼리가 전용 인덱스를 타는지 (전체 스캔 없음)"""
+
+    def assertUsesIndex(self, queryset, *index_names):
+        plan = queryset.explain()
+        self.assertTrue(any(f'INDEX {name}' in plan for name in index_names), plan)
+        self.assertNotIn('SCAN Request_', plan)
+        return plan
+
+    def test_pending_list(self):
+        # 댓글 수 집계(GROUP BY) 때문에 정렬은 임시 B-tree를 쓴다. 행 선택만 인덱스로 확인한다.
+        self.assertUsesIndex(
+            task_list_queryset().filter(status=Task.TaskStatus.PENDING).order_by('-created_at')[:20],
+            'task_status_created_idx', 'task_pending_created_idx',
+        )
+
+    def test_my_tasks(self):
+        plan = self.assertUsesIndex(
+            Task.objects.filter(requester_id=1).order_by('-created_at')[:20], 'task_requester_created_idx',
+        )
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_comments_of_task(self):
+        plan = self.assertUsesIndex(
+            Comment.objects.filter(task_id=1).order_by('created_at'), 'comment_task_created_idx',
+        )
+        self.assertNotIn('TEMP B-TREE', plan)
+
+
+class EndpointQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """요청 목록/상세/댓글 엔드포인트가 행 수와 무관하게 같은 쿼리 수로 끝나는지 (응답 캐시 없이)"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='requester@example.com', password=None, name='requester')
+        self.helper = User.objects.create_user(email='helper@example.com', password=None, name='helper')
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+        self.task = Task.objects.create(requester=self.user, title='장보기', content='우유 사다 주세요')
+
+    def seed_tasks(self, n):
+        while Task.objects.count() < n:
+            task = Task.objects.create(requester=self.user, title='장보기', content='우유 사다 주세요')
+            Comment.objects.create(task=task, author=self.helper, content='제가 할게요')
+
+    def seed_comments(self, n):
+        while self.task.comments.count() < n:
+            Comment.objects.create(task=self.task, author=self.helper, content='제가 할게요')
+
+    def get(self, url):
+        cache.clear()
+        response = self.api.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_task_list(self):
+        self.assertConstantQueries(budget=1, seed=self.seed_tasks, call=lambda: self.get('/request/'))
+
+    def test_my_tasks(self):
+        self.assertConstantQueries(budget=2, seed=self.seed_tasks, call=lambda: self.get('/request/mine/'))
+
+    def test_task_detail(self):
+        self.assertConstantQueries(budget=3, seed=self.seed_comments, call=lambda: self.get(f'/request/{self.task.pk}/'))
+
+    def test_comment_list(self):
+        self.assertConstantQueries(
+            budget=1, seed=self.seed_comments, call=lambda: self.get(f'/request/{self.task.pk}/comments/'),
+        )
+
+
+class ListRendererTests(ValuesRendererMixin, TestCase):
+    """task_list_renderer(values() 빠른 경로)가 TaskListSerializer와 같은 JSON을 내는지"""
+
+    def setUp(self):
+        user = User.objects.create_user(email='requester@example.com', password=None, name='requester')
+        helper = User.objects.create_user(email='helper@example.com', password=None, name='helper')
+        Task.objects.create(requester=user, title='장보기', content='우유 사다 주세요')
+        task = Task.objects.create(requester=user, title='택배', content='받아 주세요', photo=f'blobs/cc/dd/{1:064x}.jpg')
+        Comment.objects.create(task=task, author=helper, content='제가 할게요')
+        Comment.objects.create(task=task, author=user, content='감사합니다')
+
+    def test_matches_serializer(self):
+        self.assertRendersLikeSerializer(task_list_renderer, task_list_queryset())
+
+    def test_sparse_fields_match_serializer(self):
+        self.assertRendersLikeSerializer(task_list_renderer, task_list_queryset(), fields=['id', 'requester', 'comment_count'])
+
+
+class SearchTests(TestCase):
+    """?search=: 한 글자 검색어도 단어 안의 글자와 맞고, 제목 일치가 먼저 온다."""
+
+    def setUp(self):
+        cache.clear()
+        requester = User.objects.create_user(email='requester@example.com', password=None, name='requester')
+        self.milk = Task.objects.create(requester=requester, title='우유 사다 주세요', content='편의점에서')
+        self.bread = Task.objects.create(requester=requester, title='빵 사다 주세요', content='우유식빵으로')
+        self.parcel = Task.objects.create(requester=requester, title='택배 맡아 주세요', content='오후에 와요')
+        self.api = APIClient()
+        self.api.force_authenticate(requester)
+
+    def search(self, term):
+        response = self.api.get('/request/', {'search': term})
+        self.assertEqual(response.status_code, 200)
+        return [row['id'] for row in response.json()['results']]
+
+    def test_single_character_term(self):
+        self.assertEqual(self.search('빵'), [self.bread.pk])
+        self.assertEqual(self.search('유'), [self.milk.pk, self.bread.pk])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(sorted(self.search('사다 주세요')), sorted([self.milk.pk, self.bread.pk]))
+        self.assertEqual(self.search('택배'), [self.parcel.pk])
+        self.assertEqual(self.search('세탁'), [])
+
+
+class DetailConditionalGetTests(TestCase):
+    """상세 GET: If-None-Match가 맞으면 304, 요청글이나 댓글이 바뀌면 ETag도 바뀐다."""
+
+    def setUp(self):
+        cache.clear()
+        self.requester = User.objects.create_user(email='requester@example.com', password=None, name='requester')
+        self.task = Task.objects.create(requester=self.requester, title='장보기', content='우유 사다 주세요')
+        self.api = APIClient()
+        self.api.force_authenticate(self.requester)
+        self.url = f'/request/{self.task.pk}/'
+
+    def etag(self):
+        response = self.api.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def assertChanged(self, etag):
+        response = self.api.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        return response
+
+    def test_matching_etag_returns_304(self):
+        etag = self.etag()
+        response = self.api.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_etag_changes_after_update(self):
+        etag = self.etag()
+        self.task.title = '장보기 (수정)'
+        with self.captureOnCommitCallbacks(execute=True):  # 응답 캐시 무효화(bump)는 커밋 뒤에 실행된다.
+            self.task.save()
+        self.assertEqual(self.assertChanged(etag).data['title'], '장보기 (수정)')
+
+    def test_etag_changes_after_comment(self):
+        etag = self.etag()
+        Comment.objects.create(task=self.task, author=self.requester, content='빨리 부탁해요')
+        self.assertChanged(etag)
+
+
+class AcceptIfMatchTests(TestCase):
+    """수락의 If-Match는 본문 version의 강한 검증자와 비교하고, 조건부 UPDATE는 읽은 버전으로 한다."""
+
+    def setUp(self):
+        cache.clear()
+        self.requester = User.objects.create_user(email='requester@example.com', password=None, name='requester')
+        self.helper = User.objects.create_user(email='helper@example.com', password=None, name='helper')
+        self.task = Task.objects.create(requester=self.requester, title='장보기', content='우유 사다 주세요')
+        self.api = APIClient()
+        self.api.force_authenticate(self.helper)
+
+    def version_tag(self):
+        response = self.api.get(f'/request/{self.task.pk}/')
+        self.assertEqual(response.status_code, 200)
+        return f'"{response.data["version"]}"'
+
+    def accept(self, etag):
+        return self.api.post(f'/request/{self.task.pk}/accept/', HTTP_IF_MATCH=etag)
+
+    def test_version_tag_is_accepted(self):
+        response = self.accept(self.version_tag())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], Task.TaskStatus.ACCEPTED)
+
+    def test_comment_does_not_invalidate_version(self):
+        # 댓글은 상세 GET의 ETag를 바꾸지만 요청글 버전은 그대로다.
+        etag = self.version_tag()
+        Comment.objects.create(task=self.task, author=self.requester, content='빨리 부탁해요')
+        self.assertEqual(self.accept(etag).status_code, 200)
+
+    def test_weak_etag_is_rejected(self):
+        self.assertEqual(self.accept(f'W/{self.version_tag()}').status_code, 412)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).status, Task.TaskStatus.PENDING)
+
+    def test_stale_version_is_rejected(self):
+        etag = self.version_tag()
+        self.task.title = '장보기 (수정)'
+        self.task.save(update_fields=['title'])
+        self.assertEqual(self.accept(etag).status_code, 412)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).status, Task.TaskStatus.PENDING)
+
+    def test_update_is_conditional_on_read_version(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        Task.objects.filter(pk=self.task.pk).update(title='장보기 (수정)', version=stale.version + 1)
+        with self.assertRaises(VersionConflict):
+            accept_task(self.helper, stale, expected_version=stale.version)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).status, Task.TaskStatus.PENDING)
+
+
+class ConcurrentAcceptTests(TransactionTestCase):
+    """여러 도우미가 같은 요청을 동시에 수락해도 한 명만 통과한다. (스레드마다 DB 연결)"""
+    workers = 8
+
+    def setUp(self):
+        cache.clear()
+        requester = User.objects.create_user(email='requester@example.com', password=None, name='requester')
+        self.task = Task.objects.create(requester=requester, title='장보기', content='우유 사다 주세요')
+        self.helpers = [
+            User.objects.create_user(email=f'helper{i}@example.com', password=None, name=f'helper{i}')
+            for i in range(self.workers)
+        ]
+        self.ready = threading.Barrier(self.workers)
+
+    def accept(self, helper):
+        try:
+            task = Task.objects.get(pk=self.task.pk)  # 모두 PENDING 상태를 읽은 뒤 동시에 수락
+            self.ready.wait()
+            while True:
+                try:
+                    accept_task(helper, task, expected_version=task.version)
+                    return True
+                except (ValueError, VersionConflict):
+                    return False
+                except OperationalError as e:
+                    # 테스트용 SQLite(공유 캐시 메모리 DB)는 잠금을 기다리지 않고 바로 실패한다. 트랜잭션째 다시 시도
+                    if 'locked' not in str(e):
+                        raise
+                    time.sleep(0.001)
+        finally:
+            connections.close_all()
+
+    def test_exactly_one_wins(self):
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(self.accept, self.helpers))
+
+        self.assertEqual(sum(results), 1)
+        winner = self.helpers[results.index(True)]
+        task = Task.objects.get(pk=self.task.pk)
+        self.assertEqual((task.status, task.helper_id), (Task.TaskStatus.ACCEPTED, winner.pk))
+        helped = dict(UserStats.objects.filter(user__in=self.helpers).values_list('user_id', 'tasks_helped_count'))
+        self.assertEqual({user_id: count for user_id, count in helped.items() if count}, {winner.pk: 1})
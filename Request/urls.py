@@ -1,5 +1,6 @@
 from django.urls import path
 from .views import *
+from .async_views import TaskListAsync, TaskDetailAsync
 
 urlpatterns = [
     path('', TaskListCreateView.as_view(), name='task-list-create'),
@@ -7,4 +8,8 @@ urlpatterns = [
     path('<int:pk>/', TaskDetailView.as_view(), name='task-detail'),
     path('<int:pk>/accept/', TaskAcceptView.as_view(), name='task-accept'),
     path('<int:task_pk>/comments/', CommentListCreateView.as_view(), name='comment-list-create'),
+
+    # async(ASGI) 버전
+    path('async/', TaskListAsync.as_view(), name='task-list-async'),
+    path('async/<int:pk>/', TaskDetailAsync.as_view(), name='task-detail-async'),
 ]
\ No newline at end of file
@@ -3,22 +3,75 @@ from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.filters import OrderingFilter
+from utils.search import IndexedSearchFilter
+from utils.renderers import ValuesListMixin
+from utils.fieldsets import SparseFieldset, SparseFieldsMixin, Needs
+from utils.cache import cached_response
+from utils.conditional import Validators, conditional_response, make_etag, latest
+from utils.concurrency import check_if_match
+from utils.throttling import UserTokenBucket, IPTokenBucket
+from idempotency.decorators import idempotent
+from accounts.models import User
 from .models import Task, Comment
-from .serializers import TaskSerializer, CommentSerializer, TaskDetailSerializer, TaskListSerializer
-from django.db.models import Count
-
-
-class TaskListCreateView(generics.ListCreateAPIView):
+from .serializers import TaskSerializer, CommentSerializer, TaskDetailSerializer, TaskListSerializer, task_list_renderer
+from .search import task_search
+from .services import accept_task
+from django.db.models import Count, Max, Prefetch
+
+
+# 쿼리 계획
+# 직렬화에 필요한 관계를 select_related/Prefetch로 미리 읽어, 페이지의 행 수와 무관하게 쿼리 수를 고정한다.
+
+def task_list_queryset():
+    # TaskListSerializer: requester + 댓글 수(annotate)
+    return Task.objects.select_related('requester').annotate(comment_count=Count('comments'))
+
+def comments_prefetch():
+    return Prefetch('comments', queryset=Comment.objects.select_related('author').order_by('created_at'))
+
+def task_full_queryset():
+    # TaskSerializer: requester/helper + 댓글(작성자 포함)
+    return Task.objects.select_related('requester', 'helper').prefetch_related(comments_prefetch())
+
+# 희소 필드셋 (?fields= / ?expand=): 고른 필드에 필요한 컬럼/관계만 읽는다.
+# 댓글(comments)은 expandable이라 ?expand= 로 뺄 수 있고, 빼면 prefetch도 하지 않는다.
+task_list_fields = SparseFieldset(TaskListSerializer, needs={
+    'comment_count': Needs(annotate={'comment_count': Count('comments')}),
+})
+task_fields = SparseFieldset(TaskSerializer, expandable=['comments'], needs={
+    'comments': Needs(prefetch_related=[comments_prefetch()]),
+    'comment_count': Needs(annotate={'comment_count': Count('comments')}),
+})
+
+def task_detail_validators(pk):
+    # 상세 조건부 GET 검증자 (쿼리 1회): 버전/수정 시각 + 댓글(수, 최신 시각). 없으면 None
+    rows = (
+        Task.objects.filter(pk=pk)
+        .values('version', 'updated_at')
+        .annotate(comment_count=Count('comments'), last_comment_at=Max('comments__created_at'))
+    )
+    row = next(iter(rows), None)
+    if row is None:
+        return None
+    etag = make_etag('task', pk, row['version'], row['updated_at'].isoformat(), row['comment_count'], row['last_comment_at'])
+    return Validators(etag, latest(row['updated_at'], row['last_comment_at']))
+
+
+class TaskListCreateView(SparseFieldsMixin, ValuesListMixin, generics.ListCreateAPIView):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    list_renderer = task_list_renderer  # 목록은 values() 빠른 경로
+    sparse_fieldset = task_list_fields
 
+    filter_backends = [OrderingFilter, IndexedSearchFilter]
+    search_index = task_search
     ordering_fields = ['created_at', 'comment_count']
+    cursor_ordering_fields = [*ordering_fields, 'search_rank']
 
     def get_queryset(self):
-        queryset = Task.objects.annotate(
-            comment_count=Count('comments')
-        ).filter(
+        queryset = task_list_queryset().filter(
             status=Task.TaskStatus.PENDING
         )
         return queryset
@@ -28,52 +81,77 @@ class TaskListCreateView(generics.ListCreateAPIView):
             return TaskListSerializer
         return super().get_serializer_class()
 
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         serializer.save(requester=self.request.user)
 
-class TaskDetailView(generics.RetrieveAPIView):
-    queryset = Task.objects.all()
+class TaskDetailView(SparseFieldsMixin, generics.RetrieveAPIView):
+    queryset = task_full_queryset()
     serializer_class = TaskSerializer
+    sparse_fieldset = task_fields
     permission_classes = [IsAuthenticated]
 
+    def retrieve(self, request, *args, **kwargs):
+        # 클라이언트 검증자가 맞으면 304 (응답 캐시 조회/직렬화 생략)
+        return conditional_response(
+            request, task_detail_validators(kwargs['pk']),
+            lambda: cached_response(
+                request, [f"task:{kwargs['pk']}"],
+                lambda: super(TaskDetailView, self).retrieve(request, *args, **kwargs),
+            ),
+        )
+
 
 class TaskAcceptView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, pk):
+        # 응답에 쓸 행을 먼저 읽고(관계 포함), 수락 판정은 조건부 UPDATE가 한다. (services.accept_task)
         try:
-            task = Task.objects.get(pk=pk)
+            task = task_full_queryset().get(pk=pk)
         except Task.DoesNotExist:
             return Response({"error": "해당 요청을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        if task.status != Task.TaskStatus.PENDING:
-            return Response({"error": "이미 수락되었거나 마감된 요청입니다."}, status=status.HTTP_400_BAD_REQUEST)
-        if task.requester == request.user:
-            return Response({"error": "자신이 올린 요청은 수락할 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
-
-        task.helper = request.user
-        task.status = Task.TaskStatus.ACCEPTED
-        task.save()
+        # If-Match("<version>")가 있으면 클라이언트가 본 버전 그대로일 때만 수락
+        check_if_match(request, task)
+        helper = request.user
+        if helper.get_deferred_fields():
+            # 토큰 클레임으로 만든 사용자는 일부 필드만 있으므로 응답용으로 한 번에 읽는다. (필드별 지연 조회 방지)
+            helper = User.objects.get(pk=helper.pk)
+        try:
+            accept_task(helper, task, expected_version=task.version)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         serializer = TaskSerializer(task)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
-class MyTaskListView(generics.ListAPIView):
+class MyTaskListView(SparseFieldsMixin, generics.ListAPIView):
     serializer_class = TaskSerializer
+    sparse_fieldset = task_fields
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Task.objects.filter(requester=self.request.user).order_by('-created_at')
+        return task_full_queryset().filter(requester=self.request.user).order_by('-created_at')
 
 class CommentListCreateView(generics.ListCreateAPIView):
     queryset = Comment.objects.all()
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserTokenBucket, IPTokenBucket]
+    throttle_scope = 'comment'
+
+    def get_throttles(self):
+        # 댓글 작성만 제한
+        return super().get_throttles() if self.request.method == 'POST' else []
 
     def get_queryset(self):
         # URL에서 task_pk를 가져와 해당 task의 댓글만 필터링
         task_pk = self.kwargs.get('task_pk')
-        return Comment.objects.filter(task_id=task_pk).order_by('created_at')
+        return Comment.objects.select_related('author').filter(task_id=task_pk).order_by('created_at')
 
     def perform_create(self, serializer):
         # 댓글 생성 시 작성자와 해당 task를 URL을 통해 자동으로 설정
@@ -0,0 +1,174 @@
+import threading
+import time
+from asgiref.sync import sync_to_async
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+# 캐시/토큰 클레임에 담는 사용자 필드 (비밀번호 등 민감 정보 제외)
+USER_CACHE_FIELDS = ('id', 'email', 'name', 'is_active', 'is_staff', 'is_superuser')
+# 토큰에 함께 싣는 클레임 (JWTService에서 추가)
+USER_TOKEN_CLAIMS = ('email', 'name', 'is_active')
+
+
+def _cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+def _shared_ttl():
+    # 비활성화가 이미 발급된 토큰보다 오래 남도록 access token 수명만큼 보관
+    return int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+class _LocalLRU:
+    """프로세스 내 짧은 TTL LRU (공유 캐시 왕복도 줄이기 위함)"""
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+local_users = _LocalLRU(
+    maxsize=getattr(settings, 'AUTH_USER_LOCAL_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'AUTH_USER_LOCAL_CACHE_TTL', 30),
+)
+
+
+def user_cache_data(user) -> dict:
+    return {field: getattr(user, field) for field in USER_CACHE_FIELDS}
+
+def cache_user(user):
+    """사용자 저장 시 공유 캐시에 최신 값을 기록(write-through)하고 로컬 LRU는 비운다."""
+    cache.set(_cache_key(user.pk), user_cache_data(user), _shared_ttl())
+    local_users.pop(user.pk)
+
+def forget_user(user_id):
+    """사용자 삭제 시: 클레임만으로 인증되지 않도록 비활성 표시를 남긴다."""
+    cache.set(_cache_key(user_id), {'id': user_id, 'is_active': False}, _shared_ttl())
+    local_users.pop(user_id)
+
+
+def build_user(data: dict):
+    """
+    캐시 값으로 User 인스턴스를 만든다. 나머지 필드는 deferred 상태라
+    접근 시에만 DB에서 읽고, save() 시에도 로드된 필드만 저장된다. (비밀번호 덮어쓰기 방지)
+    """
+    fields = [f for f in User._meta.concrete_fields if f.attname in data]
+    return User.from_db(DEFAULT_DB_ALIAS, [f.attname for f in fields], [data[f.attname] for f in fields])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication + 사용자 조회 캐시
+    1) 프로세스 내 LRU → 2) 공유 캐시(CACHES) → 3) 토큰 클레임(name/email/is_active) → 4) DB
+    3)은 AUTH_TRUST_TOKEN_CLAIMS일 때만 쓴다. 클레임은 발급 시점 값이라, 캐시 미스에서 믿으면
+    다른 워커에서 비활성화/삭제된 사용자(툼스톤이 없거나 밀려난 경우)가 토큰 수명 동안 인증된다.
+    사용자 저장/삭제 시 accounts.signals에서 캐시를 갱신한다.
+    비동기 뷰(utils.async_views)는 aauthenticate()를 사용한다.
+    """
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # 비밀번호 해시 비교가 필요하므로 DB 조회
+            return super().get_user(validated_token)
+
+        user_id = self._get_user_id(validated_token)
+        data = local_users.get(user_id)
+        if data is None:
+            data = self._from_claims(user_id, validated_token, cache.get(_cache_key(user_id)))
+            if data is None:
+                return self._remember(super().get_user(validated_token))
+            local_users.set(user_id, data)
+        return self._build(data)
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return await sync_to_async(super().get_user)(validated_token)
+
+        user_id = self._get_user_id(validated_token)
+        data = local_users.get(user_id)
+        if data is None:
+            data = self._from_claims(user_id, validated_token, await cache.aget(_cache_key(user_id)))
+            if data is None:
+                try:
+                    user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+                except self.user_model.DoesNotExist as e:
+                    raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+                if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+                    raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+                data = user_cache_data(user)
+                await cache.aset(_cache_key(user_id), data, _shared_ttl())
+                local_users.set(user_id, data)
+                return user
+            local_users.set(user_id, data)
+        return self._build(data)
+
+    @staticmethod
+    def _get_user_id(validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+    @staticmethod
+    def _from_claims(user_id, validated_token, cached):
+        if cached is not None:
+            return cached
+        if not getattr(settings, 'AUTH_TRUST_TOKEN_CLAIMS', False):
+            return None  # DB에서 확인
+        if all(claim in validated_token for claim in USER_TOKEN_CLAIMS):
+            return {'id': user_id, **{claim: validated_token[claim] for claim in USER_TOKEN_CLAIMS}}
+        return None
+
+    @staticmethod
+    def _remember(user):
+        data = user_cache_data(user)
+        cache.set(_cache_key(user.pk), data, _shared_ttl())
+        local_users.set(user.pk, data)
+        return user
+
+    @staticmethod
+    def _build(data):
+        if api_settings.CHECK_USER_IS_ACTIVE and not data.get('is_active', True):
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return build_user(data)
@@ -0,0 +1,32 @@
+"""
+로그인 인증 백엔드
+- ModelBackend와 같은 규칙(비활성 계정 거절 등)으로 인증하되, 비밀번호 검증/재해시는 해시 풀(accounts.hashing)에서 한다.
+- 로그인 뷰는 django.contrib.auth.authenticate()로 호출하므로 user_login_failed 신호와 다른 백엔드도 그대로 동작한다.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from .hashing import password_hasher
+
+User = get_user_model()
+
+
+class PooledPasswordBackend(ModelBackend):
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        user = User._default_manager.filter(**{User.USERNAME_FIELD: username}).first()
+        if user is None:
+            # 없는 계정도 해시 한 번만큼 시간을 써서 응답 시간으로 계정 존재 여부가 드러나지 않게 한다.
+            password_hasher.make_password(password)
+            return None
+
+        is_correct, new_password = password_hasher.verify(password, user.password)
+        if not is_correct or not self.user_can_authenticate(user):
+            return None
+        if new_password is not None:
+            # 해시 설정이 바뀐 경우 재해시 (그 사이 비밀번호가 바뀌었으면 덮어쓰지 않음)
+            User._default_manager.filter(pk=user.pk, password=user.password).update(password=new_password)
+            user.password = new_password
+        return user
@@ -0,0 +1,108 @@
+"""
+비밀번호 해시 오프로딩
+- PBKDF2 해시 계산/검증은 CPU만 쓰는 작업이라 요청 스레드에서 돌리면 로그인이 몰릴 때 워커가 막힌다.
+  프로세스 풀(GIL 밖)에서 실행하고, 요청 스레드는 결과만 기다린다.
+- 풀에 동시에 넣을 수 있는 작업 수(PASSWORD_HASH_MAX_PENDING)를 넘으면 기다리지 않고 503을 돌려준다.
+- 로그인 시 해시 설정(알고리즘/반복 횟수)이 바뀌었으면 같은 작업 안에서 새 해시를 만들어 돌려준다.
+- PASSWORD_HASH_WORKERS=0 이면 풀 없이 현재 스레드에서 계산 (개발/테스트용)
+"""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HasherBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '요청이 많아 처리하지 못했어요. 잠시 후 다시 시도해 주세요.'
+    default_code = 'hasher_busy'
+
+
+def _init_worker():
+    # spawn 방식으로 뜬 자식 프로세스는 설정이 비어 있으므로 초기화 (fork면 이미 준비되어 있음)
+    import django
+    django.setup()
+
+def _verify(password, encoded):
+    """(일치 여부, 새 해시 또는 None). 재해시도 같은 프로세스에서 끝낸다."""
+    is_correct, must_update = hashers.verify_password(password, encoded)
+    if is_correct and must_update:
+        return True, hashers.make_password(password)
+    return is_correct, None
+
+
+class PasswordHasherPool:
+    def __init__(self, workers: int, max_pending: int, timeout: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+
+    def _get_executor(self):
+        with self._lock:
+            # 풀 생성 후 fork된 경우(gunicorn --preload 등) 자식에서는 새로 만든다.
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+                self._pid = os.getpid()
+            return self._executor
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, func, *args):
+        """
+        (풀, future). 다른 스레드가 방금 닫은 풀(_reset)이면 submit이 RuntimeError를 내므로 새 풀에서 한 번 더 시도한다.
+        (BrokenProcessPool도 RuntimeError의 하위 클래스) 그래도 실패하면 (None, None)
+        """
+        for _ in range(2):
+            executor = self._get_executor()
+            try:
+                return executor, executor.submit(func, *args)
+            except RuntimeError:
+                self._reset(executor)
+        return None, None
+
+    def run(self, func, *args):
+        if self.workers == 0:
+            return func(*args)
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        executor, future = self._submit(func, *args)
+        if future is None:
+            self._slots.release()
+            raise HasherBusy()
+        # 대기 시간이 끝나도 작업은 풀에서 계속 도므로, 슬롯은 작업이 실제로 끝날 때 반납한다.
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise HasherBusy()
+        except BrokenProcessPool:
+            self._reset(executor)
+            raise HasherBusy()
+
+    def make_password(self, password) -> str:
+        return self.run(hashers.make_password, password)
+
+    def verify(self, password, encoded):
+        """(일치 여부, 새 해시 또는 None)"""
+        return self.run(_verify, password, encoded)
+
+
+_workers = getattr(settings, 'PASSWORD_HASH_WORKERS', os.cpu_count() or 1)
+
+password_hasher = PasswordHasherPool(
+    workers=_workers,
+    max_pending=getattr(settings, 'PASSWORD_HASH_MAX_PENDING', max(_workers, 1) * 4),
+    timeout=getattr(settings, 'PASSWORD_HASH_TIMEOUT', 5.0),
+)
@@ -0,0 +1,53 @@
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.test import Client
+from accounts.hashing import password_hasher
+from accounts.models import User
+
+
+class Command(BaseCommand):
+    help = "로그인 처리량(초당 요청 수, 코어당 초당 요청 수)을 측정합니다. 임시 계정을 만들고 끝나면 지웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=8, help="동시에 로그인하는 클라이언트 수")
+
+    def handle(self, *args, **options):
+        total = options["requests"]
+        email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+        password = uuid.uuid4().hex
+        user = User.objects.create_user(email=email, password=password, name="bench")
+
+        def login(_):
+            try:
+                response = Client().post(
+                    "/accounts/login",
+                    {"email": email, "password": password},
+                    content_type="application/json",
+                    SERVER_NAME="localhost",
+                )
+                return response.status_code
+            finally:
+                close_old_connections()
+
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+                codes = list(pool.map(login, range(total)))
+            elapsed = time.perf_counter() - started
+        finally:
+            user.delete()
+
+        cores = password_hasher.workers or 1
+        ok = codes.count(200)
+        busy = codes.count(503)
+        rps = ok / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f"{total} requests in {elapsed:.2f}s: {ok} ok, {busy} busy(503), {total - ok - busy} other\n"
+            f"{rps:.1f} logins/s, {rps / cores:.1f} logins/s per core "
+            f"(hash workers={password_hasher.workers}, cpu={os.cpu_count()})"
+        )
@@ -0,0 +1,90 @@
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client
+from django.utils import timezone
+from accounts.models import User
+from accounts.services import JWTService
+from supply.models import SupplyPost, SupplyJoin, Comment
+
+
+class Command(BaseCommand):
+    help = (
+        "내 공급글 + 신청자 목록(/accounts/my-receive-request) 측정: 글 N개(기본 1000)를 가진 작성자로 "
+        "정렬별 전체 페이지를 넘기며 페이지당 쿼리 수와 응답 시간을 잽니다. 임시 데이터는 롤백합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--posts", type=int, default=1000)
+        parser.add_argument("--joins-per-post", type=int, default=5)
+        parser.add_argument("--comments-per-post", type=int, default=2)
+        parser.add_argument("--page-size", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            author = self.seed(options["posts"], options["joins_per_post"], options["comments_per_post"])
+            token = JWTService().post(author)["access"]["token"]
+            client = Client(SERVER_NAME="localhost", HTTP_AUTHORIZATION=f"Bearer {token}")
+            self.stdout.write(
+                f"{options['posts']} posts x {options['joins_per_post']} applicants, "
+                f"{options['comments_per_post']} comments/post, page_size {options['page_size']}"
+            )
+            for query in ("", "order=newest", "order=comment", "order=enddate", "joins_limit=3"):
+                self.walk(client, query, options["page_size"], options["posts"])
+            transaction.set_rollback(True)
+
+    def seed(self, posts, joins_per_post, comments_per_post):
+        tag = uuid.uuid4().hex[:12]
+        author = User.objects.create_user(email=f"bench-receive-{tag}@example.com", password=None, name="bench")
+        applicants = [
+            User.objects.create_user(email=f"bench-receive-{tag}-{i}@example.com", password=None, name=f"신청자{i}")
+            for i in range(max(joins_per_post, comments_per_post))
+        ]
+        now = timezone.now()
+        supplies = SupplyPost.objects.bulk_create([
+            SupplyPost(
+                author=author, title=f"공급 {i}", content="내용", total_amount=10000, max_participants=joins_per_post + 1,
+                joined_count=joins_per_post, unit_amount=10000 // (joins_per_post + 1),
+                apply_deadline=now + timedelta(days=1 + i % 30), execute_time=now + timedelta(days=31),
+            )
+            for i in range(posts)
+        ])
+        SupplyJoin.objects.bulk_create([
+            SupplyJoin(supply=supply, user=user, content="참여합니다", unit_amount=supply.unit_amount)
+            for supply in supplies for user in applicants[:joins_per_post]
+        ], batch_size=2000)
+        Comment.objects.bulk_create([
+            Comment(post=supply, user=user, content="언제 나눠요?")
+            for supply in supplies for user in applicants[:comments_per_post]
+        ], batch_size=2000)
+        return author
+
+    def walk(self, client, query, page_size, posts):
+        queries = []
+
+        def count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        url = f"/accounts/my-receive-request?page_size={page_size}" + (f"&{query}" if query else "")
+        pages, rows, per_page_queries, timings = 0, 0, set(), []
+        while url:
+            queries.clear()
+            with connection.execute_wrapper(count):
+                started = time.perf_counter()
+                response = client.get(url)
+                timings.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.content
+            data = response.json()
+            pages += 1
+            rows += len(data["results"])
+            per_page_queries.add(len(queries))
+            url = data["next"]
+        self.stdout.write(
+            f"{query or 'default':14} {pages} pages, {rows}/{posts} rows, queries/page {sorted(per_page_queries)}, "
+            f"p50 {statistics.median(timings) * 1e3:.1f} ms, max {max(timings) * 1e3:.1f} ms, "
+            f"total {sum(timings) * 1e3:.0f} ms"
+        )
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from accounts.services import UserStatsService
+
+
+class Command(BaseCommand):
+    help = "사용자 활동 카운터(UserStats)를 실제 행 수로 일괄 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        done = UserStatsService.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(f"{done} users reconciled")
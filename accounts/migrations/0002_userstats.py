@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('supplies_count', models.PositiveIntegerField(default=0, help_text='작성한 공급글 수')),
+                ('supply_joins_count', models.PositiveIntegerField(default=0, help_text='공급글 신청 수')),
+                ('tasks_requested_count', models.PositiveIntegerField(default=0, help_text='작성한 요청글 수')),
+                ('tasks_helped_count', models.PositiveIntegerField(default=0, help_text='수락한 요청글 수')),
+            ],
+        ),
+    ]
@@ -41,3 +41,24 @@ class User(AbstractUser):
 
     def __str__(self):
         return self.email
+
+
+class UserStats(models.Model):
+    """
+    사용자 활동 카운터 (프로필 화면용)
+    - 글/신청/요청 행이 생기거나 지워질 때 F() 증감으로 갱신 (accounts.signals)
+    - 어긋나면 `manage.py reconcile_user_stats`로 다시 계산
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+    )
+    supplies_count = models.PositiveIntegerField(default=0, help_text='작성한 공급글 수')
+    supply_joins_count = models.PositiveIntegerField(default=0, help_text='공급글 신청 수')
+    tasks_requested_count = models.PositiveIntegerField(default=0, help_text='작성한 요청글 수')
+    tasks_helped_count = models.PositiveIntegerField(default=0, help_text='수락한 요청글 수')
+
+    def __str__(self):
+        return f'{self.user} stats'
@@ -1,5 +1,6 @@
-from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth import authenticate, get_user_model
 from rest_framework import serializers
+from .hashing import password_hasher
 
 User = get_user_model()
 
@@ -11,30 +12,20 @@ class UserSerializer(serializers.ModelSerializer):
         extra_kwargs = {'password': {'write_only': True}}
 
     def create(self, validated_data:dict):
-        password = validated_data.pop('password')
-        user = User.objects.create(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        # 해시를 먼저 계산해 INSERT 한 번으로 저장
+        validated_data['password'] = password_hasher.make_password(validated_data['password'])
+        return User.objects.create(**validated_data)
 
 class LoginSerializer(serializers.Serializer):
     email = serializers.EmailField()
     password = serializers.CharField(max_length=128, write_only=True)
 
     def validate(self, attrs):
-        email = attrs.get('email')
-        password = attrs.get('password')
-
-        user = authenticate(
-            request=self.context.get('request'),
-            username=email,
-            password=password,
-        )
-
-        if not user:
+        # 인증 백엔드(accounts.backends.PooledPasswordBackend)가 해시 풀에서 검증/재해시한다.
+        # 비활성 계정도 ModelBackend처럼 인증 실패로 처리한다.
+        user = authenticate(self.context.get('request'), email=attrs.get('email'), password=attrs.get('password'))
+        if user is None:
             raise serializers.ValidationError(detail='이메일 또는 비밀번호가 일치하지 않아요.')
-        if not user.is_active:
-            raise serializers.ValidationError(detail='비활성화된 계정이에요.')
 
         attrs['user'] = user
         return attrs
@@ -1,9 +1,14 @@
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.http import HttpRequest
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.settings import api_settings
 from utils.decorators import validate_data, validate_unique
-from utils.helpers import get_instance_or_404, format_timestamp_iso
+from utils.helpers import get_instance_or_404, format_timestamp_iso, subquery_count
+from .authentication import USER_TOKEN_CLAIMS
+from .models import UserStats
 from .serializers import UserSerializer
 
 User = get_user_model()
@@ -24,6 +29,9 @@ class UserService:
 class JWTService:
     def post(self, user):
         refresh_token = RefreshToken.for_user(user)
+        # 인증 시 사용자 테이블을 조회하지 않도록 기본 정보를 클레임에 싣는다. (accounts.authentication)
+        for claim in USER_TOKEN_CLAIMS:
+            refresh_token[claim] = getattr(user, claim)
         access_token = refresh_token.access_token
 
         return {
@@ -37,3 +45,90 @@ class JWTService:
                 'expire_at': format_timestamp_iso(refresh_token['exp']),
             },
         }
+
+class UserStatsService:
+    """
+    UserStats 카운터 갱신/재계산
+    - increment: 한 사용자 카운터를 F() 증감 (행이 없으면 실제 값으로 생성)
+    - increment_many: 여러 사용자 카운터를 같은 값만큼 F() 증감 (배치 처리용, 사용자 수와 무관한 쿼리 수)
+    - decrement: 삭제 신호용. 이미 있는 행만 F() 감소 (행이 없으면 아무것도 하지 않음)
+    - rebuild: 여러 사용자 카운터를 서브쿼리로 다시 계산해 bulk upsert
+    """
+    COUNTER_FIELDS = ('supplies_count', 'supply_joins_count', 'tasks_requested_count', 'tasks_helped_count')
+
+    @classmethod
+    def increment(cls, user_id, **deltas):
+        if user_id is None:
+            return
+        updated = UserStats.objects.filter(user_id=user_id).update(**{
+            field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()
+        })
+        if not updated:
+            # 카운터 행이 아직 없는 사용자: 방금 반영된 행까지 포함해 실제 값으로 생성
+            cls.rebuild(User.objects.filter(pk=user_id))
+
+    @classmethod
+    def increment_many(cls, user_ids, **deltas):
+        user_ids = set(user_ids) - {None}
+        if not user_ids:
+            return
+        existing = set(UserStats.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+        if existing:
+            UserStats.objects.filter(user_id__in=existing).update(**{
+                field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()
+            })
+        if user_ids - existing:
+            cls.rebuild(User.objects.filter(pk__in=user_ids - existing))
+
+    @classmethod
+    def decrement(cls, user_id, **deltas):
+        # 사용자 삭제의 연쇄 삭제 중에는 카운터 행이 먼저 지워져 있다. 다시 만들면(rebuild) 지워지는 사용자를 가리키게 된다.
+        if user_id is None:
+            return
+        UserStats.objects.filter(user_id=user_id).update(**{
+            field: Greatest(F(field) - delta, 0) for field, delta in deltas.items()
+        })
+
+    @classmethod
+    def get(cls, user) -> dict:
+        """프로필용 카운터 (PK 조회 1회)"""
+        stats = UserStats.objects.filter(user_id=user.pk).values(*cls.COUNTER_FIELDS).first()
+        if stats is None:
+            cls.rebuild(User.objects.filter(pk=user.pk))
+            stats = UserStats.objects.filter(user_id=user.pk).values(*cls.COUNTER_FIELDS).first()
+        return stats
+
+    @classmethod
+    def rebuild(cls, users=None, batch_size:int=1000) -> int:
+        from supply.models import SupplyPost, SupplyJoin
+        from Request.models import Task
+
+        users = (users if users is not None else User.objects.all()).order_by('pk')
+        done = 0
+        last_pk = None
+        while True:
+            batch = users if last_pk is None else users.filter(pk__gt=last_pk)
+            rows = list(
+                batch.annotate(
+                    supplies_count=subquery_count(SupplyPost.objects.all(), 'author'),
+                    supply_joins_count=subquery_count(SupplyJoin.objects.all(), 'user'),
+                    tasks_requested_count=subquery_count(Task.objects.all(), 'requester'),
+                    tasks_helped_count=subquery_count(Task.objects.all(), 'helper'),
+                ).values('pk', *cls.COUNTER_FIELDS)[:batch_size]
+            )
+            if not rows:
+                return done
+            try:
+                UserStats.objects.bulk_create(
+                    [UserStats(user_id=row['pk'], **{f: row[f] for f in cls.COUNTER_FIELDS}) for row in rows],
+                    update_conflicts=True,
+                    unique_fields=['user'],
+                    update_fields=list(cls.COUNTER_FIELDS),
+                )
+            except IntegrityError:
+                # 사용자가 그 사이 삭제된 경우: 이 배치는 건너뛰고 다음 재계산에서 맞춘다.
+                pass
+            done += len(rows)
+            last_pk = rows[-1]['pk']
+            if len(rows) < batch_size:
+                return done
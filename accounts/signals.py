@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from supply.models import SupplyPost, SupplyJoin
+from Request.models import Task
+from .authentication import cache_user, forget_user
+from .models import User, UserStats
+from .services import UserStatsService
+
+# 인증 사용자 캐시(accounts.authentication) 갱신 + 사용자 활동 카운터(UserStats) 갱신
+# QuerySet.update()/bulk_create()는 시그널이 없으므로 호출한 곳에서 직접 UserStatsService.increment를 호출한다.
+# 삭제 신호는 있는 행만 줄인다. (사용자 연쇄 삭제 중에 카운터 행을 다시 만들지 않도록)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_cached_user(sender, instance, **kwargs):
+    cache_user(instance)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def forget_cached_user(sender, instance, **kwargs):
+    forget_user(instance.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def create_user_stats(sender, instance, created, **kwargs):
+    if created:
+        UserStats.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=SupplyPost)
+def count_supply_created(sender, instance, created, **kwargs):
+    if created:
+        UserStatsService.increment(instance.author_id, supplies_count=1)
+
+
+def _deleting_user(origin, user_id) -> bool:
+    """사용자 삭제의 연쇄 삭제 중인지 (그 사용자의 카운터는 곧 함께 지워진다)"""
+    return isinstance(origin, User) and origin.pk == user_id
+
+
+@receiver(post_delete, sender=SupplyPost)
+def count_supply_deleted(sender, instance, origin=None, **kwargs):
+    if not _deleting_user(origin, instance.author_id):
+        UserStatsService.decrement(instance.author_id, supplies_count=1)
+
+
+@receiver(post_save, sender=SupplyJoin)
+def count_join_created(sender, instance, created, **kwargs):
+    if created:
+        UserStatsService.increment(instance.user_id, supply_joins_count=1)
+
+
+@receiver(post_delete, sender=SupplyJoin)
+def count_join_deleted(sender, instance, origin=None, **kwargs):
+    if not _deleting_user(origin, instance.user_id):
+        UserStatsService.decrement(instance.user_id, supply_joins_count=1)
+
+
+@receiver(post_save, sender=Task)
+def count_task_created(sender, instance, created, **kwargs):
+    if created:
+        UserStatsService.increment(instance.requester_id, tasks_requested_count=1)
+
+
+@receiver(post_delete, sender=Task)
+def count_task_deleted(sender, instance, origin=None, **kwargs):
+    if not _deleting_user(origin, instance.requester_id):
+        UserStatsService.decrement(instance.requester_id, tasks_requested_count=1)
+    if instance.helper_id and not _deleting_user(origin, instance.helper_id):
+        UserStatsService.decrement(instance.helper_id, tasks_helped_count=1)
@@ -1,3 +1,179 @@
-from django.test import TestCase
+import threading
+from datetime import timedelta
+from unittest import mock
+from django.contrib.auth import hashers
+from django.contrib.auth.signals import user_login_failed
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+from accounts.authentication import CachedJWTAuthentication, local_users
+from accounts.hashing import PasswordHasherPool, password_hasher
+from accounts.models import User, UserStats
+from accounts.services import JWTService, UserStatsService
+from Request.models import Task
+from supply.models import SupplyPost, SupplyJoin
+from supply.services import join_supply
+from utils.testing import QueryBudgetMixin
 
-# Create your tests here.
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="auth@example.com", password=None, name="auth")
+        self.auth = CachedJWTAuthentication()
+        self.token = self.auth.get_validated_token(JWTService().post(self.user)["access"]["token"])
+
+    def deactivate_elsewhere(self):
+        # 다른 워커에서 비활성화 (이 프로세스의 캐시에는 흔적이 없음)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        cache.clear()
+        local_users.pop(self.user.pk)
+
+    def test_cache_miss_checks_db(self):
+        self.deactivate_elsewhere()
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.get_user(self.token)
+
+    @override_settings(AUTH_TRUST_TOKEN_CLAIMS=True)
+    def test_trusted_claims_skip_db(self):
+        local_users.pop(self.user.pk)
+        with self.assertNumQueries(0):
+            user = self.auth.get_user(self.token)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_cached_user_skips_db(self):
+        self.auth.get_user(self.token)
+        local_users.pop(self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.auth.get_user(self.token).email, "auth@example.com")
+
+
+class MyRequestQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """my-receive-request / my-join-request가 글/참여 수와 무관하게 같은 쿼리 수로 끝나는지"""
+
+    def setUp(self):
+        self.author = User.objects.create_user(email="author@example.com", password=None, name="author")
+        self.joiner = User.objects.create_user(email="joiner@example.com", password=None, name="joiner")
+        self.api = APIClient()
+
+    def seed_posts(self, n):
+        # 작성자 글마다 joiner가 참여
+        now = timezone.now()
+        while SupplyPost.objects.count() < n:
+            post = SupplyPost.objects.create(
+                author=self.author, title="쌀 나눔", content="같이 사요", total_amount=10000, max_participants=2,
+                apply_deadline=now + timedelta(days=1), execute_time=now + timedelta(days=2),
+            )
+            join_supply(self.joiner, post.pk)
+
+    def get(self, user, url):
+        cache.clear()
+        self.api.force_authenticate(user)
+        response = self.api.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_my_receive_request(self):
+        self.assertConstantQueries(
+            budget=2, seed=self.seed_posts, call=lambda: self.get(self.author, "/accounts/my-receive-request"),
+        )
+
+    def test_my_join_request(self):
+        self.assertConstantQueries(
+            budget=1, seed=self.seed_posts, call=lambda: self.get(self.joiner, "/accounts/my-join-request"),
+        )
+
+
+class UserStatsSignalTests(TestCase):
+    """활동 카운터 증감 + 관련 행이 있는 사용자 삭제"""
+
+    def setUp(self):
+        self.author = User.objects.create_user(email="author@example.com", password=None, name="author")
+        self.joiner = User.objects.create_user(email="joiner@example.com", password=None, name="joiner")
+        now = timezone.now()
+        self.post = SupplyPost.objects.create(
+            author=self.author, title="쌀 나눔", content="같이 사요", total_amount=10000, max_participants=2,
+            apply_deadline=now + timedelta(days=1), execute_time=now + timedelta(days=2),
+        )
+        join_supply(self.joiner, self.post.pk)
+        self.task = Task.objects.create(requester=self.author, title="장보기", content="우유 사다 주세요")
+        Task.objects.filter(pk=self.task.pk).update(helper=self.joiner)
+
+    def stats(self, user):
+        return UserStats.objects.filter(user=user).values(*UserStatsService.COUNTER_FIELDS).first()
+
+    def test_counters_follow_creates_and_deletes(self):
+        self.assertEqual(self.stats(self.author)["supplies_count"], 1)
+        self.assertEqual(self.stats(self.author)["tasks_requested_count"], 1)
+        self.assertEqual(self.stats(self.joiner)["supply_joins_count"], 1)
+        SupplyJoin.objects.filter(user=self.joiner).delete()
+        self.post.delete()
+        self.assertEqual(self.stats(self.author)["supplies_count"], 0)
+        self.assertEqual(self.stats(self.joiner)["supply_joins_count"], 0)
+
+    def test_delete_user_with_posts_and_tasks(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author.delete()
+        self.assertFalse(User.objects.filter(pk=self.author.pk).exists())
+        self.assertFalse(UserStats.objects.filter(user_id=self.author.pk).exists())
+        # 연쇄 삭제된 신청/요청의 다른 사용자 카운터는 줄어든다.
+        self.assertEqual(self.stats(self.joiner)["supply_joins_count"], 0)
+        self.assertEqual(self.stats(self.joiner)["tasks_helped_count"], 0)
+
+    def test_delete_user_with_only_joins(self):
+        UserStats.objects.filter(user=self.joiner).update(tasks_helped_count=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.joiner.delete()
+        self.assertFalse(UserStats.objects.filter(user_id=self.joiner.pk).exists())
+        self.assertEqual(self.stats(self.author)["supplies_count"], 1)
+
+
+class LoginTests(TestCase):
+    """로그인은 authenticate()로 인증 백엔드(해시 풀)를 거친다."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="login@example.com", password="pw-1234!", name="login")
+        self.api = APIClient()
+
+    def login(self, password="pw-1234!"):
+        return self.api.post("/accounts/login", {"email": "login@example.com", "password": password}, format="json")
+
+    def test_login_rehashes_outdated_hash(self):
+        old = hashers.make_password("pw-1234!", hasher="pbkdf2_sha1")
+        User.objects.filter(pk=self.user.pk).update(password=old)
+        self.assertEqual(self.login().status_code, 200)
+        stored = User.objects.get(pk=self.user.pk).password
+        self.assertNotEqual(stored, old)
+        self.assertTrue(stored.startswith(f"{hashers.get_hasher().algorithm}$"))
+        self.assertTrue(hashers.check_password("pw-1234!", stored))
+
+    def test_failed_login_sends_signal(self):
+        failures = []
+        receiver = lambda sender, credentials, **kwargs: failures.append(credentials["email"])
+        user_login_failed.connect(receiver)
+        try:
+            self.assertEqual(self.login("wrong").status_code, 400)
+        finally:
+            user_login_failed.disconnect(receiver)
+        self.assertEqual(failures, ["login@example.com"])
+
+    def test_saturated_pool_returns_503(self):
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()  # 다른 요청이 슬롯을 모두 쓰고 있는 상태
+        with mock.patch.object(password_hasher, "workers", 1), mock.patch.object(password_hasher, "_slots", slots):
+            response = self.login()
+        self.assertEqual(response.status_code, 503)
+
+
+class PasswordHasherPoolTests(SimpleTestCase):
+    def test_submit_after_reset_uses_new_pool(self):
+        # 다른 스레드의 _reset으로 이미 닫힌 풀을 잡은 경우: 500 대신 새 풀에서 처리하고 슬롯도 돌려준다.
+        pool = PasswordHasherPool(workers=1, max_pending=1, timeout=5.0)
+        pool._get_executor().shutdown()
+        try:
+            self.assertEqual(pool.run(abs, -3), 3)
+            self.assertEqual(pool.run(abs, -4), 4)
+        finally:
+            pool._executor.shutdown()
@@ -1,31 +1,45 @@
 from django.http import HttpRequest
-from django.db.models import Count
+from django.db.models import Count, Prefetch
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from supply.models import SupplyPost
+from rest_framework.exceptions import ValidationError
+from supply.models import SupplyPost, SupplyJoin, Comment
 from supply.serializers import SupplyPostListSerializer, SupplyPostMySerializer
+from utils.pagination import KeysetPagination
+from utils.helpers import subquery_count
+from utils.throttling import IPSlidingWindow
 from .serializers import LoginSerializer
-from .services import UserService, JWTService
+from .services import UserService, JWTService, UserStatsService
 
 class Root(APIView):
+    throttle_classes = [IPSlidingWindow]
+    throttle_scope = 'signup'
+
     def get_permissions(self):
         if self.request.method == 'POST':
             return [AllowAny()]
         else:
             return [IsAuthenticated()]
 
+    def get_throttles(self):
+        # 회원가입(POST)만 IP 기준 제한
+        return super().get_throttles() if self.request.method == 'POST' else []
+
     def get(self, request:HttpRequest, format=None):
         user = request.user
+        stats = UserStatsService.get(user)
 
         return Response(
             status=status.HTTP_200_OK,
             data={
                 "name": user.name,
                 "email": user.email,
-                "receive_request_count": user.supplies.count(),
-                "join_request_count": user.supply_joins.count(),
+                "receive_request_count": stats['supplies_count'],
+                "join_request_count": stats['supply_joins_count'],
+                "task_request_count": stats['tasks_requested_count'],
+                "task_help_count": stats['tasks_helped_count'],
             },
         )
 
@@ -56,13 +70,31 @@ class Login(APIView):
         )
 
 class MyReceiveRequest(APIView):
+    cursor_ordering_fields = ['created_at', 'comment_count', 'apply_deadline']
+    max_joins_limit = 100
+
     def get(self, request:HttpRequest, format=None):
+        """
+        내가 올린 공급글 + 신청자 목록
+        쿼리 수 고정: 공급글(신청 수/댓글 수는 서브쿼리) 1회 + 신청자(사용자 JOIN) 1회
+        ?joins_limit=N: 글마다 신청자를 먼저 신청한 N명까지만 포함 (나머지는 /supply/<pk>/applicants/)
+        """
         order = request.query_params.get('order')
 
+        joins = SupplyJoin.objects.select_related('user').order_by('joined_at', 'id')
+        joins_limit = request.query_params.get('joins_limit')
+        if joins_limit is not None:
+            try:
+                joins = joins[:max(0, min(int(joins_limit), self.max_joins_limit))]
+            except ValueError:
+                raise ValidationError(detail={'joins_limit': '정수를 입력해 주세요.'})
+
         supplies = SupplyPost.objects.filter(
             author=request.user
         ).annotate(
-            join_member_count=Count('joins', distinct=True)
+            join_member_count=subquery_count(SupplyJoin.objects.all(), 'supply')
+        ).prefetch_related(
+            Prefetch('joins', queryset=joins, to_attr='prefetched_joins')
         )
 
         if order == 'newest':
@@ -72,20 +104,21 @@ class MyReceiveRequest(APIView):
         elif order == 'comment':
             supplies = (
                 supplies
-                .annotate(comment_count=Count('comment', distinct=True))
+                .annotate(comment_count=subquery_count(Comment.objects.all(), 'post'))
                 .order_by('-comment_count')
             )
         elif order == 'enddate':
-            supplies.order_by('apply_deadline')
+            supplies = supplies.order_by('apply_deadline')
 
-        serializer = SupplyPostMySerializer(supplies, many=True)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(supplies, request, view=self)
+        serializer = SupplyPostMySerializer(page, many=True)
 
-        return Response(
-            status=status.HTTP_200_OK,
-            data=serializer.data,
-        )
+        return paginator.get_paginated_response(serializer.data)
 
 class MyJoinRequest(APIView):
+    cursor_ordering_fields = ['created_at', 'comment_count']
+
     def get(self, request:HttpRequest, format=None):
         order = request.query_params.get('order')
 
@@ -102,9 +135,8 @@ class MyJoinRequest(APIView):
                 .order_by('-comment_count')
             )
         
-        serializer = SupplyPostListSerializer(supplies, many=True)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(supplies, request, view=self)
+        serializer = SupplyPostListSerializer(page, many=True)
 
-        return Response(
-            status=status.HTTP_200_OK,
-            data=serializer.data,
-        )
+        return paginator.get_paginated_response(serializer.data)
@@ -5,6 +5,9 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+The async views (utils.async_views) and the SSE stream (/supply/async/<pk>/stream/)
+need an ASGI server, e.g. ``uvicorn configs.asgi:application``.
 """
 
 import os
@@ -32,6 +32,8 @@ INSTALLED_APPS = [
     'supply',
     'accounts.apps.AccountsConfig',
     'Request',
+    'mediastore',
+    'idempotency',
 ]
 
 MIDDLEWARE = [
@@ -112,6 +114,24 @@ MEDIA_URL = '/media/'
 
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# 업로드 파일은 내용 해시로 저장해 중복을 한 번만 보관합니다. (mediastore)
+STORAGES = {
+    'default': {'BACKEND': 'mediastore.storage.ContentAddressedStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+# 참조가 0이 된 blob을 GC가 지우기 전까지 기다리는 시간(초)
+MEDIA_BLOB_GC_GRACE = 3600
+
+# media 전송 위임: 'nginx'(X-Accel-Redirect) / 'sendfile'(X-Sendfile) / ''(앱 서버에서 직접 전송)
+MEDIA_OFFLOAD = env('MEDIA_OFFLOAD', default='')
+
+# nginx internal location (MEDIA_OFFLOAD='nginx'일 때)
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+# blobs/ 밖(이전 방식) 파일의 캐시 시간(초)
+MEDIA_CACHE_MAX_AGE = 3600
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -149,15 +169,89 @@ CORS_ALLOW_CREDENTIALS = True
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ),
     'DEFAULT_FILTER_BACKENDS': [
         'rest_framework.filters.OrderingFilter', 
     ],
+    'DEFAULT_PAGINATION_CLASS': 'utils.pagination.KeysetPagination',
+    'PAGE_SIZE': 20,
+    # utils.throttling: '<throttle_scope>.<user|ip>' → '횟수/기간' (뷰마다 throttle_classes로 켠다)
+    'DEFAULT_THROTTLE_RATES': {
+        'join.user': '10/min',
+        'join.ip': '60/min',
+        'comment.user': '20/min',
+        'comment.ip': '120/min',
+        'signup.ip': '10/hour',
+    },
 }
 
 
+# Response cache (utils.cache)
+
+# 세대 카운터로 무효화되므로 TTL은 옛 세대 키를 치우는 용도입니다.
+RESPONSE_CACHE_TIMEOUT = 300
+
+
+# Auth user cache (accounts.authentication)
+
+AUTH_USER_LOCAL_CACHE_SIZE = 1024
+
+AUTH_USER_LOCAL_CACHE_TTL = 30
+
+# 공유 캐시 미스 때 토큰 클레임(is_active 등)으로 사용자를 만듭니다. (DB 조회 생략)
+# 모든 워커가 같은 캐시를 쓰고 비활성 표시가 밀려나지 않는 경우(eviction 없는 Redis 등)에만 켜세요.
+AUTH_TRUST_TOKEN_CLAIMS = env.bool('AUTH_TRUST_TOKEN_CLAIMS', default=False)
+
+
+# Password hashing pool (accounts.hashing)
+
+# 로그인(authenticate)의 비밀번호 검증도 해시 풀에서 합니다.
+AUTHENTICATION_BACKENDS = ['accounts.backends.PooledPasswordBackend']
+
+# 해시 계산용 프로세스 수 (0이면 요청 스레드에서 직접 계산)
+PASSWORD_HASH_WORKERS = env.int('PASSWORD_HASH_WORKERS', default=os.cpu_count() or 1)
+
+# 풀에 동시에 넣을 수 있는 작업 수. 넘으면 503
+PASSWORD_HASH_MAX_PENDING = PASSWORD_HASH_WORKERS * 4 or 1
+
+PASSWORD_HASH_TIMEOUT = 5.0
+
+
+# Image derivatives (utils.images)
+
+# 긴 변 기준 픽셀. 크기마다 webp/jpeg 파생본을 만듭니다.
+IMAGE_DERIVATIVE_SIZES = {'sm': 240, 'md': 640, 'lg': 1280}
+
+# 백그라운드 생성 스레드 수 (0이면 `manage.py build_image_derivatives`로만 생성)
+IMAGE_PIPELINE_WORKERS = env.int('IMAGE_PIPELINE_WORKERS', default=2)
+
+# 이 픽셀 수를 넘는 원본은 디코딩하지 않습니다.
+IMAGE_MAX_PIXELS = 50_000_000
+
+
+# Idempotency keys (idempotency)
+
+# 같은 Idempotency-Key의 응답을 돌려주는 기간(초)
+IDEMPOTENCY_KEY_TTL = 86400
+
+# 처리 중 선점이 풀리는 시간(초). 요청이 중간에 죽어도 이 뒤에는 다시 시도할 수 있습니다.
+IDEMPOTENCY_LOCK_TIMEOUT = 30
+
+
+# Live updates (utils.pubsub, supply.live)
+
+# 워커가 여럿이면 'utils.pubsub.CacheBackend' (공유 캐시 필요)
+PUBSUB_BACKEND = env.str('PUBSUB_BACKEND', default='utils.pubsub.LocalBackend')
+
+# CacheBackend가 발행 순번을 확인하는 주기(초)
+PUBSUB_POLL_INTERVAL = 0.5
+
+# SSE 연결이 조용할 때 heartbeat 주석을 보내는 주기(초)
+SSE_HEARTBEAT_SECONDS = 15
+
+
 # djangorestframework-simplejwt
 
 SIMPLE_JWT = {
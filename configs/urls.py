@@ -1,11 +1,13 @@
+import re
 from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
+from mediastore.views import serve_media
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('accounts/', include('accounts.urls')),
     path('request/', include('Request.urls')),
     path("supply/", include("supply.urls")),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    re_path(rf'^{re.escape(settings.MEDIA_URL.lstrip("/"))}(?P<path>.*)$', serve_media, name='media'),
+]
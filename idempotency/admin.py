@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import IdempotencyRecord
+
+
+@admin.register(IdempotencyRecord)
+class IdempotencyRecordAdmin(admin.ModelAdmin):
+    list_display = ('key', 'status_code', 'created_at', 'expires_at')
+    search_fields = ('key',)
+    readonly_fields = ('key', 'fingerprint', 'status_code', 'body', 'created_at', 'expires_at')
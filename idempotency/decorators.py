@@ -0,0 +1,69 @@
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from . import services
+
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+def replay(entry):
+    response = HttpResponse(entry['body'], status=entry['status_code'], content_type='application/json')
+    response[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def idempotent(handler):
+    """
+    DRF 뷰 핸들러(post/create/@action)용. Idempotency-Key 헤더가 있을 때만 동작한다.
+    인증/권한/요청 제한을 통과한 뒤에 실행된다.
+    """
+    @wraps(handler)
+    def wrapper(self, request, *args, **kwargs):
+        raw_key = request.headers.get(services.HEADER)
+        if not raw_key:
+            return handler(self, request, *args, **kwargs)
+        key = services.scoped_key(request, raw_key)
+        fingerprint = services.fingerprint(request)
+        entry = services.lookup(key, fingerprint)
+        if entry is not None:
+            return replay(entry)
+        with services.claim(key, fingerprint) as claimed:
+            # 조회와 선점 사이에 먼저 끝난 요청
+            entry = services.lookup(key, fingerprint)
+            if entry is not None:
+                return replay(entry)
+            if not claimed:
+                raise services.IdempotencyConflict()
+            response = handler(self, request, *args, **kwargs)
+            if services.storable(response.status_code):
+                body = JSONRenderer().render(response.data).decode()
+                services.record(key, fingerprint, response.status_code, body)
+            return response
+    return wrapper
+
+
+def aidempotent(handler):
+    """utils.async_views.AsyncAPIView 핸들러용 ((data, status) 반환). DB 접근은 스레드에서 실행한다."""
+    @wraps(handler)
+    async def wrapper(self, request, *args, **kwargs):
+        raw_key = request.headers.get(services.HEADER)
+        if not raw_key:
+            return await handler(self, request, *args, **kwargs)
+        key = services.scoped_key(request, raw_key)
+        fingerprint = services.fingerprint(request)
+        entry = await sync_to_async(services.lookup)(key, fingerprint)
+        if entry is not None:
+            return replay(entry)
+        async with services.aclaim(key, fingerprint) as claimed:
+            entry = await sync_to_async(services.lookup)(key, fingerprint)
+            if entry is not None:
+                return replay(entry)
+            if not claimed:
+                raise services.IdempotencyConflict()
+            data, status_code = await handler(self, request, *args, **kwargs)
+            if services.storable(status_code):
+                body = JSONRenderer().render(data).decode()
+                await sync_to_async(services.record)(key, fingerprint, status_code, body)
+            return data, status_code
+    return wrapper
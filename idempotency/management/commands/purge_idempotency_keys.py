@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from idempotency.services import purge_expired
+
+
+class Command(BaseCommand):
+    help = "만료된 Idempotency-Key 응답 기록을 배치로 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        done = purge_expired(batch_size=options["batch_size"])
+        self.stdout.write(f"{done} records deleted")
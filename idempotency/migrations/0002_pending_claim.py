@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('idempotency', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='idempotencyrecord',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class IdempotencyRecord(models.Model):
+    """
+    Idempotency-Key로 처리한 요청의 응답 (캐시가 비었을 때의 대체 저장소)
+    - key: sha256(요청자 | 메서드 | 경로 | Idempotency-Key)
+    - fingerprint: 요청 본문 해시. 같은 키로 다른 본문을 보내면 거절한다.
+    - status_code가 없으면 처리 중(선점) 행이다. 이때 expires_at은 선점이 풀리는 시각이다.
+    - expires_at이 지나면 무시되고 `manage.py purge_idempotency_keys`가 지운다.
+    """
+    key = models.CharField(max_length=64, unique=True)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    body = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f'{self.key} ({self.status_code or "pending"})'
@@ -0,0 +1,194 @@
+"""
+Idempotency-Key 저장소
+- 클라이언트가 재시도하면서 같은 Idempotency-Key 헤더를 보내면, 처음 요청의 응답(상태 코드 + JSON 본문)을
+  뷰를 다시 실행하지 않고 그대로 돌려준다. (Idempotent-Replayed: true)
+- 키는 요청자(사용자, 비로그인이면 IP) + 메서드 + 경로 범위로 구분한다.
+- 응답은 캐시에 저장하고 DB(IdempotencyRecord)에도 남긴다. 캐시에 없으면 DB에서 읽어 캐시를 다시 채운다.
+- 처리 중인 키는 DB 행(status_code 없음 = 처리 중)을 먼저 INSERT해 선점한다. unique(key)가 동시 요청 중 하나만 통과시키고
+  나머지는 409. cache.add는 같은 캐시를 쓰는 요청을 DB까지 가기 전에 거르는 빠른 경로일 뿐이다.
+  처리 중 행은 IDEMPOTENCY_LOCK_TIMEOUT 뒤 만료되어, 요청이 중간에 죽어도 다시 선점할 수 있다.
+- 같은 키에 다른 본문을 보내면 422
+- 5xx/409/429 응답과 예외(검증 오류 등)는 저장하지 않는다. (재시도하면 다시 실행)
+- 키는 IDEMPOTENCY_KEY_TTL(초) 동안 유효하다. 지난 DB 행은 `manage.py purge_idempotency_keys`가 지운다.
+"""
+import hashlib
+import json
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from datetime import timedelta
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import UploadedFile
+from django.db import DatabaseError, IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.throttling import BaseThrottle
+from .models import IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+NOT_STORED = {status.HTTP_409_CONFLICT, status.HTTP_429_TOO_MANY_REQUESTS}
+
+
+class IdempotencyConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = '같은 Idempotency-Key로 보낸 요청을 아직 처리하고 있어요. 잠시 후 다시 시도해 주세요.'
+    default_code = 'idempotency_in_progress'
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = '같은 Idempotency-Key를 다른 요청 내용에 다시 쓸 수 없어요.'
+    default_code = 'idempotency_key_reused'
+
+
+def key_ttl() -> int:
+    return getattr(settings, 'IDEMPOTENCY_KEY_TTL', 86400)
+
+def lock_timeout() -> int:
+    return getattr(settings, 'IDEMPOTENCY_LOCK_TIMEOUT', 30)
+
+
+def _response_key(key):
+    return f'idem:resp:{key}'
+
+def _lock_key(key):
+    return f'idem:lock:{key}'
+
+
+def scoped_key(request, raw_key: str) -> str:
+    if len(raw_key) > MAX_KEY_LENGTH:
+        raise ValidationError({HEADER: f'{MAX_KEY_LENGTH}자 이하여야 해요.'})
+    user = getattr(request, 'user', None)
+    subject = f'user:{user.pk}' if user is not None and user.is_authenticated else f'ip:{BaseThrottle().get_ident(request)}'
+    material = '|'.join([subject, request.method, request.path, raw_key])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _canonical(value):
+    if isinstance(value, UploadedFile):
+        # 업로드 파일은 내용 대신 이름/크기로 비교 (본문 전체를 다시 읽지 않음)
+        return f'file:{value.name}:{value.size}'
+    return str(value)
+
+def fingerprint(request) -> str:
+    data = request.data
+    if hasattr(data, 'lists'):
+        data = dict(data.lists())
+    payload = json.dumps(data, sort_keys=True, default=_canonical)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def lookup(key: str, request_fingerprint: str):
+    """저장된 응답 {'fingerprint', 'status_code', 'body'} 또는 None. 다른 본문이면 422"""
+    entry = cache.get(_response_key(key))
+    if entry is None:
+        row = (
+            IdempotencyRecord.objects.filter(key=key, status_code__isnull=False, expires_at__gt=timezone.now())
+            .values('fingerprint', 'status_code', 'body', 'expires_at').first()
+        )
+        if row is None:
+            return None
+        remaining = int((row.pop('expires_at') - timezone.now()).total_seconds())
+        entry = row
+        if remaining > 0:
+            cache.set(_response_key(key), entry, remaining)
+    if entry['fingerprint'] != request_fingerprint:
+        raise IdempotencyKeyReused()
+    return entry
+
+
+def acquire(key: str, request_fingerprint: str):
+    """
+    키 선점. 처리 중 행을 INSERT하고, 이미 있으면 만료된 행(처리 중/완료 모두)만 넘겨받는다.
+    다른 요청이 처리 중이면 409. 유효한 완료 행이 있으면 선점하지 않고 False (호출한 쪽이 lookup으로 재생)
+    """
+    lock = _lock_key(key)
+    if not cache.add(lock, 1, lock_timeout()):
+        raise IdempotencyConflict()
+    now = timezone.now()
+    pending = {'fingerprint': request_fingerprint, 'status_code': None, 'body': '', 'expires_at': now + timedelta(seconds=lock_timeout())}
+    try:
+        try:
+            with transaction.atomic():
+                IdempotencyRecord.objects.create(key=key, **pending)
+            return True
+        except IntegrityError:
+            pass
+        if IdempotencyRecord.objects.filter(key=key, expires_at__lte=now).update(**pending):
+            return True
+        if IdempotencyRecord.objects.filter(key=key, status_code__isnull=False, expires_at__gt=now).exists():
+            cache.delete(lock)
+            return False
+    except BaseException:
+        cache.delete(lock)
+        raise
+    cache.delete(lock)
+    raise IdempotencyConflict()
+
+
+def release(key: str):
+    """선점 해제. 응답을 저장하지 않았으면(예외, 저장하지 않는 상태 코드) 처리 중 행을 지워 다시 시도할 수 있게 한다."""
+    try:
+        IdempotencyRecord.objects.filter(key=key, status_code__isnull=True).delete()
+    finally:
+        cache.delete(_lock_key(key))
+
+
+@contextmanager
+def claim(key: str, request_fingerprint: str):
+    """키 선점 (처리 중 표시). 이미 처리 중이면 409. 선점했으면 True, 완료된 응답이 있으면 False"""
+    claimed = acquire(key, request_fingerprint)
+    try:
+        yield claimed
+    finally:
+        if claimed:
+            release(key)
+
+
+@asynccontextmanager
+async def aclaim(key: str, request_fingerprint: str):
+    """claim의 async 버전 (DB 접근은 스레드에서)"""
+    claimed = await sync_to_async(acquire)(key, request_fingerprint)
+    try:
+        yield claimed
+    finally:
+        if claimed:
+            await sync_to_async(release)(key)
+
+
+def storable(status_code: int) -> bool:
+    return status_code < 500 and status_code not in NOT_STORED
+
+
+def record(key: str, request_fingerprint: str, status_code: int, body: str):
+    ttl = key_ttl()
+    entry = {'fingerprint': request_fingerprint, 'status_code': status_code, 'body': body}
+    cache.set(_response_key(key), entry, ttl)
+    try:
+        IdempotencyRecord.objects.bulk_create(
+            [IdempotencyRecord(key=key, expires_at=timezone.now() + timedelta(seconds=ttl), **entry)],
+            update_conflicts=True,
+            unique_fields=['key'],
+            update_fields=['fingerprint', 'status_code', 'body', 'expires_at'],
+        )
+    except DatabaseError:
+        # 요청 자체는 이미 처리됨. 캐시에 남아 있는 동안은 재시도를 흡수한다.
+        logger.warning('idempotency record failed for %s', key, exc_info=True)
+
+
+def purge_expired(batch_size: int = 1000) -> int:
+    """만료된 DB 행을 pk 배치로 삭제. 삭제한 행 수 반환"""
+    done = 0
+    while True:
+        pks = list(
+            IdempotencyRecord.objects.filter(expires_at__lte=timezone.now())
+            .order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not pks:
+            return done
+        done += IdempotencyRecord.objects.filter(pk__in=pks).delete()[0]
@@ -0,0 +1,79 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User
+from supply.models import SupplyPost, SupplyJoin
+from .decorators import REPLAYED_HEADER
+from .models import IdempotencyRecord
+from . import services
+
+
+class ClaimTests(TestCase):
+    """처리 중 선점은 DB 행이 기준 (캐시는 빠른 경로)"""
+
+    def setUp(self):
+        cache.clear()
+
+    def other_worker(self):
+        # 캐시를 같이 쓰지 않는 다른 워커: 캐시 선점 흔적이 없다.
+        cache.clear()
+
+    def test_pending_row_blocks_other_workers(self):
+        with services.claim('k', 'fp') as claimed:
+            self.assertTrue(claimed)
+            self.other_worker()
+            with self.assertRaises(services.IdempotencyConflict):
+                with services.claim('k', 'fp'):
+                    pass
+        self.assertFalse(IdempotencyRecord.objects.filter(key='k').exists())  # 저장 안 했으면 다시 시도 가능
+
+    def test_recorded_response_is_kept(self):
+        with services.claim('k', 'fp'):
+            services.record('k', 'fp', 201, '{"id": 1}')
+        self.other_worker()
+        self.assertEqual(services.lookup('k', 'fp')['status_code'], 201)
+        with services.claim('k', 'fp') as claimed:
+            self.assertFalse(claimed)  # 완료된 응답은 재생 대상
+
+    def test_expired_pending_row_is_taken_over(self):
+        IdempotencyRecord.objects.create(
+            key='k', fingerprint='fp', status_code=None, body='', expires_at=timezone.now() - timedelta(seconds=1),
+        )
+        self.assertIsNone(services.lookup('k', 'fp'))
+        with services.claim('k', 'fp') as claimed:
+            self.assertTrue(claimed)
+
+    def test_failed_handler_releases_claim(self):
+        with self.assertRaises(RuntimeError):
+            with services.claim('k', 'fp'):
+                raise RuntimeError
+        with services.claim('k', 'fp') as claimed:
+            self.assertTrue(claimed)
+
+
+class IdempotentEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        author = User.objects.create_user(email='author@example.com', password=None, name='author')
+        self.joiner = User.objects.create_user(email='joiner@example.com', password=None, name='joiner')
+        now = timezone.now()
+        self.post = SupplyPost.objects.create(
+            author=author, title='쌀 나눔', content='같이 사요', total_amount=10000, max_participants=2,
+            apply_deadline=now + timedelta(days=1), execute_time=now + timedelta(days=2),
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(self.joiner)
+
+    def join(self):
+        return self.api.post(f'/supply/{self.post.pk}/join/', {}, format='json', HTTP_IDEMPOTENCY_KEY='retry-1')
+
+    def test_retry_is_replayed_from_db(self):
+        first = self.join()
+        self.assertEqual(first.status_code, 201)
+        cache.clear()  # 다른 워커
+        second = self.join()
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second[REPLAYED_HEADER], 'true')
+        self.assertEqual(SupplyJoin.objects.filter(supply=self.post).count(), 1)
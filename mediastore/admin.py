@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import MediaBlob
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):
+    list_display = ('name', 'size', 'refcount', 'updated_at')
+    search_fields = ('name',)
+    readonly_fields = ('name', 'size', 'refcount', 'created_at', 'updated_at')
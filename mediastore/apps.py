@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class MediastoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'mediastore'
+
+    def ready(self):
+        from supply.models import SupplyPost
+        from Request.models import Task
+        from .signals import track_files
+
+        # 업로드 파일 참조 수 추적 (교체/삭제 시 blob 참조 해제)
+        track_files(SupplyPost, 'image')
+        track_files(Task, 'photo')
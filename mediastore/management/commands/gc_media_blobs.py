@@ -0,0 +1,21 @@
+from datetime import timedelta
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from mediastore.services import collect_garbage, sweep_orphan_files
+
+
+class Command(BaseCommand):
+    help = (
+        "참조가 0인 채로 유예 시간이 지난 media blob을 배치로 삭제합니다. "
+        "행 없이 남은 blob 파일(롤백된 업로드 등)과 임시 파일도 유예 시간이 지나면 지웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--grace", type=int, default=None, help="유예 시간(초). 기본값 MEDIA_BLOB_GC_GRACE")
+
+    def handle(self, *args, **options):
+        grace = timedelta(seconds=options["grace"]) if options["grace"] is not None else None
+        done = collect_garbage(default_storage, batch_size=options["batch_size"], grace=grace)
+        orphans = sweep_orphan_files(default_storage, batch_size=options["batch_size"], grace=grace)
+        self.stdout.write(f"{done} blobs deleted, {orphans} orphan files deleted")
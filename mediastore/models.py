@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class MediaBlob(models.Model):
+    """
+    내용 주소(content-addressed) 파일 하나 = 행 하나
+    - name: 스토리지 내 경로 (blobs/<sha256 앞 2자리>/<다음 2자리>/<sha256><확장자>)
+    - refcount: 이 파일을 가리키는 참조 수 (업로드 시 +1, 교체/삭제 시 -1)
+    - 0이 된 뒤 유예 시간이 지나면 `manage.py gc_media_blobs`가 파일과 행을 지운다.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField(default=0)
+    refcount = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # GC 후보(참조 0) 조회용 부분 인덱스
+            models.Index(fields=['updated_at'], name='mediablob_unref_idx', condition=models.Q(refcount=0)),
+        ]
+
+    def __str__(self):
+        return f'{self.name} ({self.refcount})'
@@ -0,0 +1,141 @@
+import os
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from .models import MediaBlob
+
+
+def acquire(name, size=0):
+    """blob 참조 +1 (행이 없으면 생성)"""
+    now = timezone.now()
+    if MediaBlob.objects.filter(name=name).update(refcount=F('refcount') + 1, updated_at=now):
+        return
+    try:
+        with transaction.atomic():
+            MediaBlob.objects.create(name=name, size=size, refcount=1)
+    except IntegrityError:
+        MediaBlob.objects.filter(name=name).update(refcount=F('refcount') + 1, updated_at=now)
+
+
+def release(names):
+    """blob 참조 -1 (같은 이름이 여러 번 있으면 그만큼). 목록에 없는(이전 방식) 파일은 무시"""
+    now = timezone.now()
+    for count, group in _group_by_count(names).items():
+        MediaBlob.objects.filter(name__in=group).update(
+            refcount=Greatest(F('refcount') - count, 0), updated_at=now,
+        )
+
+
+def _group_by_count(names) -> dict:
+    grouped = {}
+    for name, count in Counter(n for n in names if n).items():
+        grouped.setdefault(count, []).append(name)
+    return grouped
+
+
+def _grace(grace):
+    if grace is None:
+        grace = timedelta(seconds=getattr(settings, 'MEDIA_BLOB_GC_GRACE', 3600))
+    return grace
+
+
+def collect_garbage(storage, batch_size: int = 500, grace=None) -> int:
+    """
+    참조가 0인 채로 grace 이상 지난 blob을 배치로 삭제. 삭제 건수 반환
+    업로드와 겹쳐도 안전하도록: 파일을 휴지통 이름으로 옮긴 뒤 refcount=0 조건부로 행을 지우고,
+    그 사이 참조가 생겨 행 삭제가 실패하면 파일을 되돌린다.
+    """
+    cutoff = timezone.now() - _grace(grace)
+    deleted = 0
+    last_pk = 0
+    while True:
+        batch = list(
+            MediaBlob.objects
+            .filter(refcount=0, updated_at__lt=cutoff, pk__gt=last_pk)
+            .order_by('pk')
+            .values_list('pk', 'name')[:batch_size]
+        )
+        if not batch:
+            return deleted
+        for pk, name in batch:
+            trash = storage.trash(name)
+            if MediaBlob.objects.filter(pk=pk, refcount=0).delete()[0]:
+                if trash is not None:
+                    os.remove(trash)
+                deleted += 1
+            elif trash is not None:
+                storage.restore(trash, name)
+        last_pk = batch[-1][0]
+
+
+def sweep_orphan_files(storage, batch_size: int = 500, grace=None) -> int:
+    """
+    MediaBlob 행이 없는 blob 파일과 남은 임시 파일(수정 시각이 grace 이전)을 지운다. 삭제 건수 반환
+    업로드는 파일을 먼저 두고 참조(행)를 요청 트랜잭션 안에서 잡으므로, 트랜잭션이 롤백되거나 프로세스가 죽으면
+    행 없는 파일이 남는다. (refcount 기반 collect_garbage는 이런 파일을 모른다)
+    업로드와 겹쳐도 안전하도록: 같은 내용을 다시 올리면 저장소가 파일 수정 시각을 갱신하고,
+    GC는 파일을 휴지통 이름으로 옮긴 뒤 행/수정 시각을 다시 확인해 그 사이 쓰인 파일이면 되돌린다.
+    """
+    cutoff = (timezone.now() - _grace(grace)).timestamp()
+    deleted = 0
+    for stale in _stale_files(storage.path(storage.tmp_dir), cutoff):
+        _remove(stale)
+        deleted += 1
+    batch = []
+    for path in _stale_files(storage.path(storage.blob_dir), cutoff):
+        batch.append(os.path.relpath(path, storage.path('')).replace(os.sep, '/'))
+        if len(batch) >= batch_size:
+            deleted += _sweep_orphan_batch(storage, batch, cutoff)
+            batch = []
+    if batch:
+        deleted += _sweep_orphan_batch(storage, batch, cutoff)
+    return deleted
+
+
+def _stale_files(root, cutoff):
+    for directory, _, files in os.walk(root):
+        for filename in files:
+            path = os.path.join(directory, filename)
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    yield path
+            except FileNotFoundError:
+                continue
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _sweep_orphan_batch(storage, names, cutoff) -> int:
+    known = set(MediaBlob.objects.filter(name__in=names).values_list('name', flat=True))
+    deleted = 0
+    for name in names:
+        if name in known:
+            continue
+        if '.trash-' in name:
+            # GC가 중간에 죽어 남은 휴지통 파일. (이름을 바꾸면 mtime은 그대로라 ctime으로 판단: 진행 중인 GC 것은 건드리지 않음)
+            path = storage.path(name)
+            try:
+                if os.stat(path).st_ctime < cutoff:
+                    os.remove(path)
+                    deleted += 1
+            except FileNotFoundError:
+                pass
+            continue
+        trash = storage.trash(name)
+        if trash is None:
+            continue
+        if os.stat(trash).st_mtime >= cutoff or MediaBlob.objects.filter(name=name).exists():
+            storage.restore(trash, name)  # 그 사이 같은 내용이 다시 올라옴
+        else:
+            os.remove(trash)
+            deleted += 1
+    return deleted
@@ -0,0 +1,40 @@
+from django.db.models.signals import post_init, post_save, post_delete
+
+# 모델 파일 필드의 blob 참조 추적
+# - 업로드 시 +1은 스토리지(save)에서, 교체/삭제 시 -1은 여기서 storage.delete()로 처리한다.
+# - QuerySet.update()로 파일 필드를 바꾸면 추적되지 않으므로 save()를 사용하세요.
+
+
+def track_files(model, *fields):
+    attr = '_tracked_files'
+
+    def remember(sender, instance, **kwargs):
+        # deferred 필드는 읽지 않는다. (추가 쿼리 방지)
+        instance.__dict__[attr] = {f: _name(instance.__dict__.get(f)) for f in fields if f in instance.__dict__}
+
+    def release_replaced(sender, instance, **kwargs):
+        known = instance.__dict__.get(attr, {})
+        for field in fields:
+            if field not in instance.__dict__:
+                continue
+            file = getattr(instance, field)
+            old = known.get(field)
+            if old and old != file.name:
+                file.storage.delete(old)
+        remember(sender, instance)
+
+    def release_deleted(sender, instance, **kwargs):
+        for field in fields:
+            if field in instance.__dict__:
+                file = getattr(instance, field)
+                if file:
+                    file.storage.delete(file.name)
+
+    uid = f'mediastore_{model._meta.label_lower}'
+    post_init.connect(remember, sender=model, weak=False, dispatch_uid=f'{uid}_init')
+    post_save.connect(release_replaced, sender=model, weak=False, dispatch_uid=f'{uid}_save')
+    post_delete.connect(release_deleted, sender=model, weak=False, dispatch_uid=f'{uid}_delete')
+
+
+def _name(value):
+    return getattr(value, 'name', value) or None
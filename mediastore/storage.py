@@ -0,0 +1,85 @@
+import hashlib
+import os
+import tempfile
+import uuid
+from django.core.files.storage import FileSystemStorage
+from . import services
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    업로드를 임시 파일로 흘려 쓰면서 SHA-256을 계산하고, 내용이 같은 파일은 한 번만 저장한다.
+    - save(): 이름은 내용 해시로 정해진다. (upload_to/원래 파일명은 확장자만 사용)
+    - delete(): 파일을 바로 지우지 않고 참조만 해제한다. 실제 삭제는 GC(mediastore.services.collect_garbage)
+    - 참조(행)는 요청 트랜잭션을 따르지만 파일은 아니다. 롤백으로 남은 행 없는 파일은
+      GC(mediastore.services.sweep_orphan_files)가 유예 시간 뒤 지운다.
+    이름이 내용으로 정해지므로 같은 이름의 파일은 바뀌지 않는다. (media 서빙에서 장기 캐시 가능)
+    """
+    chunk_size = 64 * 1024
+    blob_dir = 'blobs'
+    tmp_dir = 'tmp'
+
+    def get_available_name(self, name, max_length=None):
+        # 최종 이름은 _save에서 내용 해시로 정한다.
+        return name
+
+    def blob_name(self, digest, ext):
+        return f'{self.blob_dir}/{digest[:2]}/{digest[2:4]}/{digest}{ext}'
+
+    def _save(self, name, content):
+        ext = os.path.splitext(name)[1].lower()
+        tmp_root = self.path(self.tmp_dir)
+        os.makedirs(tmp_root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_root, suffix=ext)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks(self.chunk_size):
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            name = self.blob_name(digest.hexdigest(), ext)
+            # 참조를 먼저 잡아야 GC가 같은 blob을 지우는 도중이어도 되살린다. (collect_garbage 참고)
+            services.acquire(name, size)
+            path = self.path(name)
+            if self._touch(path):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(tmp_path, self.file_permissions_mode)
+                os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return name
+
+    @staticmethod
+    def _touch(path):
+        """이미 있는 blob이면 수정 시각을 갱신하고 True (행 없는 파일 GC가 유예 시간 동안 건드리지 않도록)"""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def delete(self, name):
+        services.release([name])
+
+    # GC용
+    def trash(self, name):
+        """파일을 휴지통 이름으로 옮기고 그 경로를 돌려준다. (없으면 None)"""
+        path = self.path(name)
+        trash = f'{path}.trash-{uuid.uuid4().hex}'
+        try:
+            os.rename(path, trash)
+        except FileNotFoundError:
+            return None
+        return trash
+
+    def restore(self, trash, name):
+        os.replace(trash, self.path(name))
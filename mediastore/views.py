@@ -0,0 +1,164 @@
+"""
+MEDIA_ROOT 파일 서빙 (django.conf.urls.static.static 대체, 운영용)
+- ETag/Last-Modified + If-None-Match/If-Modified-Since → 304
+- Range (단일 구간) → 206 / 416, If-Range 지원
+- blobs/ 아래 파일은 이름이 내용 해시라 바뀌지 않으므로 1년 immutable 캐시
+- MEDIA_OFFLOAD
+  'nginx'     : X-Accel-Redirect(MEDIA_ACCEL_PREFIX + 경로)로 넘기고 본문은 비운다. (Range/전송은 nginx가 처리)
+  'sendfile'  : X-Sendfile(절대 경로) (Apache mod_xsendfile, lighttpd)
+  ''(기본)    : 파일 객체를 FileResponse로 돌려준다. WSGI 서버의 wsgi.file_wrapper(gunicorn 등)가
+                fileno()와 현재 위치/Content-Length로 os.sendfile을 호출하므로 본문이 파이썬을 거치지 않는다.
+"""
+import mimetypes
+import os
+import re
+import stat
+from urllib.parse import quote
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotAllowed
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from .storage import ContentAddressedStorage
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+_BLOB_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+class _FileRange:
+    """
+    파일의 [start, start + length) 구간만 읽는 래퍼
+    fileno()를 그대로 노출해 wsgi.file_wrapper가 sendfile을 쓸 수 있게 하고,
+    tell/seek이 없어 FileResponse가 Content-Length를 덮어쓰지 않는다.
+    """
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def _blob_digest(path):
+    """blobs/ 아래 내용 주소 파일이면 해시, 아니면 None"""
+    digest = os.path.splitext(os.path.basename(path))[0]
+    if path.startswith(f'{ContentAddressedStorage.blob_dir}/') and _BLOB_RE.match(digest):
+        return digest
+    return None
+
+
+def _parse_range(header, size):
+    """(start, end) 또는 None(무시하고 전체 전송). 만족할 수 없으면 ValueError"""
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None  # 여러 구간 등은 지원하지 않으므로 전체 전송
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise ValueError
+    return start, end
+
+
+def _if_range_matches(request, etag, mtime):
+    value = request.META.get('HTTP_IF_RANGE')
+    if not value:
+        return True
+    if value.startswith('"') or value.startswith('W/'):
+        return value == etag
+    since = parse_http_date_safe(value)
+    return since is not None and int(mtime) <= since
+
+
+def serve_media(request, path):
+    if request.method not in ('GET', 'HEAD'):
+        return HttpResponseNotAllowed(['GET', 'HEAD'])
+    # 업로드 임시 파일/GC 휴지통은 노출하지 않는다.
+    if path.startswith(f'{ContentAddressedStorage.tmp_dir}/') or '.trash-' in path:
+        raise Http404
+    try:
+        fullpath = safe_join(settings.MEDIA_ROOT, path)
+        st = os.stat(fullpath)
+    except (SuspiciousFileOperation, OSError):
+        raise Http404
+    if not stat.S_ISREG(st.st_mode):
+        raise Http404
+
+    digest = _blob_digest(path)
+    etag = f'"{digest}"' if digest else f'"{int(st.st_mtime):x}-{st.st_size:x}"'
+    headers = {
+        'ETag': etag,
+        'Last-Modified': http_date(st.st_mtime),
+        'Cache-Control': IMMUTABLE_CACHE if digest else f'public, max-age={getattr(settings, "MEDIA_CACHE_MAX_AGE", 3600)}',
+        'Accept-Ranges': 'bytes',
+    }
+
+    response = get_conditional_response(request, etag=etag, last_modified=int(st.st_mtime))
+    if response is not None:
+        for key, value in headers.items():
+            response[key] = value
+        return response
+
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    offload = getattr(settings, 'MEDIA_OFFLOAD', '')
+    if offload == 'nginx':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = getattr(settings, 'MEDIA_ACCEL_PREFIX', '/protected-media/') + quote(path)
+    elif offload == 'sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = fullpath
+    else:
+        response = _file_response(request, fullpath, st, etag, content_type)
+    for key, value in headers.items():
+        response[key] = value
+    return response
+
+
+def _file_response(request, fullpath, st, etag, content_type):
+    size = st.st_size
+    byte_range = None
+    range_header = request.META.get('HTTP_RANGE')
+    if range_header and _if_range_matches(request, etag, st.st_mtime):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    start, end = byte_range or (0, size - 1)
+    length = max(end - start + 1, 0)
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type, status=206 if byte_range else 200)
+    else:
+        file = open(fullpath, 'rb')
+        if byte_range:
+            response = FileResponse(_FileRange(file, start, length), status=206, content_type=content_type)
+        else:
+            response = FileResponse(file, content_type=content_type)
+    response['Content-Length'] = length
+    if byte_range:
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
@@ -0,0 +1,260 @@
+"""
+참여 대기열 (flash-crowd 대응)
+- 요청 스레드는 DB 트랜잭션 없이 캐시에 참여 의사만 적재하고 티켓을 돌려준다.
+- 캐시 좌석 카운터로 정원이 찬 뒤의 요청은 큐에 넣지 않고 즉시 거절한다.
+- 워커(drain_admissions 커맨드)가 공급글별로 큐를 비우며 bulk_create로 한 번에 커밋한다.
+  적재 뒤에 글이 마감/정원 도달(동기 /join, 수명주기 스윕)/삭제되어도 남은 항목은 drain 때 REJECTED로 정리한다.
+캐시 키
+  admission:{supply}:seats      남은 좌석(캐시 선차감용)
+  admission:{supply}:head/tail  큐 범위(head 이상, tail 이하가 미처리)
+  admission:{supply}:item:{seq} 큐 항목
+  admission:{supply}:gap:{seq}  drain이 빈 항목을 처음 본 시각
+순번은 tail을 incr해 받은 뒤 항목을 쓰므로, drain은 tail 안쪽인데 아직 없는 항목에서 멈춘다.
+ITEM_WRITE_GRACE초가 지나도 없으면(적재 중 프로세스가 죽은 경우 등) 그 순번은 건너뛴다.
+  admission:ticket:{ticket}     처리 결과
+"""
+import time
+import uuid
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q, Case, When, Value
+from django.utils import timezone
+from utils.cache import bump
+from accounts.services import UserStatsService
+from .models import SupplyPost, SupplyJoin
+from .live import publish_states
+
+ADMISSION_TTL = 60 * 60
+ITEM_WRITE_GRACE = 5
+
+class TicketStatus:
+    QUEUED = "QUEUED"
+    JOINED = "JOINED"
+    REJECTED = "REJECTED"
+
+
+def _key(supply_id, name):
+    return f"admission:{supply_id}:{name}"
+
+def _ticket_key(ticket):
+    return f"admission:ticket:{ticket}"
+
+def _set_ticket(ticket, status, detail="", join_id=None):
+    cache.set(
+        _ticket_key(ticket),
+        {"ticket": ticket, "status": status, "detail": detail, "join_id": join_id},
+        ADMISSION_TTL,
+    )
+
+
+def _reserve_seat(supply_id) -> bool:
+    """캐시 좌석 카운터를 1 차감. 카운터가 없으면 DB 값으로 초기화한다."""
+    key = _key(supply_id, "seats")
+    if cache.get(key) is None:
+        supply = SupplyPost.objects.only("status", "apply_deadline", "joined_count", "max_participants") \
+            .get(id=supply_id)
+        remaining = 0
+        if supply.status == SupplyPost.Status.OPEN and supply.apply_deadline > timezone.now():
+            remaining = supply.max_participants - supply.joined_count
+        cache.add(key, remaining, ADMISSION_TTL)
+    try:
+        left = cache.decr(key)
+    except ValueError:
+        # 그 사이 만료된 경우: 다음 요청에서 다시 초기화
+        return False
+    if left < 0:
+        cache.incr(key)
+        return False
+    return True
+
+def _release_seats(supply_id, count):
+    if count <= 0:
+        return
+    try:
+        cache.incr(_key(supply_id, "seats"), count)
+    except ValueError:
+        pass
+
+
+def return_seat(supply_id):
+    """취소/삭제로 DB 좌석이 돌아왔을 때 캐시 카운터에도 한 자리 돌려준다."""
+    _release_seats(supply_id, 1)
+
+
+def enqueue_join(user, supply_id, request_note: str = "") -> dict:
+    """
+    참여 의사를 큐에 적재하고 티켓을 반환한다.
+    남은 좌석이 없으면 큐에 넣지 않고 REJECTED 티켓을 바로 돌려준다.
+    """
+    ticket = uuid.uuid4().hex
+    if not _reserve_seat(supply_id):
+        _set_ticket(ticket, TicketStatus.REJECTED, "모집이 종료되었습니다.")
+        return get_ticket(ticket)
+
+    cache.add(_key(supply_id, "tail"), 0, ADMISSION_TTL)
+    cache.add(_key(supply_id, "head"), 1, ADMISSION_TTL)
+    seq = cache.incr(_key(supply_id, "tail"))
+    cache.set(
+        _key(supply_id, f"item:{seq}"),
+        {"ticket": ticket, "user_id": user.pk, "content": request_note},
+        ADMISSION_TTL,
+    )
+    _set_ticket(ticket, TicketStatus.QUEUED)
+    return get_ticket(ticket)
+
+def get_ticket(ticket) -> dict | None:
+    return cache.get(_ticket_key(ticket))
+
+
+def _claim_seats(supply_id, count, now) -> int:
+    """조건부 UPDATE로 최대 count개 좌석을 한 번에 선점. 실제 선점한 수를 반환."""
+    while count > 0:
+        updated = SupplyPost.objects.filter(
+            id=supply_id,
+            status=SupplyPost.Status.OPEN,
+            apply_deadline__gt=now,
+            joined_count__lte=F("max_participants") - count,
+        ).update(
+            joined_count=F("joined_count") + count,
+            updated_at=now,
+            status=Case(
+                When(joined_count__gte=F("max_participants") - count, then=Value(SupplyPost.Status.FILLED)),
+                default=Value(SupplyPost.Status.OPEN),
+            ),
+        )
+        if updated:
+            return count
+        supply = SupplyPost.objects.only("status", "apply_deadline", "joined_count", "max_participants") \
+            .get(id=supply_id)
+        if supply.status != SupplyPost.Status.OPEN or supply.apply_deadline <= now:
+            return 0
+        count = min(count, supply.max_participants - supply.joined_count)
+    return 0
+
+
+def _ready_items(supply_id, head, end):
+    """
+    head..end 중 앞에서부터 이어진 항목들과 그 마지막 순번을 돌려준다.
+    빈 순번은 ITEM_WRITE_GRACE초가 지났으면 건너뛰고, 아니면 그 앞에서 멈춘다.
+    """
+    found = cache.get_many([_key(supply_id, f"item:{seq}") for seq in range(head, end + 1)])
+    items, skipped = [], 0
+    for seq in range(head, end + 1):
+        item = found.get(_key(supply_id, f"item:{seq}"))
+        if item is not None:
+            items.append(item)
+            continue
+        gap_key = _key(supply_id, f"gap:{seq}")
+        now = time.time()
+        cache.add(gap_key, now, ADMISSION_TTL)
+        if now - cache.get(gap_key, now) < ITEM_WRITE_GRACE:
+            end = seq - 1
+            break
+        skipped += 1
+    # 끝내 쓰이지 않은 항목이 잡아 둔 캐시 좌석은 돌려준다.
+    _release_seats(supply_id, skipped)
+    return end, items
+
+
+def drain_supply(supply_id, batch_size: int = 500) -> int:
+    """
+    공급글 하나의 큐를 batch_size 단위로 비운다.
+    배치마다 (기존 신청 조회 1회 + 좌석 선점 UPDATE 1회 + bulk_create 1회 + 카운터 갱신)로 처리.
+    처리한 항목 수를 반환한다.
+    """
+    head_key, tail_key = _key(supply_id, "head"), _key(supply_id, "tail")
+    processed = 0
+    while True:
+        head = cache.get(head_key) or 1
+        tail = cache.get(tail_key) or 0
+        if head > tail:
+            return processed
+        end, items = _ready_items(supply_id, head, min(tail, head + batch_size - 1))
+        if end < head:
+            return processed  # 맨 앞 항목이 아직 쓰이는 중: 다음 주기에 다시 본다.
+        item_keys = [_key(supply_id, f"{kind}:{seq}") for seq in range(head, end + 1) for kind in ("item", "gap")]
+
+        supply = SupplyPost.objects.only("unit_amount", "status").filter(id=supply_id).first()
+        if supply is None:
+            # 적재 뒤 삭제된 글: 남은 항목은 모두 거절
+            for item in items:
+                _set_ticket(item["ticket"], TicketStatus.REJECTED, "글이 존재하지 않아요.")
+            cache.delete_many(item_keys)
+            cache.set(head_key, end + 1, ADMISSION_TTL)
+            processed += len(items)
+            continue
+        existing = dict(
+            SupplyJoin.objects
+            .filter(supply_id=supply_id, user_id__in=[item["user_id"] for item in items])
+            .values_list("user_id", "id")
+        )
+        fresh, seen = [], set(existing)
+        for item in items:
+            if item["user_id"] in existing:
+                _set_ticket(item["ticket"], TicketStatus.JOINED, join_id=existing[item["user_id"]])
+            elif item["user_id"] in seen:
+                _set_ticket(item["ticket"], TicketStatus.REJECTED, "이미 신청한 공급글입니다.")
+            else:
+                seen.add(item["user_id"])
+                fresh.append(item)
+        _release_seats(supply_id, len(items) - len(fresh))
+
+        with transaction.atomic():
+            claimed = _claim_seats(supply_id, len(fresh), timezone.now())
+            accepted, overflow = fresh[:claimed], fresh[claimed:]
+            joins = SupplyJoin.objects.bulk_create([
+                SupplyJoin(
+                    supply_id=supply_id,
+                    user_id=item["user_id"],
+                    unit_amount=supply.unit_amount,
+                    content=item["content"],
+                )
+                for item in accepted
+            ])
+        if claimed:
+            bump("supply:list", f"supply:{supply_id}")
+            publish_states(supply_id)
+            UserStatsService.increment_many([item["user_id"] for item in accepted], supply_joins_count=1)
+        for item, join in zip(accepted, joins):
+            _set_ticket(item["ticket"], TicketStatus.JOINED, join_id=join.pk)
+        if overflow:
+            filled = SupplyPost.objects.filter(id=supply_id, status=SupplyPost.Status.FILLED).exists()
+            detail = "정원이 이미 찼습니다." if filled else "모집이 종료되었습니다."
+        for item in overflow:
+            _set_ticket(item["ticket"], TicketStatus.REJECTED, detail)
+        if overflow:
+            # DB 기준으로 더 받을 수 없으므로 캐시 카운터도 닫는다.
+            cache.set(_key(supply_id, "seats"), 0, ADMISSION_TTL)
+
+        cache.delete_many(item_keys)
+        cache.set(head_key, end + 1, ADMISSION_TTL)
+        processed += len(items)
+
+
+def candidate_supply_ids() -> list:
+    """
+    큐가 남아 있을 수 있는 공급글 id
+    OPEN 글 + 최근 상태가 바뀐 글(FILLED/EXPIRED 등으로 전환되며 updated_at이 갱신됨).
+    큐 항목과 좌석 카운터는 ADMISSION_TTL 뒤 사라지므로, 전환 뒤 2×TTL이 지난 글에는 남은 항목이 없다.
+    """
+    recent = timezone.now() - timedelta(seconds=ADMISSION_TTL * 2)
+    return list(
+        SupplyPost.objects.filter(Q(status=SupplyPost.Status.OPEN) | Q(updated_at__gte=recent))
+        .values_list("id", flat=True)
+    )
+
+
+def pending_supply_ids(supply_ids) -> list:
+    """큐에 미처리 항목이 남아 있는 공급글 id 목록"""
+    keys = {}
+    for supply_id in supply_ids:
+        keys[_key(supply_id, "head")] = supply_id
+        keys[_key(supply_id, "tail")] = supply_id
+    values = cache.get_many(list(keys))
+    pending = []
+    for supply_id in supply_ids:
+        tail = values.get(_key(supply_id, "tail"))
+        if tail is not None and tail >= values.get(_key(supply_id, "head"), 1):
+            pending.append(supply_id)
+    return pending
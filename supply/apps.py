@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class SupplyConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'supply'
+
+    def ready(self):
+        from django.db.models.signals import pre_save, post_save, post_delete
+        from .models import SupplyPost
+        from .search import supply_search
+        from .images import supply_images
+        from . import signals  # noqa: F401  (응답 캐시 무효화)
+
+        pre_save.connect(supply_search.pre_save, sender=SupplyPost, dispatch_uid='supply_search_pre_save')
+        post_save.connect(supply_search.post_save, sender=SupplyPost, dispatch_uid='supply_search_post_save')
+        post_save.connect(supply_images.post_save, sender=SupplyPost, dispatch_uid='supply_images_post_save')
+        post_delete.connect(supply_images.post_delete, sender=SupplyPost, dispatch_uid='supply_images_post_delete')
+
@@ -0,0 +1,98 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from utils.async_views import AsyncAPIView
+from utils.pagination import KeysetPagination
+from utils.throttling import UserTokenBucket, IPTokenBucket
+from idempotency.decorators import aidempotent
+from .models import SupplyPost
+from .serializers import SupplyPostDetailSerializer, SupplyJoinSerializer, supply_list_renderer
+from .services import join_supply
+from .live import state_events
+from .views import SupplyPostViewSet, supply_list_fields, supply_detail_fields
+
+# SupplyPostViewSet의 async 버전 (ASGI에서 /supply/async/... 로 제공)
+# 필터/검색/정렬/페이지네이션 설정은 SupplyPostViewSet과 공유한다.
+
+
+class SupplyListAsync(AsyncAPIView):
+    filter_backends = SupplyPostViewSet.filter_backends
+    filterset_fields = SupplyPostViewSet.filterset_fields
+    search_index = SupplyPostViewSet.search_index
+    ordering_fields = SupplyPostViewSet.ordering_fields
+    cursor_ordering_fields = SupplyPostViewSet.cursor_ordering_fields
+    ordering = SupplyPostViewSet.ordering
+
+    async def get(self, request, format=None):
+        fields = supply_list_fields.select(request)
+        paginator = KeysetPagination()
+        queryset = supply_list_renderer.values(
+            self.filter_queryset(SupplyPost.objects.all()), fields, [paginator.default_ordering],
+        )
+        page = await paginator.apaginate_queryset(queryset, request, view=self)
+        return {"next": paginator.get_next_link(), "results": supply_list_renderer.render(page, request, fields)}, status.HTTP_200_OK
+
+
+class SupplyDetailAsync(AsyncAPIView):
+    async def get(self, request, pk, format=None):
+        fields = supply_detail_fields.select(request)
+        queryset = supply_detail_fields.queryset(SupplyPost.objects.select_related("author", "request"), fields)
+        try:
+            supply = await queryset.aget(pk=pk)
+        except SupplyPost.DoesNotExist:
+            raise NotFound("글이 존재하지 않아요.")
+        serializer = supply_detail_fields.apply(SupplyPostDetailSerializer(supply, context={"request": request}), fields)
+        return serializer.data, status.HTTP_200_OK
+
+
+class SupplyQuoteAsync(AsyncAPIView):
+    async def get(self, request, pk, format=None):
+        unit_amount = await SupplyPost.objects.filter(pk=pk).values_list("unit_amount", flat=True).afirst()
+        if unit_amount is None:
+            raise NotFound("글이 존재하지 않아요.")
+        return {"unit_amount_preview": int(unit_amount)}, status.HTTP_200_OK
+
+
+class SupplyJoinAsync(AsyncAPIView):
+    throttle_classes = [UserTokenBucket, IPTokenBucket]
+    throttle_scope = "join"
+
+    @aidempotent
+    async def post(self, request, pk, format=None):
+        """선착순 참여 생성. 트랜잭션은 async ORM이 지원하지 않아 join_supply를 스레드에서 실행한다."""
+        note = request.data.get("request_note", "")
+        try:
+            join = await sync_to_async(join_supply)(request.user, pk, note)
+        except SupplyPost.DoesNotExist:
+            raise NotFound("글이 존재하지 않아요.")
+        except ValueError as e:
+            return {"detail": str(e)}, status.HTTP_400_BAD_REQUEST
+        return SupplyJoinSerializer(join).data, status.HTTP_201_CREATED
+
+
+class SupplyStreamAsync(AsyncAPIView):
+    """
+    참여 인원/상태 실시간 알림 (Server-Sent Events, ASGI 전용)
+    event: supply   data: {"id", "joined_count", "status"}  연결 직후 현재 값, 이후 바뀔 때마다
+    event: deleted  data: {"id", "deleted": true}
+    조용할 때는 SSE_HEARTBEAT_SECONDS마다 주석 줄(": heartbeat")을 보낸다. (프록시 유휴 타임아웃 방지)
+    종료 상태(EXECUTED/CANCELED/EXPIRED)가 되면 마지막 이벤트 뒤에 닫는다.
+    인증은 다른 API와 같은 Authorization 헤더 (헤더를 보낼 수 있는 fetch 기반 EventSource 사용)
+    """
+
+    async def get(self, request, pk, format=None):
+        if not isinstance(request._request, ASGIRequest):
+            # WSGI에서는 스트림이 끝날 때까지 워커 스레드를 붙잡는다.
+            return {"detail": "ASGI 서버(configs.asgi)에서만 제공합니다."}, status.HTTP_501_NOT_IMPLEMENTED
+        if not await SupplyPost.objects.filter(pk=pk).aexists():
+            raise NotFound("글이 존재하지 않아요.")
+        response = StreamingHttpResponse(
+            state_events(pk, getattr(settings, "SSE_HEARTBEAT_SECONDS", 15)),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # nginx 버퍼링 끄기
+        return response
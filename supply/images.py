@@ -0,0 +1,8 @@
+from utils.images import ImageDerivatives
+from .models import SupplyPost
+
+supply_images = ImageDerivatives(
+    SupplyPost, "image", "image_variants",
+    namespaces=lambda pk: ["supply:list", f"supply:{pk}"],
+    touch="updated_at",
+)
@@ -0,0 +1,107 @@
+"""
+공급글 상태 수명주기
+- OPEN   + apply_deadline 경과 → EXPIRED
+- FILLED + execute_time  경과 → EXECUTED
+인덱스((status, apply_deadline), (status, execute_time))를 타는 id 배치를 고른 뒤
+set-based UPDATE로 전환한다. 행 단위 save()는 쓰지 않는다.
+실행은 별도 프로세스 하나에서만: `manage.py sweep_supply_lifecycle --watch`
+(웹 프로세스마다 타이머를 띄우면 migrate/관리 명령/gunicorn 워커마다 같은 sweep이 겹쳐 돈다)
+"""
+import logging
+import threading
+from django.db import close_old_connections
+from django.db.models import Min
+from django.utils import timezone
+from utils.cache import bump
+from .live import publish_states
+from .models import SupplyPost
+
+logger = logging.getLogger(__name__)
+
+# (현재 상태, 기준 시각 필드, 전환 상태)
+TRANSITIONS = (
+    (SupplyPost.Status.OPEN, "apply_deadline", SupplyPost.Status.EXPIRED),
+    (SupplyPost.Status.FILLED, "execute_time", SupplyPost.Status.EXECUTED),
+)
+
+
+def _sweep_transition(from_status, field, to_status, now, batch_size) -> int:
+    moved = 0
+    while True:
+        ids = list(
+            SupplyPost.objects
+            .filter(status=from_status, **{f"{field}__lte": now})
+            .order_by(field)
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return moved
+        # 배치 선택과 UPDATE 사이에 상태가 바뀐 글은 조건에서 걸러진다.
+        moved += SupplyPost.objects.filter(id__in=ids, status=from_status).update(status=to_status, updated_at=now)
+        publish_states(*ids)
+        if len(ids) < batch_size:
+            return moved
+
+
+def sweep_due(now=None, batch_size: int = 5000) -> dict:
+    """기한이 지난 공급글을 일괄 전환. {전환 상태: 건수} 반환"""
+    now = now or timezone.now()
+    moved = {
+        to_status: _sweep_transition(from_status, field, to_status, now, batch_size)
+        for from_status, field, to_status in TRANSITIONS
+    }
+    if any(moved.values()):
+        # 일괄 전환은 건별 bump 대신 전체 세대를 올린다.
+        bump("supply")
+    return moved
+
+
+def next_due_at():
+    """다음으로 전환이 필요한 시각(없으면 None)"""
+    candidates = []
+    for from_status, field, _ in TRANSITIONS:
+        value = SupplyPost.objects.filter(status=from_status).aggregate(due=Min(field))["due"]
+        if value is not None:
+            candidates.append(value)
+    return min(candidates) if candidates else None
+
+
+class LifecycleScheduler:
+    """
+    다음 기한까지 잠들었다가 깨어나 sweep_due를 실행하는 타이머.
+    max_wait: 그 사이 생긴 더 이른 기한(새 글, 관리자 수정 등)을 놓치지 않도록 잠드는 최대 시간(초)
+    """
+    def __init__(self, batch_size: int = 5000, max_wait: float = 60.0):
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._due = None
+
+    def run_once(self) -> dict:
+        moved = sweep_due(batch_size=self.batch_size)
+        self._due = next_due_at()
+        return moved
+
+    def _seconds_until_due(self) -> float:
+        if self._due is None:
+            return self.max_wait
+        delta = (self._due - timezone.now()).total_seconds()
+        return min(max(delta, 0.0), self.max_wait)
+
+    def run_forever(self, on_sweep=None):
+        while not self._stop.is_set():
+            try:
+                moved = self.run_once()
+                if on_sweep and any(moved.values()):
+                    on_sweep(moved)
+            except Exception:
+                logger.exception("supply lifecycle sweep failed")
+            finally:
+                close_old_connections()
+            self._wake.wait(self._seconds_until_due())
+            self._wake.clear()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
@@ -0,0 +1,64 @@
+"""
+공급글 참여 인원/상태 실시간 알림 (utils.pubsub 채널 supply:<pk>)
+- publish_states: joined_count/status가 바뀔 수 있는 곳에서 호출한다. 커밋 뒤에 현재 값을 읽어 보낸다.
+  구독자가 없으면(CacheBackend는 다른 프로세스 포함) 조회하지 않는다.
+- state_events: SSE 본문. 구독 → 현재 값 → 바뀔 때마다 이벤트, 조용하면 heartbeat 주석.
+  현재 값을 읽은 뒤에는 DB 연결을 닫는다. (유휴 연결 수천 개가 DB 연결을 하나씩 붙잡지 않도록)
+  종료 상태가 되거나 글이 삭제되면 마지막 이벤트를 보내고 끝낸다.
+"""
+import json
+from asgiref.sync import sync_to_async
+from django.db import connections, transaction
+from utils import pubsub
+from .models import SupplyPost
+
+STATE_FIELDS = ("id", "joined_count", "status")
+FINAL_STATUSES = {SupplyPost.Status.EXECUTED, SupplyPost.Status.CANCELED, SupplyPost.Status.EXPIRED}
+RETRY_MS = 3000
+
+
+def channel(supply_id):
+    return f"supply:{supply_id}"
+
+
+def publish_states(*supply_ids):
+    def send():
+        listening = pubsub.listening([channel(pk) for pk in supply_ids])
+        ids = [int(pk) for pk in supply_ids if channel(pk) in listening]
+        if not ids:
+            return
+        found = set()
+        for row in SupplyPost.objects.filter(pk__in=ids).values(*STATE_FIELDS):
+            found.add(row["id"])
+            pubsub.publish(channel(row["id"]), row)
+        for pk in ids:
+            if pk not in found:
+                pubsub.publish(channel(pk), {"id": pk, "deleted": True})
+    transaction.on_commit(send)
+
+
+def _event(state) -> bytes:
+    name = "deleted" if state.get("deleted") else "supply"
+    return f"event: {name}\ndata: {json.dumps(state)}\n\n".encode()
+
+
+async def state_events(supply_id, heartbeat):
+    subscription = await pubsub.subscribe(channel(supply_id))
+    try:
+        yield f"retry: {RETRY_MS}\n\n".encode()
+        state = await SupplyPost.objects.filter(pk=supply_id).values(*STATE_FIELDS).afirst()
+        state = state or {"id": supply_id, "deleted": True}
+        # 이후로는 DB를 쓰지 않는다. 요청별 스레드(ASGIHandler)가 잡은 DB 연결을 스트림이 끝날 때까지 들고 있지 않도록 닫는다.
+        await sync_to_async(connections.close_all)()
+        last = None
+        while True:
+            if state is None:
+                yield b": heartbeat\n\n"
+            elif state != last:
+                yield _event(state)
+                if state.get("deleted") or state["status"] in FINAL_STATUSES:
+                    return
+                last = state
+            state = await subscription.get(heartbeat)
+    finally:
+        pubsub.unsubscribe(subscription)
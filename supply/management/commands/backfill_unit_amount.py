@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from supply.services import backfill_unit_amount
+
+
+class Command(BaseCommand):
+    help = "SupplyPost.unit_amount(인당 금액)를 배치로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        updated = backfill_unit_amount(batch_size=options["batch_size"])
+        self.stdout.write(f"{updated} rows updated")
@@ -0,0 +1,145 @@
+import asyncio
+import io
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import override_settings
+from django.utils import timezone
+from accounts.models import User
+from accounts.services import JWTService
+from configs.asgi import application as asgi_application
+from configs.wsgi import application as wsgi_application
+from supply.models import SupplyPost
+
+# 응답 캐시(utils.cache)를 끄고 매 요청 DB를 읽게 한다. (두 경로 모두 같은 조건)
+NO_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+def call_wsgi(path, token):
+    environ = {
+        "REQUEST_METHOD": "GET", "PATH_INFO": path, "QUERY_STRING": "", "SCRIPT_NAME": "",
+        "SERVER_NAME": "localhost", "SERVER_PORT": "80", "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": "localhost", "HTTP_AUTHORIZATION": f"Bearer {token}", "REMOTE_ADDR": "127.0.0.1",
+        "wsgi.input": io.BytesIO(b""), "wsgi.errors": io.StringIO(), "wsgi.url_scheme": "http",
+        "wsgi.version": (1, 0), "wsgi.multithread": True, "wsgi.multiprocess": False, "wsgi.run_once": False,
+    }
+    statuses = []
+    body = wsgi_application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    b"".join(body)
+    getattr(body, "close", lambda: None)()
+    connections.close_all()  # gunicorn 스레드 워커처럼 요청이 끝나면 연결을 닫는다 (CONN_MAX_AGE=0)
+    return int(statuses[0].split()[0])
+
+
+async def call_asgi(path, token):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"localhost"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 10000), "server": ("localhost", 80),
+    }
+    received = asyncio.Event()
+    result = {}
+
+    async def receive():
+        if not received.is_set():
+            received.set()
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+
+    await asgi_application(scope, receive, send)
+    return result["status"]
+
+
+def summary(latencies, elapsed):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return (
+        f"{len(latencies) / elapsed:7.1f} req/s, p50 {statistics.median(latencies) * 1e3:7.1f} ms, "
+        f"p95 {p95 * 1e3:7.1f} ms"
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "같은 동시 요청 부하에서 동기 뷰(WSGI, 스레드 N개) vs async 뷰(ASGI, 이벤트 루프 1개) 처리량/지연 비교. "
+        "--db-latency로 쿼리마다 지연을 넣어 원격 DB를 흉내 낼 수 있습니다. 응답 캐시는 끄고, 임시 계정/글은 끝나면 지웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=400)
+        parser.add_argument("--concurrency", type=int, default=50, help="동시에 보내는 요청 수")
+        parser.add_argument("--threads", type=int, default=8, help="WSGI 워커 스레드 수 (gunicorn --threads)")
+        parser.add_argument("--db-latency", type=float, default=5.0, help="쿼리마다 더할 지연 (ms)")
+        parser.add_argument("--posts", type=int, default=30)
+
+    def handle(self, *args, **options):
+        user = User.objects.create_user(email=f"bench-async-{uuid.uuid4().hex[:12]}@example.com", password=None, name="bench")
+        now = timezone.now()
+        posts = SupplyPost.objects.bulk_create([
+            SupplyPost(
+                author=user, title=f"bench {i}", content="bench", total_amount=10000, max_participants=3, unit_amount=3334,
+                apply_deadline=now + timedelta(days=1), execute_time=now + timedelta(days=2),
+            )
+            for i in range(options["posts"])
+        ])
+        token = JWTService().post(user)["access"]["token"]
+        delay = options["db_latency"] / 1000
+
+        def slow_query(execute, sql, params, many, context):
+            time.sleep(delay)
+            return execute(sql, params, many, context)
+
+        def install(sender, connection, **kwargs):
+            connection.execute_wrappers.append(slow_query)
+
+        if delay:
+            connection_created.connect(install)
+        try:
+            with override_settings(CACHES=NO_CACHE):
+                for label, sync_path, async_path in (
+                    ("list", "/supply/", "/supply/async/"),
+                    ("detail", f"/supply/{posts[0].pk}/", f"/supply/async/{posts[0].pk}/"),
+                ):
+                    self.stdout.write(f"{label}: {options['requests']} requests, concurrency {options['concurrency']}, db +{options['db_latency']} ms/query")
+                    self.stdout.write(f"  wsgi x{options['threads']:<3} {asyncio.run(self.run_wsgi(sync_path, token, options))}")
+                    self.stdout.write(f"  asgi      {asyncio.run(self.run_asgi(async_path, token, options))}")
+        finally:
+            connection_created.disconnect(install)
+            connections.close_all()
+            SupplyPost.objects.filter(author=user).delete()
+            user.delete()
+
+    async def run_wsgi(self, path, token, options):
+        # 클라이언트 concurrency개가 동시에 보내도 처리는 스레드 threads개 (나머지는 대기, 지연에 포함)
+        with ThreadPoolExecutor(options["threads"]) as workers:
+            loop = asyncio.get_running_loop()
+            return await self.load(lambda: loop.run_in_executor(workers, call_wsgi, path, token), options)
+
+    async def run_asgi(self, path, token, options):
+        return await self.load(lambda: call_asgi(path, token), options)
+
+    async def load(self, send, options):
+        await send()  # 예열 (인증 캐시, URL 해석)
+        gate = asyncio.Semaphore(options["concurrency"])
+        latencies, statuses = [], set()
+
+        async def timed():
+            async with gate:
+                sent = time.perf_counter()
+                statuses.add(await send())
+                latencies.append(time.perf_counter() - sent)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(timed() for _ in range(options["requests"])))
+        return f"{summary(latencies, time.perf_counter() - started)}, status {sorted(statuses)}"
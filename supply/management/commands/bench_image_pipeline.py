@@ -0,0 +1,38 @@
+import io
+import resource
+import time
+from PIL import Image
+from django.core.management.base import BaseCommand
+from utils.images import render_derivatives
+
+
+class Command(BaseCommand):
+    help = "합성 사진으로 썸네일 파이프라인 처리량(장/초)과 최대 메모리를 측정합니다. (저장 제외)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=20)
+        parser.add_argument("--width", type=int, default=4032)
+        parser.add_argument("--height", type=int, default=3024)
+        parser.add_argument("--format", default="JPEG", help="원본 형식 (JPEG/PNG/WEBP)")
+
+    def handle(self, *args, **options):
+        width, height = options["width"], options["height"]
+        source = Image.radial_gradient("L").resize((width, height)).convert("RGB")
+        buffer = io.BytesIO()
+        source.save(buffer, options["format"], quality=90)
+        data = buffer.getvalue()
+        del source
+
+        output = 0
+        started = time.perf_counter()
+        for _ in range(options["count"]):
+            rendered = render_derivatives(io.BytesIO(data))
+            output += sum(len(blob) for encoded in rendered.values() for blob in encoded.values())
+        elapsed = time.perf_counter() - started
+
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        self.stdout.write(
+            f"{options['count']} x {width}x{height} {options['format']} ({len(data) / 1024:.0f} KiB) in {elapsed:.2f}s: "
+            f"{options['count'] / elapsed:.1f} images/s, "
+            f"{output / options['count'] / 1024:.0f} KiB derivatives per image, peak RSS {peak_mb:.0f} MiB"
+        )
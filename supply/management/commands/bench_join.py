@@ -0,0 +1,100 @@
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal, ROUND_UP
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections, transaction
+from django.utils import timezone
+from accounts.models import User
+from supply.models import SupplyPost, SupplyJoin
+from supply.services import join_supply
+
+
+@transaction.atomic
+def locking_join(user, supply_id):
+    """비교용: 이전 구현 (행 잠금 select_for_update + 신청 수 COUNT 후 판정, joined_count는 갱신하지 않음)"""
+    supply = SupplyPost.objects.select_for_update().get(id=supply_id)
+    if supply.status != SupplyPost.Status.OPEN:
+        raise ValueError("모집이 종료되었습니다.")
+    current = supply.joins.filter(status__in=["PENDING", "CONFIRMED"]).count()
+    if current >= supply.max_participants:
+        supply.status = SupplyPost.Status.FILLED
+        supply.save(update_fields=["status"])
+        raise ValueError("정원이 이미 찼습니다.")
+    unit = (Decimal(supply.total_amount) / Decimal(supply.max_participants)).to_integral_value(rounding=ROUND_UP)
+    join, created = SupplyJoin.objects.get_or_create(supply=supply, user=user, defaults={"unit_amount": unit})
+    if current + created >= supply.max_participants:
+        supply.status = SupplyPost.Status.FILLED
+        supply.save(update_fields=["status"])
+    return join
+
+
+class Command(BaseCommand):
+    help = (
+        "선착순 참여 동시 부하: 사용자 N명(기본 400)이 스레드 여러 개로 한 글에 동시에 참여할 때 "
+        "조건부 UPDATE(supply.services.join_supply) vs 행 잠금(select_for_update + COUNT) 처리량/지연 비교. "
+        "스레드마다 DB 연결을 쓰므로 롤백 대신 끝나면 임시 데이터를 지웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=400)
+        parser.add_argument("--seats", type=int, default=100)
+        parser.add_argument("--threads", type=int, default=32)
+
+    def handle(self, *args, **options):
+        tag = uuid.uuid4().hex[:12]
+        users = [
+            User.objects.create_user(email=f"bench-join-{tag}-{i}@example.com", password=None, name=f"bench{i}")
+            for i in range(options["users"])
+        ]
+        self.stdout.write(f"{options['users']} users, {options['seats']} seats, {options['threads']} threads")
+        try:
+            for label, join in (("conditional", join_supply), ("locking", locking_join)):
+                self.run(label, join, users, options)
+        finally:
+            User.objects.filter(email__startswith=f"bench-join-{tag}-").delete()
+
+    def run(self, label, join, users, options):
+        now = timezone.now()
+        post = SupplyPost.objects.create(
+            author=users[0], title="bench", content="bench", total_amount=10000, max_participants=options["seats"],
+            apply_deadline=now + timedelta(days=1), execute_time=now + timedelta(days=2),
+        )
+        retries = []
+
+        def attempt(user):
+            try:
+                started = time.perf_counter()
+                while True:
+                    try:
+                        won = join(user, post.pk) is not None
+                        break
+                    except ValueError:
+                        won = False
+                        break
+                    except OperationalError as e:
+                        # SQLite는 쓰기 트랜잭션을 하나씩만 받는다. 잠금 오류면 트랜잭션 전체를 다시 시도한다.
+                        if "locked" not in str(e):
+                            raise
+                        retries.append(1)
+                        time.sleep(0.001)
+                return won, time.perf_counter() - started
+            finally:
+                connections.close_all()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(options["threads"]) as pool:
+            results = list(pool.map(attempt, users))
+        elapsed = time.perf_counter() - started
+        latencies = sorted(latency for _, latency in results)
+        wins = sum(won for won, _ in results)
+        post.refresh_from_db()
+        joins = SupplyJoin.objects.filter(supply=post).count()
+        self.stdout.write(
+            f"{label:11} {len(results) / elapsed:7.1f} joins/s, p50 {statistics.median(latencies) * 1e3:.1f} ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1e3:.1f} ms, wins {wins} (joins {joins}, "
+            f"joined_count {post.joined_count}, {post.status}), lock retries {len(retries)}"
+        )
+        post.delete()
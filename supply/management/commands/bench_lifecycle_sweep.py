@@ -0,0 +1,94 @@
+import time
+import uuid
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from accounts.models import User
+from supply.lifecycle import TRANSITIONS, sweep_due
+from supply.models import SupplyPost
+
+
+class Command(BaseCommand):
+    help = (
+        "수명주기 sweep(supply.lifecycle.sweep_due) 측정: 공급글 N행(기본 100만) 중 기한이 지난 행을 전환하는 시간, "
+        "쿼리 수, 배치 선택 쿼리의 실행 계획. 임시 데이터는 롤백합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--due-ratio", type=float, default=0.05, help="기한이 지난 행 비율 (OPEN/FILLED 반씩)")
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            started = time.perf_counter()
+            due = self.seed(options["rows"], options["due_ratio"])
+            self.stdout.write(f"seed: {options['rows']} rows ({due} due) in {time.perf_counter() - started:.1f}s")
+            self.explain(options["batch_size"])
+            self.run(options["batch_size"], due)
+            transaction.set_rollback(True)
+
+    def seed(self, rows, due_ratio, chunk=20_000):
+        user = User.objects.create_user(email=f"bench-sweep-{uuid.uuid4().hex[:12]}@example.com", password=None, name="bench")
+        now = timezone.now()
+        every = max(1, round(1 / due_ratio)) if due_ratio > 0 else 0
+        statuses = (SupplyPost.Status.OPEN, SupplyPost.Status.FILLED, SupplyPost.Status.EXPIRED, SupplyPost.Status.EXECUTED)
+        due = 0
+        for offset in range(0, rows, chunk):
+            posts = []
+            for i in range(offset, min(rows, offset + chunk)):
+                is_due = bool(every) and i % every == 0
+                status = statuses[(i // every) % 2] if is_due else statuses[i % 4]
+                deadline = now - timedelta(minutes=1 + i % 600) if is_due else now + timedelta(hours=1 + i % 600)
+                if status in (SupplyPost.Status.EXPIRED, SupplyPost.Status.EXECUTED):
+                    deadline = now - timedelta(days=1 + i % 30)  # 이미 끝난 글 (전환 대상 아님)
+                due += is_due
+                posts.append(SupplyPost(
+                    author=user, title="bench", content="bench", total_amount=0, max_participants=1, status=status,
+                    apply_deadline=deadline, execute_time=deadline if status != SupplyPost.Status.OPEN else deadline + timedelta(days=1),
+                ))
+            SupplyPost.objects.bulk_create(posts, batch_size=2000)
+        return due
+
+    def explain(self, batch_size):
+        if connection.vendor != "sqlite":
+            return
+        now = timezone.now()
+        for from_status, field, _ in TRANSITIONS:
+            queryset = (
+                SupplyPost.objects.filter(status=from_status, **{f"{field}__lte": now})
+                .order_by(field).values_list("id", flat=True)[:batch_size]
+            )
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = "; ".join(row[-1] for row in cursor.fetchall())
+            self.stdout.write(f"plan {from_status}: {plan}")
+
+    def timed_sweep(self, batch_size):
+        # 쿼리 수는 execute_wrapper로 센다. (seed 뒤라 CaptureQueriesContext의 쿼리 로그는 이미 가득 참)
+        queries = []
+
+        def count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count):
+            started = time.perf_counter()
+            moved = sweep_due(batch_size=batch_size)
+            elapsed = time.perf_counter() - started
+        return moved, elapsed, len(queries)
+
+    def run(self, batch_size, due):
+        moved, elapsed, queries = self.timed_sweep(batch_size)
+        total = sum(moved.values())
+        self.stdout.write(
+            f"sweep: {', '.join(f'{status}={count}' for status, count in moved.items())} "
+            f"({total}/{due} due) in {elapsed * 1e3:.0f} ms, {queries} queries, "
+            f"{total / elapsed if elapsed else 0:.0f} rows/s"
+        )
+
+        # 전환할 행이 없을 때 (타이머가 깨어날 때마다 드는 기본 비용)
+        _, elapsed, queries = self.timed_sweep(batch_size)
+        self.stdout.write(f"idle sweep: {elapsed * 1e3:.1f} ms, {queries} queries")
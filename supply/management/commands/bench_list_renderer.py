@@ -0,0 +1,72 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from accounts.models import User
+from supply.models import SupplyPost
+from supply.serializers import supply_list_renderer
+from Request.models import Task
+from Request.serializers import task_list_renderer
+from Request.views import task_list_queryset
+
+
+class Command(BaseCommand):
+    help = "목록 직렬화 마이크로벤치마크: DRF 시리얼라이저 vs values() 빠른 경로 (임시 데이터는 롤백)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=300)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.seed(options["rows"])
+            self.run(options["rows"], options["repeat"])
+            transaction.set_rollback(True)
+
+    def seed(self, rows):
+        user = User.objects.create_user(email="bench-list@example.com", password=None, name="bench")
+        now = timezone.now()
+        SupplyPost.objects.bulk_create([
+            SupplyPost(
+                author=user, title=f"공급 {i}", content="내용", total_amount=10000 + i, max_participants=3,
+                unit_amount=(10000 + i + 2) // 3, apply_deadline=now + timedelta(days=1), execute_time=now + timedelta(days=2),
+                image=f"blobs/aa/bb/{i:064x}.jpg" if i % 2 else "",
+            )
+            for i in range(rows)
+        ])
+        Task.objects.bulk_create([
+            Task(requester=user, title=f"요청 {i}", content="내용" * 20, photo=f"blobs/cc/dd/{i:064x}.jpg" if i % 2 else None)
+            for i in range(rows)
+        ])
+
+    def run(self, rows, repeat):
+        request = Request(RequestFactory().get("/", SERVER_NAME="localhost"))
+        renderer = JSONRenderer()
+        targets = (("supply", SupplyPost.objects.all(), supply_list_renderer), ("task", task_list_queryset(), task_list_renderer))
+        for label, queryset, list_renderer in targets:
+            serializer_class = list_renderer.serializer_class
+            queryset = queryset.order_by("-pk")[:rows]
+            instances = list(queryset)
+            values = list(list_renderer.values(queryset))
+
+            def drf():
+                return renderer.render(serializer_class(instances, many=True, context={"request": request}).data)
+
+            def fast():
+                return renderer.render(list_renderer.render(values, request))
+
+            assert drf() == fast()
+            results = {}
+            for name, func in (("drf", drf), ("fast", fast)):
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    func()
+                results[name] = (time.perf_counter() - started) / repeat * 1000
+            self.stdout.write(
+                f"{label}: {len(instances)} rows, drf {results['drf']:.2f} ms, fast {results['fast']:.2f} ms "
+                f"({results['drf'] / results['fast']:.1f}x, serialize+render only)"
+            )
@@ -0,0 +1,77 @@
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from accounts.models import User
+from supply.models import SupplyPost
+from supply.search import supply_search
+
+ITEMS = ["쌀", "햅쌀", "라면", "휴지", "세제", "생수", "계란", "우유", "사과", "고구마", "참기름", "김치"]
+WORDS = ["나눔", "공동구매", "같이", "사요", "대용량", "반씩", "나눠요", "신촌", "자취생", "박스", "묶음", "할인"]
+TERMS = ["쌀", "라면", "공동구매", "햅쌀 나눔", "신촌 자취생 계란", "없는검색어"]
+
+
+class Command(BaseCommand):
+    help = (
+        "?search= 검색 지연 측정: 공급글 N행(기본 10만)에서 검색어별 역색인 검색(supply.search) vs "
+        "기존 ILIKE(title/content icontains) 비교. 임시 데이터는 롤백합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--page-size", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            started = time.perf_counter()
+            self.seed(options["rows"])
+            self.stdout.write(f"seed: {options['rows']} rows in {time.perf_counter() - started:.1f}s")
+            for term in TERMS:
+                self.run(term, options["repeat"], options["page_size"])
+            transaction.set_rollback(True)
+
+    def seed(self, rows, chunk=5000):
+        user = User.objects.create_user(email=f"bench-search-{uuid.uuid4().hex[:12]}@example.com", password=None, name="bench")
+        now = timezone.now()
+        picker = random.Random(0)
+        for offset in range(0, rows, chunk):
+            posts = []
+            for _ in range(offset, min(rows, offset + chunk)):
+                post = SupplyPost(
+                    author=user, title=f"{picker.choice(ITEMS)} {picker.choice(WORDS)}",
+                    content=" ".join(picker.choice(ITEMS + WORDS) for _ in range(8)),
+                    total_amount=10000, max_participants=2, unit_amount=5000,
+                    apply_deadline=now + timedelta(days=1), execute_time=now + timedelta(days=2),
+                )
+                post.search_document = supply_search.build_document(post)
+                posts.append(post)
+            # bulk_create는 save 신호를 보내지 않으므로 역색인은 직접 채운다.
+            supply_search.sync_tokens(SupplyPost.objects.bulk_create(posts, batch_size=2000))
+
+    def timed(self, queryset, repeat, page_size):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = list(queryset[:page_size])
+            timings.append(time.perf_counter() - started)
+        return len(rows), timings
+
+    def run(self, term, repeat, page_size):
+        base = SupplyPost.objects.order_by("-created_at").values("id", "title")
+        indexed = supply_search.search(base, term).order_by("-search_rank", "-created_at")
+        ilike = base
+        for word in term.split():
+            ilike = ilike.filter(Q(title__icontains=word) | Q(content__icontains=word))
+        self.stdout.write(f"{term!r}: {indexed.count()} matches")
+        for label, queryset in (("index", indexed), ("ilike", ilike)):
+            rows, timings = self.timed(queryset, repeat, page_size)
+            self.stdout.write(
+                f"  {label:5} first page {rows} rows, p50 {statistics.median(timings) * 1e3:.1f} ms, "
+                f"max {max(timings) * 1e3:.1f} ms"
+            )
@@ -0,0 +1,148 @@
+import asyncio
+import gc
+import os
+import threading
+import time
+import uuid
+from datetime import timedelta
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from accounts.models import User
+from accounts.services import JWTService
+from configs.asgi import application
+from utils import pubsub
+from supply.models import SupplyPost, SupplyJoin
+from supply.services import join_supply
+
+
+class Connection:
+    """ASGI 앱에 직접 붙는 SSE 클라이언트 (소켓 없이 receive/send만 흉내)"""
+
+    def __init__(self, path, token, port):
+        self.scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+            "query_string": b"", "root_path": "",
+            "headers": [(b"host", b"localhost"), (b"authorization", f"Bearer {token}".encode())],
+            "client": ("127.0.0.1", port), "server": ("localhost", 80),
+        }
+        self.requested = False
+        self.closed = asyncio.Event()
+        self.status = None
+        self.events = 0
+        self.heartbeats = 0
+
+    async def receive(self):
+        if not self.requested:
+            self.requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.closed.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            self.events += chunk.count(b"event: ")
+            self.heartbeats += chunk.count(b": heartbeat")
+
+    def run(self):
+        return asyncio.create_task(application(self.scope, self.receive, self.send))
+
+
+def rss_kib():
+    """현재 RSS (Linux /proc). 없으면 0"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return 0
+
+
+async def wait_until(condition, timeout):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+class Command(BaseCommand):
+    help = (
+        "SSE 스트림(/supply/async/<pk>/stream/) 부하 확인: 한 프로세스에서 유휴 연결 N개를 ASGI 앱(configs.asgi)에 "
+        "직접 열고 연결당 메모리, 참여 알림 전파 시간, heartbeat, 연결 정리를 확인합니다. 임시 계정/글은 끝나면 지웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--connections", type=int, default=2000)
+        parser.add_argument("--heartbeat", type=float, default=1.0, help="이번 측정에 쓸 SSE_HEARTBEAT_SECONDS")
+        parser.add_argument("--backend", help="PUBSUB_BACKEND 대신 쓸 백엔드 (예: utils.pubsub.CacheBackend)")
+
+    def handle(self, *args, **options):
+        if options["backend"]:
+            pubsub._backend = import_string(options["backend"])(pubsub.hub)
+        self.stdout.write(f"backend: {type(pubsub.get_backend()).__name__}")
+
+        user = User.objects.create_user(email=f"bench-sse-{uuid.uuid4().hex[:12]}@example.com", password=None, name="bench")
+        now = timezone.now()
+        post = SupplyPost.objects.create(
+            author=user, title="bench", content="bench", total_amount=0, max_participants=10,
+            apply_deadline=now + timedelta(days=1), execute_time=now + timedelta(days=2),
+        )
+        token = JWTService().post(user)["access"]["token"]
+        try:
+            with override_settings(SSE_HEARTBEAT_SECONDS=options["heartbeat"]):
+                asyncio.run(self.run(post, user, token, options["connections"], options["heartbeat"]))
+        finally:
+            SupplyJoin.objects.filter(supply=post).delete()
+            post.delete()
+            user.delete()
+
+    def report(self, label, ok, detail):
+        self.stdout.write(f"{label:12} {'ok  ' if ok else 'FAIL'} {detail}")
+
+    async def run(self, post, user, token, count, heartbeat):
+        path = f"/supply/async/{post.pk}/stream/"
+        connections = [Connection(path, token, 10000 + i) for i in range(count)]
+
+        gc.collect()
+        base = rss_kib()
+        started = time.perf_counter()
+        tasks = [connection.run() for connection in connections]
+        ok = await wait_until(lambda: all(c.events >= 1 for c in connections), 120)
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        per_connection = (rss_kib() - base) / count
+        statuses = {c.status for c in connections}
+        self.report(
+            "connect", ok and statuses == {200},
+            f"{count} streams in {elapsed:.2f}s, ~{per_connection:.1f} KiB/connection (RSS), "
+            f"{pubsub.hub.count()} subscribers, {threading.active_count()} threads, status {sorted(statuses, key=str)}",
+        )
+
+        ok = await wait_until(lambda: all(c.heartbeats >= 1 for c in connections), heartbeat * 3 + 5)
+        self.report("heartbeat", ok, f"every {heartbeat}s, {sum(c.heartbeats >= 1 for c in connections)}/{count} received")
+
+        started = time.perf_counter()
+        await sync_to_async(join_supply)(user, post.pk)
+        ok = await wait_until(lambda: all(c.events >= 2 for c in connections), 30)
+        self.report("fan-out", ok, f"join → {count} clients in {(time.perf_counter() - started) * 1e3:.1f} ms")
+
+        half = connections[: count // 2]
+        for connection in half:
+            connection.closed.set()
+        await asyncio.gather(*tasks[: count // 2])
+        remaining = pubsub.hub.count()
+        self.report("disconnect", remaining == count - len(half), f"{len(half)} closed, {remaining} subscribers left")
+
+        post.status = SupplyPost.Status.CANCELED
+        await sync_to_async(post.save)(update_fields=["status", "updated_at"])
+        done, pending = await asyncio.wait(tasks[count // 2:], timeout=30)
+        for task in pending:
+            task.cancel()
+        self.report("final", not pending and pubsub.hub.count() == 0, f"{len(done)} streams closed after CANCELED, {pubsub.hub.count()} subscribers left")
@@ -0,0 +1,74 @@
+import time
+import uuid
+from types import SimpleNamespace
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from accounts.models import User
+from accounts.services import JWTService
+from utils import throttling
+
+
+def _fixed(throttle_class, num, duration):
+    """설정 대신 고정 비율(매번 새 scope)을 쓰는 벤치마크용 throttle"""
+    rate = (f"bench-{uuid.uuid4().hex[:8]}", num, duration)
+    return type(throttle_class.__name__, (throttle_class,), {"get_rate": lambda self, view: rate})
+
+
+class Command(BaseCommand):
+    help = (
+        "요청 제한(utils.throttling) 비용 측정: 허용/거절 경로의 호출당 시간과 DB 쿼리 수, "
+        "그리고 참여 엔드포인트에서 거절(429)까지 걸리는 시간. 임시 계정은 끝나면 지웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--calls", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        calls = options["calls"]
+        request = Request(RequestFactory().post("/", REMOTE_ADDR="203.0.113.7"))
+        request.user = SimpleNamespace(pk="bench", is_authenticated=True)
+        view = SimpleNamespace()
+
+        self.stdout.write(f"cache: {type(caches['default']).__name__}")
+        for base in (throttling.UserTokenBucket, throttling.IPTokenBucket, throttling.UserSlidingWindow):
+            for label, throttle_class, expect in (
+                ("allowed", _fixed(base, calls * 10, 3600), True),   # 비율이 넉넉해 항상 허용
+                ("rejected", _fixed(base, 1, 86400), False),         # 첫 요청 뒤로 항상 거절
+            ):
+                throttle = throttle_class()
+                throttle.allow_request(request, view)
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    results = [throttle.allow_request(request, view) for _ in range(calls)]
+                    elapsed = time.perf_counter() - started
+                wrong = sum(result != expect for result in results)
+                self.stdout.write(
+                    f"{base.__name__:18} {label:8} {elapsed / calls * 1e6:8.1f} us/call, "
+                    f"{len(queries.captured_queries)} queries, {wrong} unexpected"
+                )
+
+        self.endpoint(min(calls, 500))
+
+    def endpoint(self, calls):
+        """참여 엔드포인트: 제한에 걸린 사용자의 요청이 429로 끝나는 시간 (인증 캐시가 데워진 상태)"""
+        user = User.objects.create_user(email=f"bench-throttle-{uuid.uuid4().hex[:12]}@example.com", password=None, name="bench")
+        client = Client(SERVER_NAME="localhost", HTTP_AUTHORIZATION=f"Bearer {JWTService().post(user)['access']['token']}")
+        try:
+            codes = []
+            # 없는 글 번호: 제한을 통과한 요청은 404, 소진 후에는 429
+            while not codes or codes[-1] != 429:
+                codes.append(client.post("/supply/0/join/").status_code)
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                rejected = sum(client.post("/supply/0/join/").status_code == 429 for _ in range(calls))
+                elapsed = time.perf_counter() - started
+        finally:
+            user.delete()
+        self.stdout.write(
+            f"endpoint rejected  {elapsed / calls * 1e3:.3f} ms/request (full Django stack), "
+            f"{len(queries.captured_queries)} queries, {rejected}/{calls} got 429 after {len(codes) - 1} allowed"
+        )
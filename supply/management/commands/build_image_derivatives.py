@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from supply.images import supply_images
+from Request.images import task_images
+
+
+class Command(BaseCommand):
+    help = "썸네일 파생본이 없거나 원본과 맞지 않는 공급글/요청글 이미지를 처리합니다. (백필/재시도)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=None, help="종류별 최대 처리 건수")
+
+    def handle(self, *args, **options):
+        for label, derivatives in (("supply", supply_images), ("task", task_images)):
+            pks = derivatives.pending().order_by("pk").values_list("pk", flat=True)
+            if options["limit"]:
+                pks = pks[:options["limit"]]
+            done = sum(1 for pk in list(pks) if derivatives.build(pk))
+            self.stdout.write(f"{label}: {done} images processed")
@@ -0,0 +1,31 @@
+import logging
+import time
+from django.core.management.base import BaseCommand
+from supply.admission import drain_supply, pending_supply_ids, candidate_supply_ids
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "참여 대기열(admission queue)을 공급글별로 비우며 SupplyJoin을 배치 커밋합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--interval", type=float, default=0.2, help="큐 확인 주기(초)")
+        parser.add_argument("--once", action="store_true", help="한 번만 비우고 종료")
+
+    def handle(self, *args, **options):
+        while True:
+            # OPEN이 아닌 글(마감/정원 도달)의 큐도 비워야 남은 티켓이 REJECTED로 정리된다.
+            processed = 0
+            for supply_id in pending_supply_ids(candidate_supply_ids()):
+                try:
+                    processed += drain_supply(supply_id, batch_size=options["batch_size"])
+                except Exception:
+                    # 동기 /join과 겹친 IntegrityError 등: 배치는 롤백되고 head가 그대로라 다음 주기에 다시 처리된다.
+                    logger.exception("admission drain failed for supply %s", supply_id)
+            if processed:
+                self.stdout.write(f"processed {processed} join intents")
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
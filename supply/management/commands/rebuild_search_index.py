@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from supply.search import supply_search
+from Request.search import task_search
+
+
+class Command(BaseCommand):
+    help = "공급글/요청글 검색 문서와 역색인을 배치로 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        for label, index in (("supply", supply_search), ("task", task_search)):
+            done = index.rebuild(batch_size=options["batch_size"])
+            self.stdout.write(f"{label}: {done} rows indexed")
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from supply.lifecycle import LifecycleScheduler
+
+
+class Command(BaseCommand):
+    help = "기한이 지난 공급글을 EXPIRED/EXECUTED로 일괄 전환합니다. (--watch: 다음 기한마다 반복)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--watch", action="store_true", help="다음 기한까지 대기하며 계속 실행")
+        parser.add_argument("--max-wait", type=float, default=60.0, help="--watch 시 최대 대기(초)")
+
+    def handle(self, *args, **options):
+        scheduler = LifecycleScheduler(batch_size=options["batch_size"], max_wait=options["max_wait"])
+        if options["watch"]:
+            scheduler.run_forever(on_sweep=self._report)
+        else:
+            self._report(scheduler.run_once())
+
+    def _report(self, moved):
+        self.stdout.write(", ".join(f"{status}={count}" for status, count in moved.items()))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:18
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_joined_count(apps, schema_editor):
+    SupplyPost = apps.get_model('supply', 'SupplyPost')
+    SupplyJoin = apps.get_model('supply', 'SupplyJoin')
+    active = (
+        SupplyJoin.objects
+        .filter(supply=OuterRef('pk'), status__in=['PENDING', 'CONFIRMED'])
+        .order_by()
+        .values('supply')
+        .annotate(c=Count('id'))
+        .values('c')
+    )
+    SupplyPost.objects.update(joined_count=Coalesce(Subquery(active), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='supplypost',
+            name='joined_count',
+            field=models.PositiveIntegerField(default=0, help_text='현재 참여 인원(PENDING+CONFIRMED)'),
+        ),
+        migrations.RunPython(backfill_joined_count, migrations.RunPython.noop),
+    ]
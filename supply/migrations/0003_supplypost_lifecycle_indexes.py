@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Request', '0002_initial'),
+        ('supply', '0002_supplypost_joined_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='supplypost',
+            index=models.Index(fields=['status', 'apply_deadline'], name='supply_status_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplypost',
+            index=models.Index(fields=['status', 'execute_time'], name='supply_status_execute_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Request', '0003_hot_query_indexes'),
+        ('supply', '0003_supplypost_lifecycle_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='supplyjoin',
+            index=models.Index(fields=['user', 'supply'], name='supplyjoin_user_supply_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplypost',
+            index=models.Index(fields=['status', '-created_at'], name='supply_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplypost',
+            index=models.Index(condition=models.Q(('status', 'OPEN')), fields=['-created_at'], name='supply_open_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplypost',
+            index=models.Index(fields=['author', '-created_at'], name='supply_author_created_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_gin_index(apps, schema_editor):
+    # Postgres에서만 tsvector GIN 인덱스를 만든다. (그 외 DB는 토큰 테이블 사용)
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS "supply_search_document_gin" ON "supply_supplypost" '
+            'USING gin (to_tsvector(\'simple\', "search_document"))'
+        )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS "supply_search_document_gin"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply', '0004_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='supplypost',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.CreateModel(
+            name='SupplyPostSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=2)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='supply.supplypost')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['token', 'post'], name='supply_search_token_idx')],
+            },
+        ),
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
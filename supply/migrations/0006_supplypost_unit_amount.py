@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:25
+
+from decimal import Decimal, ROUND_UP
+from django.db import migrations, models
+
+
+def backfill_unit_amount(apps, schema_editor):
+    # supply.services.backfill_unit_amount와 같은 계산 (마이그레이션은 과거 모델 사용)
+    SupplyPost = apps.get_model('supply', 'SupplyPost')
+    last_pk = 0
+    while True:
+        batch = list(
+            SupplyPost.objects.filter(pk__gt=last_pk).order_by('pk')
+            .only('total_amount', 'max_participants')[:1000]
+        )
+        if not batch:
+            return
+        for post in batch:
+            post.unit_amount = (
+                (Decimal(post.total_amount) / Decimal(post.max_participants)).to_integral_value(rounding=ROUND_UP)
+                if post.max_participants > 0 else Decimal(0)
+            )
+        SupplyPost.objects.bulk_update(batch, ['unit_amount'])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply', '0005_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='supplypost',
+            name='unit_amount',
+            field=models.DecimalField(db_index=True, decimal_places=0, default=0, editable=False, help_text='인당 금액(원). total_amount/max_participants 올림', max_digits=12),
+        ),
+        migrations.RunPython(backfill_unit_amount, migrations.RunPython.noop),
+    ]
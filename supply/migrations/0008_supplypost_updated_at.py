@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:39
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_updated_at(apps, schema_editor):
+    # 기존 글은 작성 시각을 수정 시각으로 사용
+    SupplyPost = apps.get_model('supply', 'SupplyPost')
+    SupplyPost.objects.update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply', '0007_supplypost_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='supplypost',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supply', '0008_supplypost_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='supplypost',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False, help_text='저장할 때마다 1 증가 (낙관적 동시성)'),
+        ),
+    ]
@@ -1,11 +1,12 @@
 from django.db import models
 from django.conf import settings
 from decimal import Decimal, ROUND_UP
+from utils.concurrency import VersionedModel
 
 User = settings.AUTH_USER_MODEL
 
 
-class SupplyPost(models.Model):
+class SupplyPost(VersionedModel):
     """
     공급글 모델
     - request: Request 앱의 요청글을 FK로 '그냥' 참조. (스냅샷 저장 X)
@@ -14,6 +15,7 @@ class SupplyPost(models.Model):
     - max_participants: 1 이상.
     - 시간 필드는 DB에 DateTime으로 저장(입력은 문자열 → Serializer에서 파싱).
     - 위치/상품 스냅샷 등 불필요한 추가 필드 없음.
+    - version: 저장할 때마다 증가. 수정은 읽은 version과 비교 후 교체 (utils.concurrency)
     """
     class Status(models.TextChoices):
         OPEN = "OPEN", "Open"
@@ -37,6 +39,8 @@ class SupplyPost(models.Model):
     title = models.CharField(max_length=120)         # 공급글 제목
     content = models.TextField()                     # 공급글 상세
     image = models.ImageField(upload_to="supply/", blank=True)  # 공급글 이미지(클릭은 프론트 처리)
+    # 썸네일 파생본 이름 (utils.images가 백그라운드에서 기록)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     total_amount = models.DecimalField(              # 총액(0 허용)
         max_digits=12, decimal_places=0,
@@ -47,23 +51,72 @@ class SupplyPost(models.Model):
     apply_deadline = models.DateTimeField(help_text="신청 마감 시각")
     execute_time = models.DateTimeField(help_text="시행(실행) 시각")
 
+    # 인당 금액 = ceil(total_amount / max_participants). save() 시 갱신, 정렬/필터용 인덱스
+    unit_amount = models.DecimalField(
+        max_digits=12, decimal_places=0, default=0, db_index=True, editable=False,
+        help_text="인당 금액(원). total_amount/max_participants 올림",
+    )
+
     status = models.CharField(max_length=10, choices=Status.choices, default=Status.OPEN)
+    # 참여 인원 카운터(비정규화). join_supply가 조건부 UPDATE 한 번으로 좌석을 선점할 때 사용
+    joined_count = models.PositiveIntegerField(default=0, help_text="현재 참여 인원(PENDING+CONFIRMED)")
     created_at = models.DateTimeField(auto_now_add=True)
+    # 상세 조건부 GET(ETag/Last-Modified) 검증자. QuerySet.update()로 표시 필드를 바꿀 때도 함께 갱신
+    updated_at = models.DateTimeField(auto_now=True)
+    # 검색 문서(제목/내용 글자·bigram 토큰). utils.search가 저장 시 갱신
+    search_document = models.TextField(blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            # 수명주기 스케줄러(supply.lifecycle)의 기한 스캔용
+            models.Index(fields=["status", "apply_deadline"], name="supply_status_deadline_idx"),
+            models.Index(fields=["status", "execute_time"], name="supply_status_execute_idx"),
+            # 목록(status 필터 + 최신순), 모집 중 목록은 부분 인덱스
+            models.Index(fields=["status", "-created_at"], name="supply_status_created_idx"),
+            models.Index(
+                fields=["-created_at"], name="supply_open_created_idx",
+                condition=models.Q(status="OPEN"),
+            ),
+            # 내가 올린 공급글(MyReceiveRequest)
+            models.Index(fields=["author", "-created_at"], name="supply_author_created_idx"),
+        ]
+
+    @staticmethod
+    def compute_unit_amount(total_amount, max_participants) -> Decimal:
+        """인당 금액: ceil(total_amount / max_participants) — 0원도 허용"""
+        if not max_participants or max_participants <= 0:
+            return Decimal(0)
+        return (Decimal(total_amount) / Decimal(max_participants)).to_integral_value(rounding=ROUND_UP)
 
     @property
     def unit_amount_preview(self) -> int:
-        """인당 금액(미리보기): ceil(total_amount / max_participants) — 0원도 허용"""
-        if self.max_participants <= 0:
-            return 0
-        return int(
-            (Decimal(self.total_amount) / Decimal(self.max_participants))
-            .to_integral_value(rounding=ROUND_UP)
-        )
+        """인당 금액(미리보기). 저장된 unit_amount 컬럼을 그대로 읽는다."""
+        return int(self.unit_amount)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"total_amount", "max_participants"} & set(update_fields):
+            self.unit_amount = self.compute_unit_amount(self.total_amount, self.max_participants)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "unit_amount"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"[Supply] {self.title} (req={self.request_id})"
 
 
+class SupplyPostSearchToken(models.Model):
+    """검색 역색인 (Postgres 외 DB용). post의 search_document 토큰별 가중치"""
+    post = models.ForeignKey(SupplyPost, on_delete=models.CASCADE, related_name="search_tokens")
+    token = models.CharField(max_length=2)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["token", "post"], name="supply_search_token_idx"),
+        ]
+
+
 class SupplyJoin(models.Model):
     STATUS_CHOICES = (
         ("PENDING", "Pending"),
@@ -83,6 +136,10 @@ class SupplyJoin(models.Model):
 
     class Meta:
         unique_together = ("supply", "user")
+        indexes = [
+            # 내가 참여한 공급글(MyJoinRequest): user로 찾고 supply로 조인
+            models.Index(fields=["user", "supply"], name="supplyjoin_user_supply_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} -> {self.supply} ({self.unit_amount}원)"
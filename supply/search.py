@@ -0,0 +1,8 @@
+from utils.search import SearchIndex
+from .models import SupplyPost, SupplyPostSearchToken
+
+supply_search = SearchIndex(
+    SupplyPost, SupplyPostSearchToken,
+    fields={"title": 2, "content": 1},
+    token_fk="post",
+)
@@ -1,6 +1,9 @@
 from django.utils import timezone
 from rest_framework import serializers
 from decimal import Decimal, ROUND_UP
+from utils.images import ImageVariantsField
+from utils.renderers import ValuesRenderer, Computed
+from .images import supply_images
 from .models import SupplyPost, SupplyJoin, Comment
 from .utils import parse_user_datetime
 
@@ -71,6 +74,7 @@ class SupplyPostCreateSerializer(serializers.ModelSerializer):
 class SupplyPostListSerializer(serializers.ModelSerializer):
     """목록용: 최소 필드"""
     unit_amount_preview = serializers.ReadOnlyField()
+    image_urls = ImageVariantsField(supply_images)  # 크기별 썸네일(webp/jpeg)
 
     class Meta:
         model = SupplyPost
@@ -78,10 +82,16 @@ class SupplyPostListSerializer(serializers.ModelSerializer):
             "id", "title",
             "unit_amount_preview", "max_participants",
             "status", "apply_deadline", "execute_time",
-            "image", "created_at",
+            "image", "image_urls", "created_at",
         ]
 
 
+# 목록 빠른 경로 (SupplyPostListSerializer와 같은 출력, values() 행 사용)
+supply_list_renderer = ValuesRenderer(SupplyPostListSerializer, overrides={
+    "unit_amount_preview": Computed(["unit_amount"], lambda row, context: int(row["unit_amount"])),
+})
+
+
 class SupplyPostDetailSerializer(serializers.ModelSerializer):
     """
     상세용
@@ -89,6 +99,7 @@ class SupplyPostDetailSerializer(serializers.ModelSerializer):
       스냅샷 저장 없이 매 조회 시 FK로 접근해 직렬화.
     """
     unit_amount_preview = serializers.ReadOnlyField()
+    image_urls = ImageVariantsField(supply_images)
     request_card = serializers.SerializerMethodField()
 
     class Meta:
@@ -96,11 +107,12 @@ class SupplyPostDetailSerializer(serializers.ModelSerializer):
         fields = [
             "id", "author",
             "request",                 # FK id 그대로 표시(필요 시 read_only 처리 가능)
-            "title", "content", "image",
+            "title", "content", "image", "image_urls",
             "total_amount", "max_participants",
             "apply_deadline", "execute_time",
             "unit_amount_preview", "status", "created_at",
             "request_card",           # 폼 하단 카드용 데이터
+            "version",                # 저장할 때마다 증가 (수정 시 If-Match: "<version>")
         ]
 
     def get_request_card(self, obj):
@@ -144,7 +156,8 @@ class SupplyJoinMySerializer(serializers.ModelSerializer):
 class SupplyPostMySerializer(serializers.ModelSerializer):
     days_left = serializers.SerializerMethodField()
     join_member_count = serializers.IntegerField()
-    joins = SupplyJoinMySerializer(many=True)
+    # 뷰에서 Prefetch(to_attr='prefetched_joins')로 신청자+사용자를 미리 읽어 둔다.
+    joins = SupplyJoinMySerializer(many=True, source='prefetched_joins')
 
     class Meta:
         model = SupplyPost
@@ -1,9 +1,78 @@
-from django.db import transaction
+from django.db import transaction, IntegrityError
+from django.db.models import F, Case, When, Value
 from django.utils import timezone
-from decimal import Decimal, ROUND_UP
+from utils.cache import bump
+from .live import publish_states
+from .admission import return_seat
 from .models import SupplyPost, SupplyJoin
 
-@transaction.atomic
+
+def _claim_seat(supply_id, now) -> bool:
+    """
+    좌석 선점 (조건부 UPDATE 한 번)
+      - OPEN 상태 + 마감 전 + 정원 미달일 때만 joined_count += 1
+      - 마지막 좌석이면 같은 문장에서 FILLED로 전환
+    행 잠금(select_for_update)/COUNT 없이 DB가 원자적으로 판정한다.
+    """
+    updated = SupplyPost.objects.filter(
+        id=supply_id,
+        status=SupplyPost.Status.OPEN,
+        apply_deadline__gt=now,
+        joined_count__lt=F("max_participants"),
+    ).update(
+        joined_count=F("joined_count") + 1,
+        updated_at=now,
+        status=Case(
+            When(joined_count__gte=F("max_participants") - 1, then=Value(SupplyPost.Status.FILLED)),
+            default=Value(SupplyPost.Status.OPEN),
+        ),
+    )
+    return updated == 1
+
+
+def release_seat(supply_id, now=None) -> bool:
+    """
+    좌석 반납 (조건부 UPDATE 한 번): joined_count -= 1
+      - 마감 전인 FILLED 글은 정원 미만이 되므로 같은 문장에서 OPEN으로 되돌린다.
+    신청 취소(cancel_join)와 SupplyJoin 삭제/CANCELED 전환(signals)에서 호출한다.
+    """
+    now = now or timezone.now()
+    released = SupplyPost.objects.filter(id=supply_id, joined_count__gt=0).update(
+        joined_count=F("joined_count") - 1,
+        updated_at=now,
+        status=Case(
+            When(status=SupplyPost.Status.FILLED, apply_deadline__gt=now, then=Value(SupplyPost.Status.OPEN)),
+            default=F("status"),
+        ),
+    )
+    if released:
+        transaction.on_commit(lambda: return_seat(supply_id))
+        bump("supply:list", f"supply:{supply_id}")
+        publish_states(supply_id)
+    return released == 1
+
+
+def _reject(supply_id, now):
+    """선점 실패 사유를 판별해 ValueError로 돌려준다. (필요 시 상태 전환)"""
+    supply = SupplyPost.objects.only("status", "apply_deadline", "joined_count", "max_participants").get(id=supply_id)
+    if supply.status != SupplyPost.Status.OPEN:
+        raise ValueError("모집이 종료되었습니다.")
+    if supply.apply_deadline <= now:
+        SupplyPost.objects.filter(id=supply_id, status=SupplyPost.Status.OPEN) \
+            .update(status=SupplyPost.Status.EXPIRED, updated_at=now)
+        bump("supply:list", f"supply:{supply_id}")
+        publish_states(supply_id)
+        raise ValueError("마감시간이 지났습니다.")
+    # 선점 실패와 이 UPDATE 사이에 좌석이 반납됐을 수 있으니 정원이 찬 경우에만 FILLED로 바꾼다.
+    filled = SupplyPost.objects.filter(
+        id=supply_id, status=SupplyPost.Status.OPEN, joined_count__gte=F("max_participants"),
+    ).update(status=SupplyPost.Status.FILLED, updated_at=now)
+    if filled:
+        bump("supply:list", f"supply:{supply_id}")
+        publish_states(supply_id)
+    raise ValueError("정원이 이미 찼습니다.")
+
+
 def join_supply(user, supply_id, request_note: str = "") -> SupplyJoin:
     """
     선착순 참여 (동시성 보장)
@@ -12,45 +81,75 @@ def join_supply(user, supply_id, request_note: str = "") -> SupplyJoin:
       - 마감 지나면 EXPIRED로 전환 후 거절
       - 정원 도달 시 FILLED로 전환 후 거절
       - 단가 = ceil(total_amount / max_participants), 0원 허용
+    좌석은 SupplyPost.joined_count에 대한 조건부 UPDATE로 선점한다. (행 잠금 대기 없음)
     """
-    supply = SupplyPost.objects.select_for_update().get(id=supply_id)
-    now = timezone.now()
-    print("--- 시간 비교 디버깅 ---")
-    print("DB에 저장된 마감 시간 (apply_deadline):", supply.apply_deadline)
-    print("DB에 저장된 마감 시간 (apply_deadline):", supply.apply_deadline)
-    print("현재 서버 시간 (now):", now)
-    print("비교 결과 (apply_deadline <= now):", supply.apply_deadline <= now)
-    print("-----------------------")
-    if supply.status != SupplyPost.Status.OPEN:
-        raise ValueError("모집이 종료되었습니다.")
-    if supply.apply_deadline <= now:
-        supply.status = SupplyPost.Status.EXPIRED
-        supply.save(update_fields=["status"])
-        raise ValueError("마감시간이 지났습니다.")
+    supply = SupplyPost.objects.only("unit_amount").get(id=supply_id)
 
-    current = supply.joins.filter(status__in=["PENDING", "CONFIRMED"]).count()
-    if current >= supply.max_participants:
-        supply.status = SupplyPost.Status.FILLED
-        supply.save(update_fields=["status"])
-        raise ValueError("정원이 이미 찼습니다.")
+    # 이미 신청한 사용자는 좌석을 다시 잡지 않는다.
+    join = SupplyJoin.objects.filter(supply_id=supply_id, user=user).first()
+    if join is None:
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                claimed = _claim_seat(supply_id, now)
+                if claimed:
+                    join = SupplyJoin.objects.create(
+                        supply_id=supply_id,
+                        user=user,
+                        unit_amount=supply.unit_amount,
+                        content=request_note,
+                    )
+            if not claimed:
+                _reject(supply_id, now)
+            return join
+        except IntegrityError:
+            # 같은 사용자의 동시 요청 → 선점한 좌석은 롤백되고 기존 신청을 돌려준다.
+            join = SupplyJoin.objects.get(supply_id=supply_id, user=user)
 
-    unit = (Decimal(supply.total_amount) / Decimal(supply.max_participants)) \
-        .to_integral_value(rounding=ROUND_UP)
+    # 기존 신청이 있었는데 메모를 새로 보냈다면 갱신(선택사항)
+    if request_note and join.content != request_note:
+        join.content = request_note
+        join.save(update_fields=["content"])
 
-    # ✅ 메모(request_note)만 추가
-    join, created = SupplyJoin.objects.get_or_create(
-        supply=supply,
-        user=user,
-        defaults={"unit_amount": unit, "content": request_note},
-    )
+    return join
 
-    # 기존 신청이 있었는데 메모를 새로 보냈다면 갱신(선택사항)
-    if not created and request_note and join.request_note != request_note:
-        join.request_note = request_note
-        join.save(update_fields=["request_note"])
 
-    if current + (1 if created else 0) >= supply.max_participants:
-        supply.status = SupplyPost.Status.FILLED
-        supply.save(update_fields=["status"])
+def cancel_join(user, supply_id):
+    """
+    참여 취소: 신청을 CANCELED로 바꾸는 조건부 UPDATE로 취소 권한을 먼저 잡고(동시 취소는 한 번만 통과)
+    좌석을 반납한 뒤 신청 행을 지운다. (삭제 신호는 CANCELED 행의 좌석을 다시 반납하지 않는다)
+    취소할 신청이 없으면 ValueError
+    """
+    with transaction.atomic():
+        mine = SupplyJoin.objects.filter(supply_id=supply_id, user=user)
+        if not mine.exclude(status="CANCELED").update(status="CANCELED"):
+            raise ValueError("취소할 신청이 없습니다.")
+        release_seat(supply_id)
+        mine.delete()
 
-    return join
+
+def backfill_unit_amount(batch_size: int = 1000) -> int:
+    """
+    SupplyPost.unit_amount 일괄 재계산 (pk 순 배치 + bulk_update)
+    값이 달라진 행만 갱신하며, 갱신한 행 수를 반환한다.
+    """
+    updated = 0
+    last_pk = 0
+    while True:
+        batch = list(
+            SupplyPost.objects.filter(pk__gt=last_pk).order_by("pk")
+            .only("total_amount", "max_participants", "unit_amount")[:batch_size]
+        )
+        if not batch:
+            return updated
+        changed = []
+        for post in batch:
+            unit = SupplyPost.compute_unit_amount(post.total_amount, post.max_participants)
+            if post.unit_amount != unit:
+                post.unit_amount = unit
+                changed.append(post)
+        if changed:
+            SupplyPost.objects.bulk_update(changed, ["unit_amount"])
+            bump("supply:list", *(f"supply:{post.pk}" for post in changed))
+        updated += len(changed)
+        last_pk = batch[-1].pk
@@ -0,0 +1,56 @@
+"""
+응답 캐시 무효화 (utils.cache 세대 카운터)
+  supply        : 전체 (수명주기 스윕 등 일괄 상태 전환)
+  supply:list   : 목록
+  supply:<pk>   : 상세
+QuerySet.update()/bulk_create()는 시그널이 없으므로 호출한 곳에서 직접 bump한다.
+참여 인원/상태 실시간 알림(supply.live.publish_states)도 같은 자리에서 보낸다.
+
+좌석 반납: 참여 중(PENDING/CONFIRMED)이던 신청이 삭제되거나(관리자, 사용자 삭제 cascade)
+CANCELED로 바뀌면 joined_count를 되돌린다. (services.release_seat)
+"""
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from utils.cache import bump
+from .live import publish_states
+from .models import SupplyPost, SupplyJoin, Comment
+from .services import release_seat
+
+
+@receiver([post_save, post_delete], sender=SupplyPost)
+def invalidate_supply(sender, instance, **kwargs):
+    bump("supply:list", f"supply:{instance.pk}")
+    publish_states(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=SupplyJoin)
+def invalidate_supply_join(sender, instance, **kwargs):
+    bump("supply:list", f"supply:{instance.supply_id}")
+    publish_states(instance.supply_id)
+
+
+@receiver(pre_save, sender=SupplyJoin)
+def remember_join_status(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or (update_fields is not None and "status" not in update_fields):
+        return
+    instance._previous_status = (
+        SupplyJoin.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=SupplyJoin)
+def release_canceled_seat(sender, instance, **kwargs):
+    previous = instance.__dict__.pop("_previous_status", None)
+    if previous not in (None, "CANCELED") and instance.status == "CANCELED":
+        release_seat(instance.supply_id)
+
+
+@receiver(post_delete, sender=SupplyJoin)
+def release_deleted_seat(sender, instance, **kwargs):
+    if instance.status != "CANCELED":
+        release_seat(instance.supply_id)
+
+
+@receiver([post_save, post_delete], sender=Comment)
+def invalidate_supply_comment(sender, instance, **kwargs):
+    bump(f"supply:{instance.post_id}")
@@ -1,3 +1,742 @@
-from django.test import TestCase
+import base64
+import io
+import json
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock, skipUnless
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import OperationalError, connection, connections
+from django.test import Client, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.test import APIClient
+from accounts.models import User, UserStats
+from accounts.services import JWTService
+from utils import pubsub
+from utils.async_views import AsyncAPIView
+from utils.cache import bump, generations
+from utils.images import render_derivatives
+from utils.testing import QueryBudgetMixin, ValuesRendererMixin
+from .admission import ITEM_WRITE_GRACE, TicketStatus, enqueue_join, drain_supply, get_ticket, pending_supply_ids, candidate_supply_ids
+from .images import supply_images
+from .lifecycle import next_due_at, sweep_due
+from .live import channel, publish_states
+from .models import SupplyPost, SupplyJoin
+from .serializers import supply_list_renderer
+from .services import join_supply, cancel_join, backfill_unit_amount, _reject
 
-# Create your tests here.
+
+def make_user(name):
+    return User.objects.create_user(email=f"{name}@example.com", password=None, name=name)
+
+def make_post(author, **fields):
+    now = timezone.now()
+    values = {
+        "title": "쌀 나눔", "content": "같이 사요", "total_amount": 10000, "max_participants": 2,
+        "apply_deadline": now + timedelta(days=1), "execute_time": now + timedelta(days=2),
+    }
+    values.update(fields)
+    return SupplyPost.objects.create(author=author, **values)
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_bump_waits_for_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            bump("supply:list")
+            # 커밋 전에는 세대가 그대로 (다른 요청이 커밋 전 데이터를 새 세대로 저장하지 않도록)
+            self.assertEqual(generations(["supply:list"]), "0")
+        self.assertEqual(generations(["supply:list"]), "1")
+
+
+class AdmissionDrainTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = make_user("author")
+        self.post = make_post(self.author, max_participants=1)
+
+    def test_queue_of_filled_post_is_rejected(self):
+        ticket = enqueue_join(make_user("queued"), self.post.pk)["ticket"]
+        join_supply(make_user("direct"), self.post.pk)  # 동기 /join이 마지막 좌석을 가져감
+        self.assertIn(self.post.pk, pending_supply_ids(candidate_supply_ids()))
+
+        drain_supply(self.post.pk)
+        self.assertEqual(get_ticket(ticket)["status"], TicketStatus.REJECTED)
+        self.assertEqual(pending_supply_ids([self.post.pk]), [])
+
+    def test_queue_of_deleted_post_is_rejected(self):
+        ticket = enqueue_join(make_user("queued"), self.post.pk)["ticket"]
+        pk = self.post.pk
+        self.post.delete()
+
+        drain_supply(pk)
+        self.assertEqual(get_ticket(ticket)["status"], TicketStatus.REJECTED)
+
+    def test_drain_waits_for_item_being_written(self):
+        # tail은 올라갔지만 항목은 아직 쓰이기 전인 순간 (enqueue_join이 incr 뒤 set 전)
+        cache.add(f"admission:{self.post.pk}:head", 1)
+        cache.set(f"admission:{self.post.pk}:tail", 1)
+        self.assertEqual(drain_supply(self.post.pk), 0)
+        self.assertEqual(cache.get(f"admission:{self.post.pk}:head"), 1)
+
+        user = make_user("queued")
+        cache.set(f"admission:{self.post.pk}:item:1", {"ticket": "t1", "user_id": user.pk, "content": ""})
+        self.assertEqual(drain_supply(self.post.pk), 1)
+        self.assertEqual(get_ticket("t1")["status"], TicketStatus.JOINED)
+
+    def test_drain_skips_item_never_written(self):
+        cache.add(f"admission:{self.post.pk}:head", 1)
+        cache.set(f"admission:{self.post.pk}:tail", 1)
+        cache.set(f"admission:{self.post.pk}:gap:1", time.time() - ITEM_WRITE_GRACE - 1)
+        ticket = enqueue_join(make_user("queued"), self.post.pk)["ticket"]
+
+        self.assertEqual(drain_supply(self.post.pk), 1)
+        self.assertEqual(get_ticket(ticket)["status"], TicketStatus.JOINED)
+        self.assertEqual(pending_supply_ids([self.post.pk]), [])
+
+    def test_stats_queries_do_not_grow_with_batch(self):
+        def drain(size):
+            post = make_post(self.author, max_participants=size)
+            users = [make_user(f"queued{size}-{i}") for i in range(size)]
+            UserStats.objects.filter(user__in=users[1:]).delete()  # 카운터 행이 있는 사용자/없는 사용자 섞기
+            for user in users:
+                enqueue_join(user, post.pk)
+            with CaptureQueriesContext(connection) as queries:
+                drain_supply(post.pk)
+            self.assertEqual(
+                list(UserStats.objects.filter(user__in=users).values_list("supply_joins_count", flat=True)), [1] * size,
+            )
+            return len(queries)
+
+        self.assertEqual(drain(3), drain(8))
+
+
+class LifecycleSweepTests(TestCase):
+    """sweep_due: 기한이 지난 글만 전환하고 아직 기한 전이거나 이미 끝난 글은 그대로 둔다."""
+
+    def setUp(self):
+        cache.clear()
+        author = make_user("author")
+        self.now = timezone.now()
+        past, future = self.now - timedelta(minutes=1), self.now + timedelta(hours=1)
+        self.expired = make_post(author, apply_deadline=past, execute_time=future)
+        self.open = make_post(author, apply_deadline=future, execute_time=future + timedelta(days=1))
+        self.executed = make_post(author, status=SupplyPost.Status.FILLED, apply_deadline=past, execute_time=past)
+        self.filled = make_post(author, status=SupplyPost.Status.FILLED, apply_deadline=past, execute_time=future)
+        self.canceled = make_post(author, status=SupplyPost.Status.CANCELED, apply_deadline=past, execute_time=past)
+
+    def statuses(self):
+        return dict(SupplyPost.objects.values_list("pk", "status"))
+
+    def test_due_posts_are_transitioned(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            moved = sweep_due(now=self.now, batch_size=1)  # 배치 경계도 함께 확인
+        self.assertEqual(moved, {SupplyPost.Status.EXPIRED: 1, SupplyPost.Status.EXECUTED: 1})
+        self.assertEqual(self.statuses(), {
+            self.expired.pk: SupplyPost.Status.EXPIRED,
+            self.open.pk: SupplyPost.Status.OPEN,
+            self.executed.pk: SupplyPost.Status.EXECUTED,
+            self.filled.pk: SupplyPost.Status.FILLED,
+            self.canceled.pk: SupplyPost.Status.CANCELED,
+        })
+        self.assertEqual(next_due_at(), min(self.open.apply_deadline, self.filled.execute_time))
+
+    def test_second_sweep_is_idle(self):
+        sweep_due(now=self.now)
+        with self.assertNumQueries(2):  # 전환마다 빈 배치 선택 1회
+            self.assertEqual(sweep_due(now=self.now), {SupplyPost.Status.EXPIRED: 0, SupplyPost.Status.EXECUTED: 0})
+
+    def test_posts_become_due_later(self):
+        sweep_due(now=self.now)
+        moved = sweep_due(now=self.now + timedelta(days=2))
+        self.assertEqual(moved, {SupplyPost.Status.EXPIRED: 1, SupplyPost.Status.EXECUTED: 1})
+        self.assertEqual(self.statuses()[self.open.pk], SupplyPost.Status.EXPIRED)
+        self.assertEqual(self.statuses()[self.filled.pk], SupplyPost.Status.EXECUTED)
+
+
+class SeatAccountingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.post = make_post(make_user("author"), max_participants=1)
+        self.user = make_user("joiner")
+        join_supply(self.user, self.post.pk)
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.joined_count, self.post.status), (1, SupplyPost.Status.FILLED))
+
+    def assertSeats(self, joined_count, status):
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.joined_count, self.post.status), (joined_count, status))
+
+    def test_cancel_reopens_filled_post(self):
+        cancel_join(self.user, self.post.pk)
+        self.assertSeats(0, SupplyPost.Status.OPEN)
+        self.assertFalse(SupplyJoin.objects.filter(supply=self.post).exists())
+        with self.assertRaises(ValueError):
+            cancel_join(self.user, self.post.pk)
+        self.assertSeats(0, SupplyPost.Status.OPEN)
+
+    def test_deleting_join_releases_seat(self):
+        SupplyJoin.objects.get(supply=self.post).delete()
+        self.assertSeats(0, SupplyPost.Status.OPEN)
+
+    def test_canceled_status_releases_seat_once(self):
+        join = SupplyJoin.objects.get(supply=self.post)
+        join.status = "CANCELED"
+        join.save()
+        self.assertSeats(0, SupplyPost.Status.OPEN)
+        join.delete()
+        self.assertSeats(0, SupplyPost.Status.OPEN)
+
+    def test_expired_post_is_not_reopened(self):
+        SupplyPost.objects.filter(pk=self.post.pk).update(apply_deadline=timezone.now() - timedelta(minutes=1))
+        cancel_join(self.user, self.post.pk)
+        self.assertSeats(0, SupplyPost.Status.FILLED)
+
+    def test_reject_does_not_fill_post_with_free_seat(self):
+        # 선점 실패 직후 다른 신청이 취소되어 좌석이 비었다면 FILLED로 덮어쓰지 않는다.
+        cancel_join(self.user, self.post.pk)
+        with self.assertRaises(ValueError):
+            _reject(self.post.pk, timezone.now())
+        self.assertSeats(0, SupplyPost.Status.OPEN)
+
+    def test_cancel_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        self.assertEqual(client.delete(f"/supply/{self.post.pk}/join/").status_code, 204)
+        self.assertEqual(client.delete(f"/supply/{self.post.pk}/join/").status_code, 404)
+        self.assertSeats(0, SupplyPost.Status.OPEN)
+
+
+class ConcurrentJoinTests(TransactionTestCase):
+    """동시에 참여를 눌러도 정원만큼만 통과하고 joined_count가 실제 신청 수와 같은지 (스레드마다 DB 연결)"""
+    seats = 3
+    workers = 12
+
+    def setUp(self):
+        cache.clear()
+        self.post = make_post(make_user("author"), max_participants=self.seats)
+        self.users = [make_user(f"racer{i}") for i in range(self.workers)]
+
+    def join(self, user):
+        try:
+            while True:
+                try:
+                    return join_supply(user, self.post.pk) is not None
+                except ValueError:
+                    return False
+                except OperationalError as e:
+                    # 테스트용 SQLite(공유 캐시 메모리 DB)는 잠금을 기다리지 않고 바로 실패한다.
+                    # 트랜잭션 전체가 롤백되므로 처음부터 다시 시도한다.
+                    if "locked" not in str(e):
+                        raise
+                    time.sleep(0.001)
+        finally:
+            connections.close_all()
+
+    def test_only_capacity_wins(self):
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(self.join, self.users))
+
+        self.post.refresh_from_db()
+        self.assertEqual(sum(results), self.seats)
+        self.assertEqual(SupplyJoin.objects.filter(supply=self.post).count(), self.seats)
+        self.assertEqual(self.post.joined_count, self.seats)
+        self.assertEqual(self.post.status, SupplyPost.Status.FILLED)
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN 형식은 SQLite 기준")
+class HotQueryIndexTests(TestCase):
+    """목록/수명주기 쿼리가 전용 인덱스를 타는지 (전체 스캔, 정렬용 임시 B-tree 없음)"""
+
+    def assertUsesIndex(self, queryset, *index_names):
+        plan = queryset.explain()
+        self.assertTrue(any(f"INDEX {name}" in plan for name in index_names), plan)
+        self.assertNotIn("SCAN supply_supplypost", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_list_by_status(self):
+        for status in (SupplyPost.Status.OPEN, SupplyPost.Status.FILLED):
+            self.assertUsesIndex(
+                SupplyPost.objects.filter(status=status).order_by("-created_at")[:20],
+                "supply_status_created_idx", "supply_open_created_idx",
+            )
+
+    def test_my_supplies(self):
+        self.assertUsesIndex(
+            SupplyPost.objects.filter(author_id=1).order_by("-created_at")[:20], "supply_author_created_idx",
+        )
+
+    def test_my_joins(self):
+        self.assertUsesIndex(SupplyJoin.objects.filter(user_id=1).values("supply_id"), "supplyjoin_user_supply_idx")
+
+    def test_lifecycle_scans(self):
+        now = timezone.now()
+        self.assertUsesIndex(
+            SupplyPost.objects.filter(status=SupplyPost.Status.OPEN, apply_deadline__lte=now)
+            .order_by("apply_deadline").values_list("id", flat=True)[:500],
+            "supply_status_deadline_idx",
+        )
+        self.assertUsesIndex(
+            SupplyPost.objects.filter(status=SupplyPost.Status.FILLED, execute_time__lte=now)
+            .order_by("execute_time").values_list("id", flat=True)[:500],
+            "supply_status_execute_idx",
+        )
+
+
+class EndpointQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """공급글 목록/상세/신청자 엔드포인트가 행 수와 무관하게 같은 쿼리 수로 끝나는지 (응답 캐시 없이)"""
+
+    def setUp(self):
+        cache.clear()
+        self.author = make_user("author")
+        self.joiner = make_user("joiner")
+        self.post = make_post(self.author, max_participants=100)
+        self.api = APIClient()
+
+    def seed_posts(self, n):
+        while SupplyPost.objects.count() < n:
+            join_supply(self.joiner, make_post(self.author).pk)
+
+    def seed_applicants(self, n):
+        while self.post.joins.count() < n:
+            join_supply(make_user(f"applicant{self.post.joins.count()}"), self.post.pk)
+
+    def get(self, user, url):
+        cache.clear()
+        self.api.force_authenticate(user)
+        response = self.api.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_supply_list(self):
+        self.assertConstantQueries(budget=1, seed=self.seed_posts, call=lambda: self.get(self.joiner, "/supply/"))
+
+    def test_supply_detail(self):
+        self.assertConstantQueries(
+            budget=2, seed=self.seed_applicants, call=lambda: self.get(self.joiner, f"/supply/{self.post.pk}/"),
+        )
+
+    def test_applicants(self):
+        self.assertConstantQueries(
+            budget=2, seed=self.seed_applicants,
+            call=lambda: self.get(self.author, f"/supply/{self.post.pk}/applicants/"),
+        )
+
+
+class ListRendererTests(ValuesRendererMixin, TestCase):
+    """supply_list_renderer(values() 빠른 경로)가 SupplyPostListSerializer와 같은 JSON을 내는지"""
+
+    def setUp(self):
+        author = make_user("author")
+        make_post(author)
+        make_post(author, total_amount=9999, max_participants=3, status=SupplyPost.Status.CANCELED,
+                  image=f"blobs/aa/bb/{1:064x}.jpg")
+        join_supply(make_user("joiner"), make_post(author, total_amount=0, max_participants=1).pk)
+
+    def test_matches_serializer(self):
+        self.assertRendersLikeSerializer(supply_list_renderer, SupplyPost.objects.all())
+
+    def test_sparse_fields_match_serializer(self):
+        self.assertRendersLikeSerializer(supply_list_renderer, SupplyPost.objects.all(), fields=["id", "status", "image_urls"])
+
+
+class KeysetPaginationTests(TestCase):
+    """목록 커서 페이지네이션: 페이지를 넘겨도 빠짐/중복이 없고, 잘못된 커서는 404, COUNT 쿼리 없음"""
+
+    def setUp(self):
+        cache.clear()
+        author = make_user("author")
+        # 정렬 값이 같은 행(같은 unit_amount)이 페이지 경계에 걸리도록 만든다.
+        self.posts = [make_post(author, total_amount=amount) for amount in (3000, 1000, 1000, 1000, 2000, 5000, 4000)]
+        self.api = APIClient()
+        self.api.force_authenticate(author)
+
+    def walk(self, url):
+        ids, pages = [], 0
+        while url:
+            response = self.api.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [row["id"] for row in response.json()["results"]]
+            url, pages = response.json()["next"], pages + 1
+        return ids, pages
+
+    def test_cursor_round_trip(self):
+        ids, pages = self.walk("/supply/?page_size=2")
+        self.assertEqual(ids, [post.pk for post in reversed(self.posts)])
+        self.assertEqual(pages, 4)
+
+    def test_cursor_round_trip_with_ties(self):
+        ids, _ = self.walk("/supply/?page_size=2&ordering=unit_amount")
+        expected = sorted(self.posts, key=lambda post: (post.total_amount, post.pk))
+        self.assertEqual(ids, [post.pk for post in expected])
+
+    def cursor(self, **changes):
+        next_url = self.api.get("/supply/?page_size=2").json()["next"]
+        encoded = next_url.split("cursor=")[1].split("&")[0]
+        payload = json.loads(base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)))
+        payload.update(changes)
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+    def test_invalid_or_tampered_cursor(self):
+        for cursor in ("not-a-cursor", self.cursor(f="title"), self.cursor(d=False), self.cursor(v={"dt": "yesterday"})):
+            with self.subTest(cursor=cursor):
+                response = self.api.get("/supply/", {"page_size": 2, "cursor": cursor})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {"detail": "잘못된 커서입니다."})
+
+    def test_no_count_query(self):
+        cursor = self.cursor()
+        for params in ({"page_size": 2}, {"page_size": 2, "cursor": cursor}):
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.api.get("/supply/", params).status_code, 200)
+            self.assertTrue(queries.captured_queries)
+            self.assertFalse([q["sql"] for q in queries if "COUNT(" in q["sql"].upper()])
+
+
+class UnitAmountFilterTests(TestCase):
+    """?unit_amount__lte/__gte 와 ?ordering=unit_amount (0원 글, 백필 전 기본값 행 포함)"""
+
+    def setUp(self):
+        cache.clear()
+        author = make_user("author")
+        self.five = make_post(author, total_amount=10000, max_participants=2)   # 5000
+        self.three = make_post(author, total_amount=9000, max_participants=3)   # 3000
+        self.free = make_post(author, total_amount=0, max_participants=2)       # 0
+        self.odd = make_post(author, total_amount=7001, max_participants=2)     # 3501 (올림)
+        self.api = APIClient()
+        self.api.force_authenticate(author)
+
+    def ids(self, **params):
+        response = self.api.get("/supply/", params)
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.json()["results"]]
+
+    def test_range_filters(self):
+        self.assertEqual(sorted(self.ids(unit_amount__lte=3501)), sorted([self.three.pk, self.free.pk, self.odd.pk]))
+        self.assertEqual(sorted(self.ids(unit_amount__gte=3501)), sorted([self.five.pk, self.odd.pk]))
+        self.assertEqual(self.ids(unit_amount__gte=3000, unit_amount__lte=3500), [self.three.pk])
+        self.assertEqual(self.ids(unit_amount__lte=0), [self.free.pk])
+
+    def test_ordering(self):
+        ascending = [self.free.pk, self.three.pk, self.odd.pk, self.five.pk]
+        self.assertEqual(self.ids(ordering="unit_amount"), ascending)
+        self.assertEqual(self.ids(ordering="-unit_amount"), ascending[::-1])
+        self.assertEqual(self.ids(ordering="unit_amount", unit_amount__gte=1), ascending[1:])
+
+    def test_rows_before_backfill(self):
+        # 컬럼 추가 직후의 기존 행은 기본값 0이다. 백필 뒤에는 실제 인당 금액으로 걸러지고 정렬된다.
+        SupplyPost.objects.filter(pk=self.five.pk).update(unit_amount=0)
+        self.assertIn(self.five.pk, self.ids(unit_amount__lte=0))
+        backfill_unit_amount()
+        cache.clear()
+        self.assertEqual(self.ids(unit_amount__lte=0), [self.free.pk])
+        self.assertEqual(self.ids(ordering="-unit_amount")[0], self.five.pk)
+
+
+class SearchTests(TestCase):
+    """?search=: 한 글자 검색어도 단어 안의 글자와 맞고, 제목 일치가 먼저 온다."""
+
+    def setUp(self):
+        cache.clear()
+        author = make_user("author")
+        self.rice = make_post(author, title="햅쌀 나눔")
+        self.ramen = make_post(author, title="라면 공동구매", content="쌀을 조금 나눠요")
+        self.tissue = make_post(author, title="휴지 공동구매", content="두루마리")
+        self.api = APIClient()
+        self.api.force_authenticate(author)
+
+    def search(self, term):
+        response = self.api.get("/supply/", {"search": term})
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.json()["results"]]
+
+    def test_single_character_term(self):
+        self.assertEqual(self.search("쌀"), [self.rice.pk, self.ramen.pk])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(sorted(self.search("공동구매")), sorted([self.ramen.pk, self.tissue.pk]))
+        self.assertEqual(self.search("라면 공동"), [self.ramen.pk])
+        self.assertEqual(self.search("세제"), [])
+
+    def test_update_reindexes(self):
+        self.tissue.title = "휴지와 쌀"
+        self.tissue.save()
+        self.assertIn(self.tissue.pk, self.search("쌀"))
+
+
+class JoinThrottleTests(TestCase):
+    """참여 요청 제한(utils.throttling 토큰 버킷, join.user = 10/min): 버킷이 비면 429 + Retry-After, 시간이 지나면 다시 찬다."""
+    start = 1_000 * 60  # 기간(60초) 경계에 맞춘 시각
+
+    def setUp(self):
+        cache.clear()
+        self.post = make_post(make_user("author"), max_participants=50)
+        self.api = APIClient()
+        self.api.force_authenticate(make_user("joiner"))
+        clock = mock.patch("utils.throttling.time")
+        self.clock = clock.start().time
+        self.addCleanup(clock.stop)
+        self.clock.return_value = self.start
+
+    def join(self):
+        return self.api.post(f"/supply/{self.post.pk}/join/", {}, format="json")
+
+    def test_empty_bucket_returns_429_with_retry_after(self):
+        for _ in range(10):
+            self.assertNotEqual(self.join().status_code, 429)
+        response = self.join()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "6")  # 토큰 하나가 차는 시간 (60초 / 10)
+
+    def test_bucket_refills_over_time(self):
+        for _ in range(10):
+            self.join()
+        self.assertEqual(self.join().status_code, 429)
+
+        self.clock.return_value = self.start + 6  # 토큰 1개 보충
+        self.assertNotEqual(self.join().status_code, 429)
+        self.assertEqual(self.join().status_code, 429)
+
+        self.clock.return_value = self.start + 120  # 다음 기간: 용량까지 다시 참 (용량 이상은 쌓이지 않음)
+        statuses = [self.join().status_code for _ in range(11)]
+        self.assertNotIn(429, statuses[:10])
+        self.assertEqual(statuses[10], 429)
+
+    def test_rejected_requests_do_not_use_tokens(self):
+        for _ in range(10):
+            self.join()
+        for _ in range(5):
+            self.assertEqual(self.join().status_code, 429)
+        self.clock.return_value = self.start + 6
+        self.assertNotEqual(self.join().status_code, 429)
+
+
+class ImagePipelineTests(TestCase):
+    """썸네일 파이프라인(utils.images): 설정 크기별 WebP/JPEG, EXIF 회전 적용 후 메타데이터 제거, 이미지가 아닌 업로드 거절"""
+
+    def setUp(self):
+        cache.clear()
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        override = override_settings(MEDIA_ROOT=root, IMAGE_DERIVATIVE_SIZES={"sm": 120, "md": 300})
+        override.enable()
+        self.addCleanup(override.disable)
+        self.author = make_user("author")
+
+    def photo(self, size=(800, 400)):
+        # 카메라 사진처럼 회전 정보(Orientation=6, 90도)와 기기 정보가 들어 있는 가로 JPEG
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        exif[0x010F] = "TestCam"
+        buffer = io.BytesIO()
+        Image.new("RGB", size, (200, 80, 40)).save(buffer, "JPEG", exif=exif.tobytes())
+        return buffer.getvalue()
+
+    def test_render_sizes_and_strip_exif(self):
+        rendered = render_derivatives(io.BytesIO(self.photo()))
+        self.assertEqual(set(rendered), {"sm", "md"})
+        for size, edge in (("sm", 120), ("md", 300)):
+            for ext, fmt in (("webp", "WEBP"), ("jpeg", "JPEG")):
+                with self.subTest(size=size, ext=ext):
+                    image = Image.open(io.BytesIO(rendered[size][ext]))
+                    self.assertEqual(image.format, fmt)
+                    self.assertEqual(image.size, (edge // 2, edge))  # 회전이 적용된 세로 사진
+                    self.assertEqual(dict(image.getexif()), {})
+                    self.assertNotIn("exif", image.info)
+
+    def test_build_records_derivatives(self):
+        post = make_post(self.author, image=SimpleUploadedFile("photo.jpg", self.photo(), content_type="image/jpeg"))
+        self.assertTrue(supply_images.build(post.pk))
+        post.refresh_from_db()
+        self.assertEqual(post.image_variants["source"], post.image.name)
+        for size in ("sm", "md"):
+            for ext in ("webp", "jpeg"):
+                self.assertTrue(post.image.storage.exists(post.image_variants[size][ext]))
+        self.assertFalse(supply_images.build(post.pk))  # 이미 최신이면 다시 만들지 않는다.
+
+    def test_non_image_upload_is_rejected(self):
+        api = APIClient()
+        api.force_authenticate(self.author)
+        response = api.post("/supply/", {
+            "title": "쌀 나눔", "content": "같이 사요", "total_amount": 10000, "max_participants": 2,
+            "apply_input": "내일", "execute_input": "모레",
+            "image": SimpleUploadedFile("photo.jpg", b"not an image", content_type="image/jpeg"),
+        }, format="multipart")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("image", response.json())
+        self.assertFalse(SupplyPost.objects.exists())
+
+    def test_broken_stored_image_is_marked(self):
+        # 검증을 거치지 않고 저장된 깨진 파일: 재시도하지 않도록 error로 표시하고 원본 URL을 쓴다.
+        post = make_post(self.author, image=SimpleUploadedFile("photo.jpg", b"broken", content_type="image/jpeg"))
+        with self.assertLogs("utils.images", "WARNING"):
+            self.assertTrue(supply_images.build(post.pk))
+        post.refresh_from_db()
+        self.assertEqual(post.image_variants, {"source": post.image.name, "error": True})
+
+
+class AsyncErrorBodyTests(TestCase):
+    """AsyncAPIView 에러 본문이 DRF exception_handler와 같은지"""
+
+    def setUp(self):
+        cache.clear()
+        token = JWTService().post(make_user("async"))["access"]["token"]
+        self.request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def respond(self, exc):
+        class Failing(AsyncAPIView):
+            async def get(self, request):
+                raise exc
+        response = async_to_sync(Failing.as_view())(self.request)
+        return response.status_code, json.loads(response.content)
+
+    def test_field_errors_are_not_wrapped(self):
+        self.assertEqual(self.respond(ValidationError({"title": ["필수 항목입니다."]})), (400, {"title": ["필수 항목입니다."]}))
+        self.assertEqual(self.respond(ValidationError(["잘못된 요청입니다."])), (400, ["잘못된 요청입니다."]))
+
+    def test_plain_errors_are_wrapped(self):
+        self.assertEqual(self.respond(NotFound("글이 존재하지 않아요.")), (404, {"detail": "글이 존재하지 않아요."}))
+
+
+class AsyncJoinCsrfTests(TestCase):
+    """async 뷰도 DRF 뷰처럼 CSRF 검사 없이 Bearer 토큰으로 POST 할 수 있다."""
+
+    def setUp(self):
+        cache.clear()
+        self.post = make_post(make_user("author"))
+        token = JWTService().post(make_user("joiner"))["access"]["token"]
+        self.client = Client(enforce_csrf_checks=True, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def join(self, **headers):
+        return self.client.post(f"/supply/async/{self.post.pk}/join/", {"request_note": "참여합니다"},
+                                content_type="application/json", **headers)
+
+    def test_join_without_csrf_token(self):
+        self.assertEqual(self.join().status_code, 201)
+        self.assertEqual(SupplyJoin.objects.filter(supply=self.post).count(), 1)
+
+    def test_idempotent_join_without_csrf_token(self):
+        first = self.join(HTTP_IDEMPOTENCY_KEY="join-1")
+        again = self.join(HTTP_IDEMPOTENCY_KEY="join-1")
+        self.assertEqual((first.status_code, again.status_code), (201, 201))
+        self.assertEqual(json.loads(first.content), json.loads(again.content))
+        self.assertEqual(SupplyJoin.objects.filter(supply=self.post).count(), 1)
+
+
+class DetailConditionalGetTests(TestCase):
+    """상세 GET: If-None-Match가 맞으면 304, 글이 바뀌면 ETag도 바뀐다."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = make_user("author")
+        self.post = make_post(self.author)
+        self.api = APIClient()
+        self.api.force_authenticate(self.author)
+        self.url = f"/supply/{self.post.pk}/"
+
+    def etag(self):
+        response = self.api.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def test_matching_etag_returns_304(self):
+        etag = self.etag()
+        response = self.api.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_changes_after_update(self):
+        etag = self.etag()
+        with self.captureOnCommitCallbacks(execute=True):  # 응답 캐시 무효화(bump)는 커밋 뒤에 실행된다.
+            self.assertEqual(self.api.patch(self.url, {"title": "쌀 나눔 (수정)"}, format="json").status_code, 200)
+        response = self.api.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["title"], "쌀 나눔 (수정)")
+
+    def test_etag_changes_after_join(self):
+        etag = self.etag()
+        join_supply(make_user("joiner"), self.post.pk)
+        response = self.api.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class UpdateIfMatchTests(TestCase):
+    """수정의 If-Match는 상세 GET 본문의 version으로 만든 강한 검증자와 비교한다."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = make_user("author")
+        self.post = make_post(self.author)
+        self.api = APIClient()
+        self.api.force_authenticate(self.author)
+
+    def version_tag(self):
+        response = self.api.get(f"/supply/{self.post.pk}/")
+        self.assertEqual(response.status_code, 200)
+        return f'"{response.json()["version"]}"'
+
+    def rename(self, title, etag):
+        return self.api.patch(f"/supply/{self.post.pk}/", {"title": title}, format="json", HTTP_IF_MATCH=etag)
+
+    def test_version_tag_is_accepted(self):
+        response = self.rename("쌀 나눔 (수정)", self.version_tag())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(SupplyPost.objects.get(pk=self.post.pk).title, "쌀 나눔 (수정)")
+
+    def test_stale_version_is_rejected(self):
+        etag = self.version_tag()
+        self.assertEqual(self.rename("첫 수정", etag).status_code, 200)
+        self.assertEqual(self.rename("두 번째 수정", etag).status_code, 412)
+        self.assertEqual(SupplyPost.objects.get(pk=self.post.pk).title, "첫 수정")
+
+    def test_join_does_not_invalidate_version(self):
+        # 참여는 상세 GET의 ETag(참여 수 포함)를 바꾸지만 글 버전은 그대로다.
+        etag = self.version_tag()
+        join_supply(make_user("joiner"), self.post.pk)
+        self.assertEqual(self.rename("쌀 나눔 (수정)", etag).status_code, 200)
+
+    def test_weak_or_detail_etag_is_rejected(self):
+        detail_etag = self.api.get(f"/supply/{self.post.pk}/")["ETag"]
+        self.assertEqual(self.rename("수정", f"W/{self.version_tag()}").status_code, 412)
+        self.assertEqual(self.rename("수정", detail_etag).status_code, 412)
+
+
+class CacheBackendListenerTests(TestCase):
+    """CacheBackend: 어느 프로세스에도 구독자가 없는 채널은 발행(현재 값 조회)을 건너뛴다."""
+
+    def setUp(self):
+        cache.clear()
+        self.backend = pubsub.CacheBackend(pubsub.Hub())
+        self.previous, pubsub._backend = pubsub._backend, self.backend
+        self.post = make_post(make_user("author"))
+
+    def tearDown(self):
+        pubsub._backend = self.previous
+
+    def test_no_listener_skips_publish(self):
+        self.assertEqual(pubsub.listening([channel(self.post.pk)]), set())
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            publish_states(self.post.pk)
+        with self.assertNumQueries(0):
+            callbacks[0]()
+        self.assertIsNone(cache.get(f"pubsub:{channel(self.post.pk)}:seq"))
+
+    def test_listener_in_other_process_gets_published(self):
+        self.backend._mark_listening([channel(self.post.pk)])  # 다른 프로세스의 구독자 표시
+        self.assertEqual(pubsub.listening([channel(self.post.pk), "supply:0"]), {channel(self.post.pk)})
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_states(self.post.pk)
+        self.assertEqual(cache.get(f"pubsub:{channel(self.post.pk)}:msg")["id"], self.post.pk)
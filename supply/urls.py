@@ -1,13 +1,16 @@
 from django.urls import path
 from .views import SupplyPostViewSet
 # Comment 뷰가 실제로 있다면 아래 주석 해제:
-from .views import Comment
+from .views import Comment, JoinTicket
+from .async_views import SupplyListAsync, SupplyDetailAsync, SupplyQuoteAsync, SupplyJoinAsync, SupplyStreamAsync
 
 supply_list   = SupplyPostViewSet.as_view({"get": "list", "post": "create"})
 supply_detail = SupplyPostViewSet.as_view({
     "get": "retrieve", "put": "update", "patch": "partial_update", "delete": "destroy"
 })
-supply_join   = SupplyPostViewSet.as_view({"post": "join"})
+# @action 인자(throttle_classes 등)는 라우터처럼 initkwargs로 넘겨야 적용된다.
+supply_join   = SupplyPostViewSet.as_view({"post": "join", "delete": "join_cancel"}, **SupplyPostViewSet.join.kwargs)
+supply_join_queue = SupplyPostViewSet.as_view({"post": "join_queue"}, **SupplyPostViewSet.join_queue.kwargs)
 supply_quote  = SupplyPostViewSet.as_view({"get": "quote"})
 supply_apps   = SupplyPostViewSet.as_view({"get": "applicants"})
 
@@ -16,6 +19,16 @@ urlpatterns = [
     path("", supply_list, name="supply-list"),
     path("<int:pk>/", supply_detail, name="supply-detail"),
     path("<int:pk>/join/", supply_join, name="supply-join"),
+    path("<int:pk>/join/queue/", supply_join_queue, name="supply-join-queue"),
+    path("join/tickets/<str:ticket>/", JoinTicket.as_view(), name="supply-join-ticket"),
     path("<int:pk>/quote/", supply_quote, name="supply-quote"),
+    path("<int:pk>/applicants/", supply_apps, name="supply-applicants"),
     path("comment/", Comment.as_view(), name="supply-comment"),
+
+    # async(ASGI) 버전
+    path("async/", SupplyListAsync.as_view(), name="supply-list-async"),
+    path("async/<int:pk>/", SupplyDetailAsync.as_view(), name="supply-detail-async"),
+    path("async/<int:pk>/quote/", SupplyQuoteAsync.as_view(), name="supply-quote-async"),
+    path("async/<int:pk>/join/", SupplyJoinAsync.as_view(), name="supply-join-async"),
+    path("async/<int:pk>/stream/", SupplyStreamAsync.as_view(), name="supply-stream-async"),
 ]
\ No newline at end of file
@@ -1,27 +1,82 @@
 from django.http import HttpRequest
+from django.db.models import Count, Max
 from rest_framework import viewsets, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
+from rest_framework.exceptions import NotFound
+from django_filters.rest_framework import DjangoFilterBackend
+from utils.search import IndexedSearchFilter
+from utils.cache import cached_response
+from utils.conditional import Validators, conditional_response, make_etag, latest
+from utils.pagination import KeysetPagination
+from utils.renderers import ValuesListMixin
+from utils.fieldsets import SparseFieldset, SparseFieldsMixin, Needs
+from utils.concurrency import VersionedUpdateMixin
+from utils.throttling import UserTokenBucket, IPTokenBucket
+from idempotency.decorators import idempotent
 
-from .models import SupplyPost
+from .models import SupplyPost, SupplyJoin
 from .serializers import (
     SupplyPostCreateSerializer, SupplyPostListSerializer,
     SupplyPostDetailSerializer, SupplyJoinSerializer,
-    CommentSerializer,
+    SupplyJoinMySerializer, CommentSerializer,
+    supply_list_renderer,
 )
-from .services import join_supply
+from .services import join_supply, cancel_join
+from .search import supply_search
+from .admission import enqueue_join, get_ticket, TicketStatus
 
-class SupplyPostViewSet(viewsets.ModelViewSet):
+def supply_detail_validators(pk):
+    """
+    상세 조건부 GET 검증자 (쿼리 1회): 글 버전/수정 시각/상태/참여 수 + 댓글(수, 최신 시각) + 원본 요청글 수정 시각
+    글이 없으면 None
+    """
+    rows = (
+        SupplyPost.objects.filter(pk=pk)
+        .values("version", "updated_at", "status", "joined_count", "request__updated_at")
+        .annotate(comment_count=Count("comment"), last_comment_at=Max("comment__created_at"))
+    )
+    row = next(iter(rows), None)
+    if row is None:
+        return None
+    etag = make_etag(
+        "supply", pk, row["version"], row["updated_at"].isoformat(), row["status"], row["joined_count"],
+        row["comment_count"], row["last_comment_at"], row["request__updated_at"],
+    )
+    return Validators(etag, latest(row["updated_at"], row["last_comment_at"], row["request__updated_at"]))
+
+
+# 희소 필드셋 (?fields= / ?expand=): 직렬화하지 않을 필드의 컬럼/관계는 읽지 않는다.
+supply_list_fields = SparseFieldset(SupplyPostListSerializer, needs={
+    "unit_amount_preview": Needs(only=["unit_amount"]),
+})
+supply_detail_fields = SparseFieldset(SupplyPostDetailSerializer, expandable=["request_card"], needs={
+    "unit_amount_preview": Needs(only=["unit_amount"]),
+    "request_card": Needs(
+        only=["request", "request__id", "request__title", "request__content"], select_related=["request"],
+    ),
+})
+
+
+class ApplicantPagination(KeysetPagination):
+    default_ordering = "joined_at"
+
+
+class SupplyPostViewSet(SparseFieldsMixin, VersionedUpdateMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = SupplyPost.objects.all().select_related("author", "request")
     permission_classes = [IsAuthenticated]
+    list_renderer = supply_list_renderer  # 목록은 values() 빠른 경로
 
-    filter_backends = [SearchFilter, OrderingFilter]
-    search_fields = ["title", "content"]
-    ordering_fields = ["created_at", "apply_deadline", "execute_time"]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, IndexedSearchFilter]
+    filterset_fields = {"unit_amount": ["lte", "gte"], "status": ["exact"]}
+    search_index = supply_search
+    ordering_fields = ["created_at", "apply_deadline", "execute_time", "unit_amount"]
+    cursor_ordering_fields = [*ordering_fields, "search_rank"]
     ordering = ["-created_at"]
+    throttle_scope = None  # 참여 액션만 "join" (utils.throttling)
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -29,6 +84,30 @@ class SupplyPostViewSet(viewsets.ModelViewSet):
         if self.action == "list":
             return SupplyPostListSerializer
         return SupplyPostDetailSerializer
+
+    def get_sparse_fieldset(self):
+        return {"list": supply_list_fields, "retrieve": supply_detail_fields}.get(self.action)
+
+    def list(self, request, *args, **kwargs):
+        return cached_response(
+            request, ["supply", "supply:list"],
+            lambda: super(SupplyPostViewSet, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        # 클라이언트 검증자가 맞으면 304 (응답 캐시 조회/직렬화 생략)
+        return conditional_response(
+            request, supply_detail_validators(kwargs["pk"]),
+            lambda: cached_response(
+                request, ["supply", f"supply:{kwargs['pk']}"],
+                lambda: super(SupplyPostViewSet, self).retrieve(request, *args, **kwargs),
+            ),
+        )
+
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         """
         새 SupplyPost 작성 시 author는 요청한 유저(request.user)로 자동 세팅
@@ -36,24 +115,79 @@ class SupplyPostViewSet(viewsets.ModelViewSet):
         """
         serializer.save(author=self.request.user)
 
-    @action(detail=True, methods=["post"], url_path="join")
+    @action(
+        detail=True, methods=["post"], url_path="join",
+        throttle_classes=[UserTokenBucket, IPTokenBucket], throttle_scope="join",
+    )
+    @idempotent
     def join(self, request, pk=None):
         """선착순 참여 생성"""
         try:
             note = request.data.get("request_note", "")
-            join = join_supply(request.user, pk)
+            join = join_supply(request.user, pk, note)
+        except SupplyPost.DoesNotExist:
+            return Response({"detail": "글이 존재하지 않아요."}, status=status.HTTP_404_NOT_FOUND)
         except ValueError as e:
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(SupplyJoinSerializer(join).data, status=status.HTTP_201_CREATED)
 
+    @join.mapping.delete
+    def join_cancel(self, request, pk=None):
+        """참여 취소 (좌석 반납, 정원이 찼던 글은 다시 OPEN)"""
+        try:
+            cancel_join(request.user, pk)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(
+        detail=True, methods=["post"], url_path="join/queue",
+        throttle_classes=[UserTokenBucket, IPTokenBucket], throttle_scope="join",
+    )
+    @idempotent
+    def join_queue(self, request, pk=None):
+        """대기열 참여: 캐시에 참여 의사만 적재하고 티켓 발급 (결과는 티켓으로 조회)"""
+        note = request.data.get("request_note", "")
+        try:
+            ticket = enqueue_join(request.user, int(pk), note)
+        except SupplyPost.DoesNotExist:
+            return Response({"detail": "글이 존재하지 않아요."}, status=status.HTTP_404_NOT_FOUND)
+        if ticket["status"] == TicketStatus.REJECTED:
+            return Response(ticket, status=status.HTTP_400_BAD_REQUEST)
+        return Response(ticket, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=["get"], url_path="applicants")
+    def applicants(self, request, pk=None):
+        """신청자 목록 (작성자 전용, 신청 순 커서 페이지네이션)"""
+        if not SupplyPost.objects.filter(pk=pk, author=request.user).exists():
+            raise NotFound("글이 존재하지 않아요.")
+        joins = SupplyJoin.objects.filter(supply_id=pk).select_related("user")
+        paginator = ApplicantPagination()
+        page = paginator.paginate_queryset(joins, request)
+        return paginator.get_paginated_response(SupplyJoinMySerializer(page, many=True).data)
+
     @action(detail=True, methods=["get"], url_path="quote")
     def quote(self, request, pk=None):
         """참여 전 인당 금액 미리보기 (계좌 연동은 이후 단계)"""
-        supply = self.get_object()
-        return Response({"unit_amount_preview": supply.unit_amount_preview})
+        unit_amount = self.get_queryset().filter(pk=pk).values_list("unit_amount", flat=True).first()
+        if unit_amount is None:
+            raise NotFound("글이 존재하지 않아요.")
+        return Response({"unit_amount_preview": int(unit_amount)})
+
+class JoinTicket(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request:HttpRequest, ticket, format=None):
+        """대기열 참여 결과 조회 (QUEUED / JOINED / REJECTED)"""
+        data = get_ticket(ticket)
+        if data is None:
+            return Response({"detail": "티켓을 찾을 수 없어요."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(data, status=status.HTTP_200_OK)
 
 class Comment(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserTokenBucket, IPTokenBucket]
+    throttle_scope = "comment"
 
     def post(self, request:HttpRequest, format=None):
         serializer = CommentSerializer(data=request.data, context={'request': request})
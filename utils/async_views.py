@@ -0,0 +1,88 @@
+"""
+네이티브 async 뷰 (ASGI, configs.asgi)
+- DRF APIView는 동기 전용이라, 느린 DB 호출 동안 워커 스레드를 붙잡는다.
+- 이 뷰는 async ORM(aget/acount/async for)으로 읽고, 직렬화는 기존 DRF Serializer를 그대로 쓴다.
+  (직렬화 중 DB 접근이 없도록 select_related/prefetch로 미리 읽어 두어야 한다)
+- 응답 형식(JSON, 에러 {"detail": ...})은 DRF 뷰와 같다.
+- CSRF: DRF APIView.as_view처럼 csrf_exempt. (세션 쿠키가 아니라 Authorization 헤더로 인증)
+"""
+import math
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse, HttpResponseBase
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from accounts.authentication import CachedJWTAuthentication
+
+
+class AsyncAPIView(View):
+    authentication_class = CachedJWTAuthentication
+    renderer = JSONRenderer()
+    throttle_classes = ()  # utils.throttling (동기 캐시 호출이라 스레드에서 실행)
+    throttle_scope = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        handler = getattr(self, request.method.lower(), None)
+        if handler is None:
+            return self.render({"detail": f'Method "{request.method}" not allowed.'}, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+        self.request = Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES])
+        try:
+            await self.authenticate(self.request)
+            if self.throttle_classes:
+                await sync_to_async(self.check_throttles)(self.request)
+            result = await handler(self.request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            # DRF exception_handler와 같은 규칙: dict/list(ValidationError 등)는 그대로, 나머지는 {"detail": ...}
+            data = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+            return self.render(data, exc.status_code, exc)
+        except Http404:
+            return self.render({"detail": "찾을 수 없습니다."}, status.HTTP_404_NOT_FOUND)
+        if isinstance(result, HttpResponseBase):
+            return result  # 이미 만들어진 응답 (idempotency 재생, SSE 스트림 등)
+        data, status_code = result
+        return self.render(data, status_code)
+
+    async def authenticate(self, request):
+        """IsAuthenticated와 같은 규칙: 유효한 토큰이 없으면 401"""
+        authenticator = self.authentication_class()
+        result = await authenticator.aauthenticate(request._request)
+        if result is None:
+            raise exceptions.NotAuthenticated()
+        request.user, request.auth = result
+        request._request.user = request.user
+
+    def check_throttles(self, request):
+        """DRF APIView.check_throttles와 같은 규칙 (가장 긴 대기 시간으로 429)"""
+        waits = []
+        for throttle_class in self.throttle_classes:
+            throttle = throttle_class()
+            if not throttle.allow_request(request, self):
+                waits.append(throttle.wait())
+        if waits:
+            raise exceptions.Throttled(max((wait for wait in waits if wait is not None), default=None))
+
+    def render(self, data, status_code, exc=None):
+        response = HttpResponse(
+            self.renderer.render(data),
+            status=status_code,
+            content_type="application/json",
+        )
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            response["WWW-Authenticate"] = self.authentication_class().authenticate_header(self.request)
+        if isinstance(exc, exceptions.Throttled) and exc.wait is not None:
+            response["Retry-After"] = str(math.ceil(exc.wait))
+        return response
+
+    def filter_queryset(self, queryset):
+        """filter_backends를 DRF GenericAPIView와 같은 순서로 적용 (쿼리셋 구성만, DB 접근 없음)"""
+        for backend in getattr(self, "filter_backends", []):
+            queryset = backend().filter_queryset(self.request, queryset, self)
+        return queryset
@@ -0,0 +1,116 @@
+"""
+버전(세대) 기반 응답 캐시
+- 네임스페이스마다 세대 카운터(gen:<ns>)를 두고, 캐시 키에 세대 값을 넣는다.
+  무효화는 카운터 증가 한 번(bump)으로 끝나며 키 스캔이 필요 없다. (옛 키는 TTL로 소멸)
+  bump는 커밋 뒤에 실행된다. (트랜잭션 안에서 올리면 커밋 전 데이터가 새 세대로 저장될 수 있다)
+- 단일 비행(single-flight): 같은 키의 미스가 몰리면 락을 잡은 한 요청만 다시 계산하고
+  나머지는 잠깐 기다렸다가 그 결과를 읽는다.
+- 적중/미스 카운터는 프로세스 메모리에 쌓는다. (stats())
+"""
+import hashlib
+import threading
+import time
+from collections import Counter
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+GENERATION_TTL = None  # 세대 카운터는 만료시키지 않는다.
+LOCK_TIMEOUT = 10
+WAIT_TIMEOUT = 1.0
+WAIT_INTERVAL = 0.02
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+def stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _gen_key(namespace):
+    return f"gen:{namespace}"
+
+def bump(*namespaces):
+    """네임스페이스 세대를 올려 관련 캐시를 한 번에 무효화 (트랜잭션 안이면 커밋 뒤, 롤백되면 생략)"""
+    transaction.on_commit(lambda: _bump_now(namespaces))
+
+def _bump_now(namespaces):
+    for namespace in namespaces:
+        key = _gen_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 처음 bump하는 경우: 0(기본값) 다음 세대로 시작
+            if not cache.add(key, 1, GENERATION_TTL):
+                cache.incr(key)
+
+def generations(namespaces) -> str:
+    values = cache.get_many([_gen_key(ns) for ns in namespaces])
+    return ".".join(str(values.get(_gen_key(ns), 0)) for ns in namespaces)
+
+
+def get_or_build(namespaces, key: str, builder, timeout=None):
+    """
+    (세대 + key)로 캐시 조회, 없으면 builder()로 만들어 저장.
+    builder가 None을 돌려주면 저장하지 않는다.
+    """
+    timeout = timeout or getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+    full_key = f"resp:{key}:{generations(namespaces)}"
+    value = cache.get(full_key)
+    if value is not None:
+        _count("hit")
+        return value
+
+    lock_key = f"lock:{full_key}"
+    if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+        # 다른 요청이 계산 중: 결과가 올라올 때까지 잠깐 대기
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(WAIT_INTERVAL)
+            value = cache.get(full_key)
+            if value is not None:
+                _count("hit_after_wait")
+                return value
+        _count("wait_timeout")
+        return builder()
+
+    _count("miss")
+    try:
+        value = builder()
+        if value is not None:
+            cache.set(full_key, value, timeout)
+        return value
+    finally:
+        cache.delete(lock_key)
+
+
+def cached_response(request, namespaces, build_response):
+    """
+    GET 응답 캐시. 200 응답의 data만 저장하고 캐시 적중 시 직렬화를 건너뛴다.
+    키: 요청 URL(호스트 + 경로 + 쿼리스트링, next 링크가 호스트를 포함하므로) 해시
+    """
+    def builder():
+        response = build_response()
+        if response.status_code != status.HTTP_200_OK:
+            raise _Uncacheable(response)
+        return response.data
+
+    try:
+        key = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        data = get_or_build(namespaces, key, builder)
+    except _Uncacheable as uncacheable:
+        return uncacheable.response
+    return Response(data, status=status.HTTP_200_OK)
+
+
+class _Uncacheable(Exception):
+    def __init__(self, response):
+        self.response = response
@@ -0,0 +1,102 @@
+"""
+낙관적 동시성 제어 (version 컬럼 + compare-and-swap)
+- VersionedModel을 상속한 모델은 저장할 때마다 version이 1씩 오른다.
+  이미 있는 행을 저장하면 UPDATE ... WHERE pk = ? AND version = <읽은 값> 으로 비교 후 교체하고,
+  그 사이 다른 저장이 있었으면(0행 갱신) VersionConflict(412)를 낸다. 행 잠금은 쓰지 않는다.
+- save(update_fields=...)에는 version과 auto_now 필드(updated_at 등)를 자동으로 더한다.
+- API 수정 요청은 If-Match에 본문의 version으로 만든 강한 검증자 "<version>"을 보낼 수 있다.
+  (상세 GET의 ETag는 댓글/참여 수까지 반영한 약한 검증자라 조건부 GET/304에만 쓴다)
+  행 버전과 다르면 412, 없거나 *이면 같은 요청에서 읽은 버전으로만 비교한다.
+- VersionedUpdateMixin: 바뀐 필드만 save(update_fields=...)로 저장한다.
+  (참여/수명주기처럼 QuerySet.update()로 다른 컬럼을 바꾸는 작업을 덮어쓰지 않는다)
+"""
+from django.db import models
+from django.db.models import F
+from django.db.models.expressions import Combinable
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class VersionConflict(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = '다른 곳에서 먼저 수정되었어요. 새로 불러온 뒤 다시 시도해 주세요.'
+    default_code = 'version_conflict'
+
+
+class VersionedModel(models.Model):
+    version = models.PositiveIntegerField(default=1, editable=False, help_text="저장할 때마다 1 증가 (낙관적 동시성)")
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if not self._state.adding and (update_fields is None or update_fields):
+            if "version" in self.__dict__:
+                self._expected_version = self.version
+                self.version = self.version + 1
+            else:
+                # version을 읽지 않은 인스턴스(only() 등): 비교 없이 증가만
+                self.version = F("version") + 1
+            if update_fields is not None:
+                auto_now = [f.name for f in self._meta.concrete_fields if getattr(f, "auto_now", False)]
+                kwargs["update_fields"] = {*update_fields, "version", *auto_now}
+        try:
+            super().save(*args, **kwargs)
+        except VersionConflict:
+            self.version = self._expected_version
+            raise
+        finally:
+            self.__dict__.pop("_expected_version", None)
+            if isinstance(self.__dict__.get("version"), Combinable):
+                del self.__dict__["version"]  # 다음 접근 때 DB 값을 읽는다.
+
+    def _do_update(self, base_qs, *args, **kwargs):
+        expected = self.__dict__.get("_expected_version")
+        if expected is None:
+            return super()._do_update(base_qs, *args, **kwargs)
+        updated = super()._do_update(base_qs.filter(version=expected), *args, **kwargs)
+        if not updated:
+            raise VersionConflict()
+        return updated
+
+
+def version_etag(version) -> str:
+    """If-Match용 강한 검증자: 행 version만으로 만든다."""
+    return f'"{version}"'
+
+
+def if_match_tags(request):
+    """If-Match의 엔터티 태그 목록 (따옴표 포함 값 그대로). 헤더가 없거나 *이면 None"""
+    header = request.META.get("HTTP_IF_MATCH", "").strip()
+    if not header or header == "*":
+        return None
+    return {tag.strip() for tag in header.split(",") if tag.strip()}
+
+
+def check_if_match(request, instance):
+    """
+    If-Match가 있으면 instance.version의 강한 검증자와 강한 비교를 한다. (W/ 태그는 맞지 않음)
+    다르면 412. 통과하면 instance.version이 클라이언트가 본 버전이므로, 이 값으로 compare-and-swap 하면 된다.
+    """
+    tags = if_match_tags(request)
+    if tags is not None and version_etag(instance.version) not in tags:
+        raise VersionConflict()
+
+
+class VersionedUpdateMixin:
+    """
+    UpdateModelMixin용: If-Match 확인 + 바뀐 필드만 compare-and-swap 저장
+    """
+    def perform_update(self, serializer):
+        instance = serializer.instance
+        check_if_match(self.request, instance)
+        changed = [
+            name for name, value in serializer.validated_data.items()
+            if getattr(instance, name) != value
+        ]
+        if not changed:
+            return
+        for name in changed:
+            setattr(instance, name, serializer.validated_data[name])
+        instance.save(update_fields=changed)
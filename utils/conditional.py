@@ -0,0 +1,50 @@
+"""
+조건부 GET (ETag / Last-Modified → 304)
+- 뷰가 가벼운 쿼리 한 번으로 검증자(수정 시각, 최신 댓글 시각, 참여 수 등)를 읽는다.
+- 클라이언트가 가진 값과 같으면 직렬화/응답 캐시 조회 없이 304를 돌려준다.
+- 검증자는 DB 값에서 만들므로 응답 캐시(utils.cache)의 세대 카운터가 사라져도 유지된다.
+- 수정 요청의 If-Match는 이 ETag가 아니라 행 version만 본다. (utils.concurrency.check_if_match)
+"""
+import hashlib
+from collections import namedtuple
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+
+CACHE_CONTROL = 'private, no-cache'
+
+# etag: make_etag 값, last_modified: datetime|None
+Validators = namedtuple('Validators', ['etag', 'last_modified'])
+
+
+def make_etag(*parts) -> str:
+    # JSON 표현(렌더러/공백)까지 같다고 보장하지 않으므로 약한 ETag
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def conditional_response(request, validators, build_response):
+    """
+    validators: Validators 또는 None(대상 없음 → build_response가 404 등 처리)
+    """
+    if validators is None:
+        return build_response()
+    etag, last_modified = validators.etag, validators.last_modified
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = build_response()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+    response['ETag'] = etag
+    if timestamp is not None:
+        response['Last-Modified'] = http_date(timestamp)
+    response['Cache-Control'] = CACHE_CONTROL
+    return response
+
+
+def latest(*values):
+    """None을 뺀 최댓값 (Last-Modified용)"""
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
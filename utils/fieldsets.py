@@ -0,0 +1,164 @@
+"""
+희소 필드셋 (?fields= / ?expand=)
+- ?fields=id,title,status : 응답에 이 필드만 남긴다.
+- ?expand=request_card    : 무거운 필드(expandable) 중 이것만 포함한다. ?expand= 처럼 비우면 모두 뺀다.
+- 둘 다 없으면 기존 응답 그대로. 모르는 필드 이름은 400.
+- 고른 필드에 필요한 컬럼만 only()로 읽고, 필요한 관계만 select_related/prefetch_related 한다.
+  모델 컬럼, 단일 중첩 시리얼라이저, computed()를 제공하는 필드(ImageVariantsField)는 자동으로 계산하고,
+  그 외(SerializerMethodField, ReadOnlyField 속성, many=True 중첩 등)는 needs에 Needs로 선언해야 한다.
+- 응답 캐시(utils.cache) 키에는 쿼리스트링이 들어가므로 필드 조합마다 따로 캐시된다.
+"""
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+FIELDS_PARAM = 'fields'
+EXPAND_PARAM = 'expand'
+
+
+class Needs:
+    """출력 필드 하나를 만드는 데 필요한 컬럼/관계/집계"""
+    def __init__(self, only=(), select_related=(), prefetch_related=(), annotate=None):
+        self.only = list(only)
+        self.select_related = list(select_related)
+        self.prefetch_related = list(prefetch_related)
+        self.annotate = annotate or {}
+
+
+def _param(request, name):
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+class SparseFieldset:
+    def __init__(self, serializer_class, expandable=(), needs=None):
+        self.serializer_class = serializer_class
+        self.expandable = set(expandable)
+        self.needs = needs or {}
+        self._fields = None
+
+    @property
+    def fields(self):
+        """읽기 가능한 출력 필드 {이름: 필드} (선언 순서)"""
+        if self._fields is None:
+            self._fields = {
+                name: field for name, field in self.serializer_class().fields.items() if not field.write_only
+            }
+        return self._fields
+
+    def select(self, request):
+        """고른 출력 필드 이름 목록(선언 순서) 또는 None(전체)"""
+        fields, expand = _param(request, FIELDS_PARAM), _param(request, EXPAND_PARAM)
+        if fields is None and expand is None:
+            return None
+        unknown = {*(fields or ()), *(expand or ())} - set(self.fields)
+        if unknown:
+            raise ValidationError({FIELDS_PARAM: f"알 수 없는 필드: {', '.join(sorted(unknown))}"})
+        chosen = set(fields) if fields is not None else set(self.fields)
+        if expand is not None:
+            chosen = (chosen - self.expandable) | set(expand)
+        return [name for name in self.fields if name in chosen]
+
+    def apply(self, serializer, fields):
+        """시리얼라이저(또는 many=True 목록)에서 고르지 않은 필드를 뺀다."""
+        if fields is not None:
+            target = getattr(serializer, 'child', serializer)
+            for name in list(target.fields):
+                if name not in fields:
+                    target.fields.pop(name)
+        return serializer
+
+    def queryset(self, queryset, fields, keep=()):
+        """
+        고른 필드에 필요한 것만 읽도록 queryset을 바꾼다.
+        keep: 정렬/커서에 쓰는 필드 (인스턴스 경로에서 지연 로딩되지 않도록 함께 읽음)
+        """
+        if fields is None:
+            return queryset
+        model = queryset.model
+        plan = Needs(only=[model._meta.pk.name])
+        for name in fields:
+            needs = self.needs.get(name) or self._auto_needs(model, name, self.fields[name])
+            plan.only += needs.only
+            plan.select_related += needs.select_related
+            plan.prefetch_related += needs.prefetch_related
+            plan.annotate.update(needs.annotate)
+        for name in keep:
+            try:
+                model._meta.get_field(name.lstrip('-'))
+            except FieldDoesNotExist:
+                continue  # annotate한 값(search_rank 등)
+            plan.only.append(name.lstrip('-'))
+
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if plan.select_related:
+            queryset = queryset.select_related(*dict.fromkeys(plan.select_related))
+        if plan.prefetch_related:
+            queryset = queryset.prefetch_related(*plan.prefetch_related)
+        annotations = {key: value for key, value in plan.annotate.items() if key not in queryset.query.annotations}
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        return queryset.only(*dict.fromkeys(plan.only))
+
+    def _auto_needs(self, model, name, field, prefix=''):
+        if hasattr(field, 'computed'):
+            return Needs(only=[f'{prefix}{column}' for column in field.computed().columns])
+        if isinstance(field, serializers.ListSerializer):
+            raise ImproperlyConfigured(
+                f'{self.serializer_class.__name__}.{name}: many=True 중첩 필드는 needs에 prefetch를 지정해야 합니다.'
+            )
+        try:
+            model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            raise ImproperlyConfigured(
+                f'{self.serializer_class.__name__}.{name}: 모델 컬럼이 아닌 필드는 needs가 필요합니다.'
+            )
+        if not isinstance(field, serializers.BaseSerializer):
+            return Needs(only=[f'{prefix}{field.source}'])
+        # 단일 중첩 시리얼라이저: 관계를 JOIN으로 읽고 하위 필드 컬럼만 고른다.
+        relation = f'{prefix}{field.source}'
+        needs = Needs(only=[relation, f'{relation}__{field.Meta.model._meta.pk.name}'], select_related=[relation])
+        for child_name, child in field.fields.items():
+            if child.write_only:
+                continue
+            child_needs = self._auto_needs(field.Meta.model, f'{name}.{child_name}', child, f'{relation}__')
+            needs.only += child_needs.only
+            needs.select_related += child_needs.select_related
+        return needs
+
+
+class SparseFieldsMixin:
+    """
+    GenericAPIView용: GET 요청에서 ?fields=/?expand=를 시리얼라이저와 queryset에 반영한다.
+    sparse_fieldset(또는 get_sparse_fieldset())이 None이면 아무것도 하지 않는다.
+    """
+    sparse_fieldset = None
+
+    def get_sparse_fieldset(self):
+        return self.sparse_fieldset
+
+    def get_sparse_fields(self):
+        if not hasattr(self, '_sparse_fields'):
+            fieldset = self.get_sparse_fieldset() if self.request.method == 'GET' else None
+            self._sparse_fields = fieldset.select(self.request) if fieldset is not None else None
+        return self._sparse_fields
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        keep = [o for o in queryset.query.order_by if isinstance(o, str)]
+        default_ordering = getattr(self.paginator, 'default_ordering', None)
+        if default_ordering:
+            keep.append(default_ordering)
+        return self.get_sparse_fieldset().queryset(queryset, fields, keep)
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            self.get_sparse_fieldset().apply(serializer, fields)
+        return serializer
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
-from django.db.models import Model
+from django.db.models import Model, Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework.exceptions import NotFound
 
 def format_timestamp_iso(timestamp):
@@ -14,3 +15,18 @@ def get_instance_or_404(model:Model, pk:int, error_message:str):
         return model.objects.get(pk=pk)
     except model.DoesNotExist:
         raise NotFound(detail=error_message)
+
+def subquery_count(queryset, fk_field:str):
+    """
+    바깥 행(pk)을 참조하는 행 수를 상관 서브쿼리로 계산합니다. (없으면 0)
+    여러 관계를 Count()로 JOIN하면 행이 곱해지므로, 카운트마다 서브쿼리를 따로 쓸 때 사용해 주세요.
+    """
+    counted = (
+        queryset
+        .filter(**{fk_field: OuterRef('pk')})
+        .order_by()
+        .values(fk_field)
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
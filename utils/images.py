@@ -0,0 +1,234 @@
+"""
+이미지 파생본(썸네일) 파이프라인
+- 업로드된 원본에서 크기별(IMAGE_DERIVATIVE_SIZES, 긴 변 기준) WebP/JPEG 파생본을 만든다.
+- EXIF 회전을 적용한 뒤 메타데이터 없이 저장한다. (위치정보 등 제거)
+- 큰 JPEG은 draft()로 DCT 단계에서 축소 디코딩하고, 그 외 형식은 thumbnail(reducing_gap)이
+  reduce()로 먼저 정수배 축소하므로 원본 해상도 전체를 메모리에 올리지 않는다.
+- 파생본은 저장 트랜잭션 커밋 후 백그라운드 스레드 풀(IMAGE_PIPELINE_WORKERS)에서 만든다.
+  0이면 웹 프로세스에서는 만들지 않고 `manage.py build_image_derivatives`가 처리한다.
+- 결과는 모델의 JSON 필드에 {"source": 원본 이름, "<size>": {"webp": 이름, "jpeg": 이름}} 로 기록한다.
+  source가 현재 원본과 다르면(교체 직후 등) 파생본이 없는 것으로 보고 원본 URL을 준다.
+"""
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+from rest_framework import serializers
+from utils.cache import bump
+from utils.renderers import Computed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = {"sm": 240, "md": 640, "lg": 1280}
+FORMATS = (("webp", "WEBP", {"quality": 80, "method": 4}), ("jpeg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}))
+
+
+# 디코딩 전에 선언된 해상도로 거부 (압축 폭탄 방지)
+Image.MAX_IMAGE_PIXELS = getattr(settings, "IMAGE_MAX_PIXELS", Image.MAX_IMAGE_PIXELS)
+
+
+def derivative_sizes() -> dict:
+    return getattr(settings, "IMAGE_DERIVATIVE_SIZES", DEFAULT_SIZES)
+
+
+def _open(fp, max_edge):
+    image = Image.open(fp)
+    if image.format == "JPEG":
+        # 필요한 크기 이상인 1/2, 1/4, 1/8 스케일로만 디코딩
+        image.draft("RGB", (max_edge, max_edge))
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+    return image
+
+
+def _flatten(image):
+    """JPEG은 알파가 없으므로 흰 배경에 합성"""
+    if image.mode != "RGBA":
+        return image
+    background = Image.new("RGB", image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel("A"))
+    return background
+
+
+def _encode(image, fmt, options) -> bytes:
+    buffer = io.BytesIO()
+    (_flatten(image) if fmt == "JPEG" else image).save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def render_derivatives(fp, sizes=None):
+    """
+    원본 파일 객체에서 {size: {ext: bytes}}를 만든다. (저장은 하지 않음)
+    큰 크기부터 차례로 줄여 가며 이전 결과를 다음 크기의 입력으로 쓴다.
+    """
+    sizes = sizes or derivative_sizes()
+    ordered = sorted(sizes.items(), key=lambda item: item[1], reverse=True)
+    image = _open(fp, ordered[0][1])
+    rendered = {}
+    for size, edge in ordered:
+        image.thumbnail((edge, edge), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        rendered[size] = {ext: _encode(image, fmt, options) for ext, fmt, options in FORMATS}
+    return rendered
+
+
+def derivative_name(source_name: str, size: str, ext: str) -> str:
+    root, _ = os.path.splitext(source_name)
+    return f"derived/{root}.{size}.{ext}"
+
+
+class ImageDerivatives:
+    """
+    모델 이미지 필드 하나에 대한 파생본 설정
+    - field: 원본 ImageField 이름
+    - variants_field: 결과를 기록할 JSONField 이름
+    - namespaces: pk -> 갱신 후 bump할 응답 캐시 네임스페이스 목록
+    - touch: 기록할 때 함께 현재 시각으로 갱신할 필드 (조건부 GET 검증자용, 예: updated_at)
+    """
+    def __init__(self, model, field: str, variants_field: str, namespaces=None, touch=None):
+        self.model = model
+        self.field = field
+        self.variants_field = variants_field
+        self.namespaces = namespaces or (lambda pk: [])
+        self.touch = touch
+
+    def is_current(self, instance) -> bool:
+        name = getattr(instance, self.field).name
+        return not name or (getattr(instance, self.variants_field) or {}).get("source") == name
+
+    # signals
+    def post_save(self, sender, instance, **kwargs):
+        if self.is_current(instance):
+            return
+        pk = instance.pk
+        transaction.on_commit(lambda: pipeline.submit(self, pk))
+
+    def post_delete(self, sender, instance, **kwargs):
+        if self.variants_field in instance.__dict__:
+            self._delete(getattr(instance, self.field).storage, getattr(instance, self.variants_field) or {})
+
+    def build(self, pk) -> bool:
+        """파생본을 만들어 기록. 그 사이 원본이 바뀌었으면 기록하지 않는다."""
+        instance = self.model.objects.filter(pk=pk).only(self.field, self.variants_field).first()
+        if instance is None or self.is_current(instance):
+            return False
+        file = getattr(instance, self.field)
+        old = getattr(instance, self.variants_field) or {}
+        variants = {"source": file.name}
+        try:
+            with file.open("rb") as fp:
+                rendered = render_derivatives(fp)
+        except (OSError, Image.DecompressionBombError, ValueError):
+            # 깨진/지나치게 큰 이미지: 재시도하지 않도록 표시만 하고 원본을 그대로 쓴다.
+            logger.warning("image derivatives failed for %s pk=%s", self.model.__name__, pk, exc_info=True)
+            variants["error"] = True
+            rendered = {}
+        storage = file.storage
+        for size, encoded in rendered.items():
+            variants[size] = {
+                ext: storage.save(derivative_name(file.name, size, ext), ContentFile(data))
+                for ext, data in encoded.items()
+            }
+        values = {self.variants_field: variants}
+        if self.touch:
+            values[self.touch] = timezone.now()
+        updated = self.model.objects.filter(pk=pk, **{self.field: file.name}).update(**values)
+        self._delete(storage, variants if not updated else old)
+        if updated:
+            bump(*self.namespaces(pk))
+        return bool(updated)
+
+    @staticmethod
+    def _delete(storage, variants):
+        for size, names in variants.items():
+            if isinstance(names, dict):
+                for name in names.values():
+                    storage.delete(name)
+
+    def pending(self):
+        """파생본이 없거나 원본과 맞지 않는 행 (백필/재시도용)"""
+        from django.db.models import F, Q
+        from django.db.models.fields.json import KT
+        return (
+            self.model.objects
+            .exclude(**{f"{self.field}__isnull": True}).exclude(**{self.field: ""})
+            .alias(_source=KT(f"{self.variants_field}__source"))
+            .filter(Q(_source__isnull=True) | ~Q(_source=F(self.field)))
+        )
+
+    def urls(self, instance, request=None):
+        """{"original": url, "<size>": {"webp": url, "jpeg": url}} / 이미지가 없으면 None"""
+        absolute = request.build_absolute_uri if request is not None else (lambda url: url)
+        return self.urls_from_values(getattr(instance, self.field).name, getattr(instance, self.variants_field), absolute)
+
+    def urls_from_values(self, name, variants, absolute):
+        """urls()와 같은 결과를 컬럼 값(원본 이름, 파생본 JSON)만으로 만든다. (utils.renderers 목록 경로용)"""
+        if not name:
+            return None
+        storage = self.model._meta.get_field(self.field).storage
+        result = {"original": absolute(storage.url(name))}
+        variants = variants or {}
+        current = variants.get("source") == name
+        for size in derivative_sizes():
+            names = variants.get(size) if current else None
+            if names:
+                result[size] = {ext: absolute(storage.url(name)) for ext, name in names.items()}
+            else:
+                # 아직 만들어지지 않았으면 원본으로 대체
+                result[size] = {ext: result["original"] for ext, _, _ in FORMATS}
+        return result
+
+
+class ImageVariantsField(serializers.Field):
+    """파생본 URL 묶음 (읽기 전용). source는 인스턴스 전체('*')"""
+    def __init__(self, derivatives: ImageDerivatives, **kwargs):
+        self.derivatives = derivatives
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        return self.derivatives.urls(instance, self.context.get("request"))
+
+    def computed(self):
+        """utils.renderers.ValuesRenderer overrides용 (values() 행에서 같은 결과)"""
+        derivatives = self.derivatives
+        field, variants_field = derivatives.field, derivatives.variants_field
+        return Computed(
+            [field, variants_field],
+            lambda row, context: derivatives.urls_from_values(row[field], row[variants_field], context.absolute),
+        )
+
+
+class ImagePipeline:
+    """파생본 생성 작업을 돌리는 스레드 풀 (Pillow는 디코딩/리사이즈/인코딩 중 GIL을 놓는다)"""
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, derivatives: ImageDerivatives, pk):
+        if self.workers == 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="image-pipeline")
+        return self._executor.submit(self._run, derivatives, pk)
+
+    @staticmethod
+    def _run(derivatives, pk):
+        try:
+            return derivatives.build(pk)
+        except Exception:
+            logger.exception("image pipeline failed for %s pk=%s", derivatives.model.__name__, pk)
+        finally:
+            close_old_connections()
+
+
+pipeline = ImagePipeline(workers=getattr(settings, "IMAGE_PIPELINE_WORKERS", 2))
@@ -0,0 +1,137 @@
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션
+    - 정렬 키 (field, id) 기준으로 "마지막 행 다음"을 WHERE로 찾는다. OFFSET/COUNT(*) 없음.
+    - 정렬 필드는 queryset의 첫 번째 order_by를 따른다. (OrderingFilter 결과 그대로)
+      ordering_fields / cursor_ordering_fields 에 없는 정렬이면 default_ordering을 쓴다.
+    - 커서는 정렬 필드/방향/마지막 값/id를 담은 불투명 문자열(base64)
+    응답: {"next": url|null, "results": [...]}
+    """
+    page_size = api_settings.PAGE_SIZE or 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    default_ordering = '-created_at'
+    invalid_cursor_message = '잘못된 커서입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self._finish_page(list(self._page_queryset(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """비동기 뷰용 (async ORM으로 한 페이지를 읽는다)"""
+        return self._finish_page([row async for row in self._page_queryset(queryset, request, view)])
+
+    def _page_queryset(self, queryset, request, view):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        field, descending = self.get_key(queryset, view)
+        self._key = field, descending
+        op = 'lt' if descending else 'gt'
+        queryset = queryset.order_by(f'-{field}' if descending else field, '-pk' if descending else 'pk')
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            if cursor['f'] != field or cursor['d'] != descending:
+                raise NotFound(self.invalid_cursor_message)
+            value = self._load(cursor['v'])
+            queryset = queryset.filter(
+                Q(**{f'{field}__{op}': value}) | Q(**{field: value, f'pk__{op}': cursor['pk']})
+            )
+        return queryset[:self.page_size + 1]
+
+    def _finish_page(self, rows):
+        has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_cursor = self.encode_cursor(*self._key, rows[-1]) if has_next else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_key(self, queryset, view):
+        allowed = set(getattr(view, 'cursor_ordering_fields', None) or getattr(view, 'ordering_fields', None) or [])
+        allowed.add(self.default_ordering.lstrip('-'))
+        ordering = [o for o in queryset.query.order_by if isinstance(o, str)]
+        key = ordering[0] if ordering else self.default_ordering
+        if key.lstrip('-') not in allowed:
+            key = self.default_ordering
+        return key.lstrip('-'), key.startswith('-')
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    # cursor encoding
+    def encode_cursor(self, field, descending, row):
+        if isinstance(row, dict):
+            value, pk = row[field], row.get('pk', row.get('id'))
+        else:
+            value, pk = getattr(row, field), row.pk
+        payload = json.dumps({'f': field, 'd': descending, 'v': self._dump(value), 'pk': pk}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            cursor = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            return {'f': cursor['f'], 'd': bool(cursor['d']), 'v': cursor['v'], 'pk': cursor['pk']}
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _dump(value):
+        if isinstance(value, datetime):
+            return {'dt': value.isoformat()}
+        if isinstance(value, Decimal):
+            return {'dec': str(value)}
+        return value
+
+    def _load(self, value):
+        if isinstance(value, dict):
+            if 'dt' in value:
+                parsed = parse_datetime(value['dt'])
+                if parsed is None:
+                    raise NotFound(self.invalid_cursor_message)
+                return parsed
+            if 'dec' in value:
+                try:
+                    return Decimal(value['dec'])
+                except InvalidOperation:
+                    raise NotFound(self.invalid_cursor_message)
+            raise NotFound(self.invalid_cursor_message)
+        return value
@@ -0,0 +1,236 @@
+"""
+프로세스 내 pub/sub (SSE 실시간 알림용)
+- Hub: 채널별 구독자에게 메시지를 나눠 준다.
+  구독자는 마지막 메시지 하나만 들고 있다. (상태 스냅숏 전용. 느린 클라이언트 앞에 메시지가 쌓이지 않음)
+  deliver는 어느 스레드에서 불러도 된다. 구독자의 이벤트 루프마다 call_soon_threadsafe 한 번으로 넘긴다.
+- 백엔드(settings.PUBSUB_BACKEND)가 워커 사이 전달을 맡는다.
+  LocalBackend : 같은 프로세스 구독자에게만 (기본, 단일 워커)
+  CacheBackend : 공유 캐시(Redis/Memcached)에 채널별 순번과 마지막 메시지를 쓰고,
+                 구독자가 있는 프로세스가 PUBSUB_POLL_INTERVAL마다 순번을 확인해 전달한다.
+                 구독자가 있는 프로세스는 채널별 표시 키를 TTL로 계속 갱신하고, 발행하는 쪽은 표시 키가 없으면 건너뛴다.
+                 (LocMemCache는 프로세스마다 따로라 여러 워커에서는 의미가 없다)
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    __slots__ = ("channel", "loop", "_message", "_event")
+
+    def __init__(self, channel, loop):
+        self.channel = channel
+        self.loop = loop
+        self._message = None
+        self._event = asyncio.Event()
+
+    def _deliver(self, message):
+        self._message = message
+        self._event.set()
+
+    async def get(self, timeout):
+        """다음 메시지. timeout(초) 동안 없으면 None"""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._event.clear()
+        message, self._message = self._message, None
+        return message
+
+
+class Hub:
+    def __init__(self):
+        self._channels = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel) -> Subscription:
+        subscription = Subscription(channel, asyncio.get_running_loop())
+        with self._lock:
+            self._channels[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def has_subscribers(self, channel) -> bool:
+        return channel in self._channels
+
+    def channels(self) -> list:
+        with self._lock:
+            return list(self._channels)
+
+    def count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._channels.values())
+
+    def deliver(self, channel, message):
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        by_loop = defaultdict(list)
+        for subscription in subscribers:
+            by_loop[subscription.loop].append(subscription)
+        for loop, group in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver_all, group, message)
+            except RuntimeError:
+                pass  # 루프가 이미 닫힘 (종료 중인 워커)
+
+
+def _deliver_all(subscriptions, message):
+    for subscription in subscriptions:
+        subscription._deliver(message)
+
+
+class LocalBackend:
+    def __init__(self, hub):
+        self.hub = hub
+
+    def publish(self, channel, message):
+        self.hub.deliver(channel, message)
+
+    def has_listeners(self, channel) -> bool:
+        return bool(self.listening([channel]))
+
+    def listening(self, channels) -> set:
+        """channels 중 구독자가 있는 채널"""
+        return {channel for channel in channels if self.hub.has_subscribers(channel)}
+
+    async def subscribed(self, channel):
+        """구독이 생길 때마다 호출. 이 뒤에 발행된 메시지는 구독자에게 전달되어야 한다."""
+
+
+class CacheBackend(LocalBackend):
+    """
+    pubsub:<channel>:seq  발행 순번 (incr)
+    pubsub:<channel>:msg  마지막 메시지
+    pubsub:<channel>:on   구독자 있음 표시. 구독자가 있는 프로세스가 listener_ttl의 1/3마다 갱신한다.
+                          (프로세스가 죽으면 listener_ttl 뒤 사라짐. 그 사이 발행은 받는 쪽이 없을 뿐이다)
+    순번이 바뀐 채널만 마지막 메시지를 읽어 전달한다. (중간 메시지는 건너뛸 수 있음 → 상태 스냅숏 전용)
+    """
+    timeout = 3600
+    listener_ttl = 30
+
+    def __init__(self, hub):
+        super().__init__(hub)
+        self.interval = getattr(settings, "PUBSUB_POLL_INTERVAL", 0.5)
+        self._seen = {}  # 채널 → 마지막으로 본 순번
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def publish(self, channel, message):
+        cache.set(f"pubsub:{channel}:msg", message, self.timeout)
+        seq_key = f"pubsub:{channel}:seq"
+        try:
+            cache.incr(seq_key)
+        except ValueError:
+            if not cache.add(seq_key, 1, self.timeout):
+                cache.incr(seq_key)
+
+    def listening(self, channels) -> set:
+        # 다른 프로세스의 구독자는 표시 키로 안다.
+        keys = {f"pubsub:{channel}:on": channel for channel in channels}
+        return {keys[key] for key in cache.get_many(list(keys))}
+
+    def _mark_listening(self, channels):
+        cache.set_many({f"pubsub:{channel}:on": 1 for channel in channels}, self.listener_ttl)
+
+    async def subscribed(self, channel):
+        # 표시 키를 먼저 쓴다. (구독자는 이 뒤에 현재 값을 읽으므로, 표시를 못 본 발행의 변경도 현재 값에 들어 있다)
+        await cache.aset(f"pubsub:{channel}:on", 1, self.listener_ttl)
+        # 구독 시점 순번을 기준으로 잡는다. (구독자는 이 뒤에 현재 값을 읽으므로 사이에 빠지는 메시지가 없다)
+        seq = await cache.aget(f"pubsub:{channel}:seq")
+        with self._lock:
+            self._seen.setdefault(channel, seq)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pubsub-cache-poller", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        marked = time.monotonic()
+        while True:
+            time.sleep(self.interval)
+            try:
+                if time.monotonic() - marked >= self.listener_ttl / 3:
+                    marked = time.monotonic()
+                    self._mark_listening(self.hub.channels())
+                self.poll()
+            except Exception:
+                logger.exception("pubsub cache poll failed")
+
+    def poll(self):
+        with self._lock:
+            channels = set(self.hub.channels())
+            for channel in [channel for channel in self._seen if channel not in channels]:
+                del self._seen[channel]
+            channels = [channel for channel in channels if channel in self._seen]
+        if not channels:
+            return
+        seqs = cache.get_many([f"pubsub:{channel}:seq" for channel in channels])
+        changed = []
+        with self._lock:
+            for channel in channels:
+                seq = seqs.get(f"pubsub:{channel}:seq")
+                if channel in self._seen and seq != self._seen[channel]:
+                    self._seen[channel] = seq
+                    changed.append(channel)
+        if changed:
+            messages = cache.get_many([f"pubsub:{channel}:msg" for channel in changed])
+            for channel in changed:
+                message = messages.get(f"pubsub:{channel}:msg")
+                if message is not None:
+                    self.hub.deliver(channel, message)
+
+
+hub = Hub()
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = import_string(getattr(settings, "PUBSUB_BACKEND", "utils.pubsub.LocalBackend"))(hub)
+    return _backend
+
+
+def publish(channel, message):
+    get_backend().publish(channel, message)
+
+
+def has_listeners(channel) -> bool:
+    return get_backend().has_listeners(channel)
+
+
+def listening(channels) -> set:
+    """channels 중 구독자가 있는(어느 프로세스든) 채널. 없으면 발행을 건너뛸 수 있다."""
+    return get_backend().listening(channels)
+
+
+async def subscribe(channel) -> Subscription:
+    """끝나면 반드시 unsubscribe. 이 뒤에 발행된 메시지는 빠짐없이(마지막 것은 반드시) 받는다."""
+    subscription = hub.subscribe(channel)
+    try:
+        await get_backend().subscribed(channel)
+    except BaseException:
+        hub.unsubscribe(subscription)
+        raise
+    return subscription
+
+
+def unsubscribe(subscription):
+    hub.unsubscribe(subscription)
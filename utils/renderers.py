@@ -0,0 +1,181 @@
+"""
+목록 빠른 경로: ModelSerializer 대신 .values() 행(dict)에서 바로 응답 데이터를 만든다.
+- 시리얼라이저 클래스의 필드 선언을 처음 한 번 읽어 (출력 키, 변환 함수) 목록과 values() 컬럼으로 컴파일한다.
+- 변환 결과는 DRF 필드와 같아야 한다. (응답 JSON 바이트가 같음. supply/Request tests의 ListRendererTests로 확인)
+  문자/선택/정수는 값 그대로, 날짜시간은 현재 시간대 ISO 8601, 파일은 storage.url + build_absolute_uri.
+  그 외 컬럼 필드는 해당 DRF 필드의 to_representation을 그대로 호출한다.
+- 모델 컬럼이 아닌 필드(ReadOnlyField 속성, SerializerMethodField 등)는 overrides에
+  {출력 키: Computed(컬럼 목록, 함수)}로 지정해야 한다. 필드가 computed()를 제공하면 그것을 쓴다.
+"""
+from types import SimpleNamespace
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.utils.encoding import is_protected_type
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+class Computed:
+    """
+    모델 컬럼이 아닌 출력 필드
+    - columns: values()에 추가할 경로
+    - func(row, context): row는 values() dict, context는 RenderContext
+    """
+    def __init__(self, columns, func):
+        self.columns = list(columns)
+        self.func = func
+
+
+class RenderContext:
+    """렌더링 1회 동안 고정되는 값 (요청, 시간대)"""
+    def __init__(self, request=None):
+        self.request = request
+        self.absolute = request.build_absolute_uri if request is not None else (lambda url: url)
+        self._timezones = {}
+
+    def timezone(self, field):
+        # DRF DateTimeField와 같은 규칙: 필드 timezone → 현재 시간대
+        key = id(field)
+        if key not in self._timezones:
+            self._timezones[key] = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+        return self._timezones[key]
+
+
+class ValuesRenderer:
+    def __init__(self, serializer_class, overrides=None):
+        self.serializer_class = serializer_class
+        self.overrides = overrides or {}
+        self._compiled = None
+
+    # compile
+    @property
+    def compiled(self):
+        """[(출력 키, 변환 함수, 필요한 컬럼 목록)]"""
+        if self._compiled is None:
+            self._compiled = self._compile(self.serializer_class(), '', self.overrides)
+        return self._compiled
+
+    @property
+    def columns(self):
+        return self.columns_for(None)
+
+    def columns_for(self, fields):
+        """fields(출력 키 목록, None이면 전체)에 필요한 values() 컬럼"""
+        return list(dict.fromkeys(
+            column for name, _, columns in self.compiled
+            if fields is None or name in fields
+            for column in columns
+        ))
+
+    def _compile(self, serializer, prefix, overrides):
+        model = serializer.Meta.model
+        items = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if name in overrides or hasattr(field, 'computed'):
+                computed = overrides[name] if name in overrides else field.computed()
+                items.append((name, computed.func, computed.columns))
+            elif isinstance(field, serializers.BaseSerializer):
+                items.append((name, *self._nested(field, f'{prefix}{field.source}__')))
+            else:
+                column = f'{prefix}{field.source}'
+                try:
+                    model_field = model._meta.get_field(field.source)
+                except FieldDoesNotExist:
+                    raise ImproperlyConfigured(
+                        f'{self.serializer_class.__name__}.{name}: 모델 컬럼이 아닌 필드는 overrides가 필요합니다.'
+                    )
+                items.append((name, self._column(field, model_field, column), [column]))
+        return items
+
+    def _nested(self, serializer, prefix):
+        model = serializer.Meta.model
+        pk_column = f'{prefix}{model._meta.pk.attname}'
+        items = self._compile(serializer, prefix, {})
+        columns = [pk_column, *(column for _, _, cols in items for column in cols)]
+
+        def convert(row, context):
+            if row[pk_column] is None:
+                return None
+            return {name: func(row, context) for name, func, _ in items}
+        return convert, columns
+
+    def _column(self, field, model_field, column):
+        convert = self._converter(field, model_field)
+
+        def get(row, context):
+            value = row[column]
+            if value is None:
+                return None
+            return convert(value, context)
+        return get
+
+    @staticmethod
+    def _converter(field, model_field):
+        if isinstance(field, serializers.DateTimeField):
+            if getattr(field, 'format', api_settings.DATETIME_FORMAT) != ISO_8601:
+                return lambda value, context: field.to_representation(value)
+
+            def datetime_iso(value, context):
+                tz = context.timezone(field)
+                if tz is not None:
+                    value = value.astimezone(tz)
+                    text = value.isoformat()
+                    return text[:-6] + 'Z' if text.endswith('+00:00') else text
+                return field.to_representation(value)
+            return datetime_iso
+        if isinstance(field, serializers.FileField):
+            storage = model_field.storage
+            use_url = getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL)
+
+            def file_url(value, context):
+                if not value:
+                    return None
+                return context.absolute(storage.url(value)) if use_url else value
+            return file_url
+        if isinstance(field, serializers.ChoiceField):
+            mapping = field.choice_strings_to_values
+            return lambda value, context: value if value == '' else mapping.get(str(value), value)
+        if isinstance(field, serializers.CharField):
+            return lambda value, context: value if type(value) is str else str(value)
+        if isinstance(field, serializers.IntegerField):
+            return lambda value, context: value if type(value) is int else int(value)
+        if isinstance(field, serializers.ModelField):
+            # ModelField는 인스턴스를 받으므로 속성 하나만 가진 객체로 대신한다.
+            attname = model_field.attname
+            return lambda value, context: value if is_protected_type(value) else \
+                model_field.value_to_string(SimpleNamespace(**{attname: value}))
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            return lambda value, context: value
+        return lambda value, context: field.to_representation(value)
+
+    # render
+    def values(self, queryset, fields=None, keep=()):
+        """
+        queryset.values(...)로 바꾼다. 정렬 필드와 pk도 함께 읽는다. (키셋 커서용)
+        fields: 출력 키 목록(utils.fieldsets). 고른 필드의 컬럼만 읽는다.
+        keep: 함께 읽을 필드 (정렬이 없을 때 페이지네이터가 쓰는 default_ordering 등)
+        """
+        ordering = [o.lstrip('-') for o in [*queryset.query.order_by, *keep] if isinstance(o, str)]
+        return queryset.values(*dict.fromkeys([*self.columns_for(fields), *ordering, 'pk']))
+
+    def render(self, rows, request=None, fields=None):
+        items = [(name, func) for name, func, _ in self.compiled if fields is None or name in fields]
+        context = RenderContext(request)
+        return [{name: func(row, context) for name, func in items} for row in rows]
+
+
+class ValuesListMixin:
+    """GenericAPIView 목록(list)을 list_renderer(ValuesRenderer)로 만든다. 필터/정렬/페이지네이션은 그대로"""
+    list_renderer = None
+
+    def list(self, request, *args, **kwargs):
+        # ?fields= (utils.fieldsets.SparseFieldsMixin)가 있으면 고른 필드의 컬럼만 읽는다.
+        fields = self.get_sparse_fields() if hasattr(self, 'get_sparse_fields') else None
+        keep = [getattr(self.paginator, 'default_ordering', None)]
+        queryset = self.list_renderer.values(self.filter_queryset(self.get_queryset()), fields, keep)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(self.list_renderer.render(queryset, request, fields))
+        return self.get_paginated_response(self.list_renderer.render(page, request, fields))
@@ -0,0 +1,164 @@
+"""
+검색 엔진 레이어
+- 토큰화: 공백/기호로 단어를 나눈 뒤 문자 bigram(한 글자 단어는 그대로). 한국어 조사/어미가 붙어도 부분 일치가 된다.
+- 색인에는 bigram과 함께 글자 하나(unigram)도 넣는다. 한 글자 검색어("쌀")가 "햅쌀", "쌀을"에도 걸리도록
+- 검색 문서(search_document): 모델에 토큰을 공백으로 이어 저장. 제목은 가중치만큼 반복한다.
+- Postgres: to_tsvector('simple', search_document) GIN 인덱스 + ts_rank 정렬
+- 그 외(SQLite 등): 토큰 테이블(역색인)에서 모든 bigram을 가진 행만 고르고 가중치 합으로 정렬
+"""
+import re
+from collections import Counter
+from django.db import connection
+from django.db.models import Sum, OuterRef, Subquery, Count, IntegerField, FloatField, BooleanField
+from django.db.models.functions import Coalesce
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import BaseFilterBackend
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def bigrams(text: str) -> list:
+    tokens = []
+    for word in _WORD_RE.findall((text or "").lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def index_tokens(text: str) -> list:
+    """색인용 토큰: 단어마다 글자 unigram + bigram (검색어는 bigrams로 나눈다)"""
+    tokens = []
+    for word in _WORD_RE.findall((text or "").lower()):
+        tokens.extend(word)
+        if len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def is_postgres() -> bool:
+    return connection.vendor == "postgresql"
+
+
+class SearchIndex:
+    """
+    모델 하나에 대한 검색 색인 설정
+    - fields: {필드명: 가중치}
+    - token_model: 역색인 테이블 (필드: token, weight, <token_fk>)
+    """
+    def __init__(self, model, token_model, fields: dict, token_fk: str):
+        self.model = model
+        self.token_model = token_model
+        self.fields = fields
+        self.token_fk = token_fk
+
+    def build_document(self, instance) -> str:
+        tokens = []
+        for field, weight in self.fields.items():
+            tokens.extend(index_tokens(getattr(instance, field, "")) * weight)
+        return " ".join(tokens)
+
+    def _token_rows(self, instance):
+        weights = Counter(instance.search_document.split())
+        return [
+            self.token_model(**{self.token_fk: instance}, token=token, weight=weight)
+            for token, weight in weights.items()
+        ]
+
+    def sync_tokens(self, instances):
+        """역색인 테이블 갱신 (Postgres는 GIN 인덱스를 쓰므로 생략)"""
+        if is_postgres():
+            return
+        instances = list(instances)
+        self.token_model.objects.filter(**{f"{self.token_fk}__in": instances}).delete()
+        self.token_model.objects.bulk_create(
+            [row for instance in instances for row in self._token_rows(instance)],
+            batch_size=1000,
+        )
+
+    # signals
+    def pre_save(self, sender, instance, update_fields=None, **kwargs):
+        if update_fields is not None and not set(self.fields) & set(update_fields):
+            return
+        instance.search_document = self.build_document(instance)
+        instance._search_dirty = True
+
+    def post_save(self, sender, instance, update_fields=None, **kwargs):
+        if not getattr(instance, "_search_dirty", False):
+            return
+        instance._search_dirty = False
+        if update_fields is not None and "search_document" not in update_fields:
+            self.model.objects.filter(pk=instance.pk).update(search_document=instance.search_document)
+        self.sync_tokens([instance])
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """전체 재색인 (백필용). 처리 건수 반환"""
+        done = 0
+        last_pk = None
+        while True:
+            qs = self.model.objects.order_by("pk").only(*self.fields)
+            if last_pk is not None:
+                qs = qs.filter(pk__gt=last_pk)
+            batch = list(qs[:batch_size])
+            if not batch:
+                return done
+            for instance in batch:
+                instance.search_document = self.build_document(instance)
+            self.model.objects.bulk_update(batch, ["search_document"])
+            self.sync_tokens(batch)
+            done += len(batch)
+            last_pk = batch[-1].pk
+
+    def search(self, queryset, term: str):
+        """term의 모든 bigram을 포함하는 행만 남기고 search_rank를 붙인다."""
+        tokens = list(dict.fromkeys(bigrams(term)))
+        if not tokens:
+            return queryset
+        if is_postgres():
+            table = queryset.model._meta.db_table
+            vector = f"to_tsvector('simple', \"{table}\".\"search_document\")"
+            query = " & ".join(tokens)
+            return queryset.alias(
+                search_match=RawSQL(f"{vector} @@ to_tsquery('simple', %s)", (query,), output_field=BooleanField()),
+            ).filter(search_match=True).annotate(
+                search_rank=RawSQL(f"ts_rank({vector}, to_tsquery('simple', %s))", (query,), output_field=FloatField()),
+            )
+        matched = (
+            self.token_model.objects
+            .filter(token__in=tokens)
+            .values(self.token_fk)
+            .annotate(hits=Count("id"))
+            .filter(hits=len(tokens))
+            .values(self.token_fk)
+        )
+        rank = (
+            self.token_model.objects
+            .filter(**{self.token_fk: OuterRef("pk")}, token__in=tokens)
+            .order_by()
+            .values(self.token_fk)
+            .annotate(rank=Sum("weight"))
+            .values("rank")
+        )
+        return queryset.filter(pk__in=Subquery(matched)).annotate(
+            search_rank=Coalesce(Subquery(rank, output_field=IntegerField()), 0),
+        )
+
+
+class IndexedSearchFilter(BaseFilterBackend):
+    """
+    ?search= 검색. 뷰의 search_index(SearchIndex)를 사용한다.
+    ?ordering= 이 없으면 검색 순위(search_rank) 순으로 정렬한다.
+    OrderingFilter 뒤에 두세요.
+    """
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, "").strip()
+        search_index = getattr(view, "search_index", None)
+        if not term or search_index is None:
+            return queryset
+        queryset = search_index.search(queryset, term)
+        if "search_rank" not in queryset.query.annotations or request.query_params.get("ordering"):
+            return queryset
+        return queryset.order_by("-search_rank", *queryset.query.order_by)
@@ -0,0 +1,73 @@
+"""
+테스트 도구
+- 쿼리 예산(query budget): 뷰/서비스가 행 수와 무관하게 고정된 쿼리 수 안에서 끝나는지 확인할 때 사용해 주세요.
+- ValuesRendererMixin: 목록 빠른 경로(utils.renderers.ValuesRenderer)가 DRF 시리얼라이저와 같은 JSON을 내는지 확인
+
+    with query_budget(2):
+        client.get('/request/mine/')
+
+    class MyTests(QueryBudgetMixin, APITestCase):
+        def test_list(self):
+            self.assertConstantQueries(
+                budget=1,
+                seed=lambda n: make_tasks(n),
+                call=lambda: self.client.get('/request/'),
+                sizes=(1, 50),
+            )
+"""
+from contextlib import contextmanager
+from django.db import connections, DEFAULT_DB_ALIAS
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+
+@contextmanager
+def query_budget(budget: int, using: str = DEFAULT_DB_ALIAS):
+    """블록 안에서 실행된 쿼리가 budget을 넘으면 AssertionError (실행된 SQL 목록 포함)"""
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+    executed = len(context.captured_queries)
+    if executed > budget:
+        sqls = "\n".join(
+            f"{i}. {query['sql']}" for i, query in enumerate(context.captured_queries, start=1)
+        )
+        raise AssertionError(f"{executed} queries executed, budget is {budget}:\n{sqls}")
+
+
+class QueryBudgetMixin:
+    """TestCase용: 행 수를 바꿔 가며 같은 쿼리 예산 안에 드는지 검사"""
+
+    def assertQueryBudget(self, budget: int, func, *args, using: str = DEFAULT_DB_ALIAS, **kwargs):
+        with query_budget(budget, using=using):
+            return func(*args, **kwargs)
+
+    def assertConstantQueries(self, budget: int, seed, call, sizes=(1, 50), using: str = DEFAULT_DB_ALIAS):
+        """
+        seed(n): 행이 n개가 되도록 데이터 준비 (누적 호출됨)
+        call(): 검사할 요청/함수
+        """
+        for size in sizes:
+            seed(size)
+            with self.subTest(rows=size):
+                self.assertQueryBudget(budget, call, using=using)
+
+
+class ValuesRendererMixin:
+    """TestCase용: ValuesRenderer 출력과 시리얼라이저 출력을 응답 JSON 바이트 단위로 비교"""
+
+    def assertRendersLikeSerializer(self, list_renderer, queryset, fields=None):
+        """queryset 전체 행을 pk 순으로 비교. fields는 ?fields= 출력 키 목록 (None이면 전체)"""
+        request = Request(RequestFactory().get('/'))
+        queryset = queryset.order_by('pk')
+        instances = list(queryset)
+        self.assertTrue(instances, '비교할 행이 없습니다.')
+        expected = list_renderer.serializer_class(instances, many=True, context={'request': request}).data
+        if fields is not None:
+            expected = [{name: item[name] for name in item if name in fields} for item in expected]
+        actual = list_renderer.render(list_renderer.values(queryset, fields), request, fields)
+        renderer = JSONRenderer()
+        for want, got in zip(expected, actual):
+            self.assertEqual(renderer.render(got).decode(), renderer.render(want).decode())
+        self.assertEqual(len(actual), len(expected))
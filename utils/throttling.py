@@ -0,0 +1,137 @@
+"""
+공유 캐시 기반 요청 제한 (DRF throttle)
+- 원자적 incr/decr만 쓴다. (DRF SimpleRateThrottle은 요청 기록 목록을 get/set 해서 동시 요청에서 틀어진다)
+- 비율은 REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']['<scope>.<user|ip>'] = '횟수/기간' (s, m, h, d)
+  scope는 뷰의 throttle_scope. 비율이 없으면 그 기준으로는 제한하지 않는다.
+- TokenBucket: 용량 = 횟수, 기간 동안 횟수만큼 다시 찬다. (순간 몰림은 용량까지 허용)
+  기간 단위 epoch 키에 사용량을 센다. epoch 첫 요청 때 토큰은 이전 epoch에서 남은 양 + 보충량(최대 용량)이다.
+  epoch 안에서 첫 요청 뒤 오래 쉬면 보충분이 용량을 넘어도 깎지 않으므로, 순간적으로 용량보다 조금 더
+  (최대 2×용량) 허용될 수 있다. (장기 평균 비율은 그대로)
+- SlidingWindow: 현재 구간 수 + 이전 구간 수 × 남은 겹침 비율 (구간 경계에서 두 배로 몰리지 않음)
+- 거절된 요청은 센 값을 되돌리므로 사용량에 들어가지 않는다.
+- 사용자 기준은 인증된 요청만 센다. (인증은 토큰 클레임/캐시로 끝나므로 거절까지 DB 조회가 없다)
+"""
+import time
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+KEY_PREFIX = 'throttle'
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """'10/min' → (10, 60)"""
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+def _incr(key, timeout):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # 이 epoch의 첫 요청
+        if cache.add(key, 1, timeout):
+            return 1
+        return cache.incr(key)
+
+
+def _release(key):
+    try:
+        cache.decr(key)
+    except ValueError:
+        pass  # 그 사이 만료됨
+
+
+class CacheThrottle(BaseThrottle):
+    key_by = None  # 'user' | 'ip'
+
+    def get_rate(self, view):
+        scope = getattr(view, 'throttle_scope', None)
+        if scope is None:
+            return None
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(f'{scope}.{self.key_by}')
+        return (scope, *parse_rate(rate)) if rate else None
+
+    def get_subject(self, request):
+        if self.key_by == 'user':
+            user = request.user
+            return str(user.pk) if user and user.is_authenticated else None
+        return self.get_ident(request)
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        rate = self.get_rate(view)
+        subject = self.get_subject(request) if rate else None
+        if subject is None:
+            return True
+        scope, num, duration = rate
+        return self.consume(f'{KEY_PREFIX}:{scope}:{self.key_by}:{subject}', num, duration, time.time())
+
+    def consume(self, key, num, duration, now) -> bool:
+        raise NotImplementedError
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class TokenBucketThrottle(CacheThrottle):
+    def consume(self, key, num, duration, now):
+        epoch = int(now // duration)
+        elapsed = now - epoch * duration
+        count_key, start_key = f'{key}:{epoch}:n', f'{key}:{epoch}:t'
+        timeout = duration * 3
+
+        start = cache.get(start_key)
+        if start is None:
+            # epoch 첫 요청: 지금 토큰 = min(용량, 이전 epoch 끝에 남은 토큰 + 지금까지 보충량)
+            # start는 "epoch 시작 시점 기준" 값으로 저장한다. (지금 토큰 - 보충량, 음수일 수 있음)
+            previous = cache.get_many([f'{key}:{epoch - 1}:n', f'{key}:{epoch - 1}:t'])
+            if f'{key}:{epoch - 1}:t' in previous:
+                carried = previous[f'{key}:{epoch - 1}:t'] + num - previous.get(f'{key}:{epoch - 1}:n', 0)
+            else:
+                carried = num  # 직전 epoch에 요청이 없었으면 가득 참
+            refill = num * elapsed / duration
+            start = min(num, carried + refill) - refill
+            if not cache.add(start_key, start, timeout):
+                start = cache.get(start_key, start)
+
+        count = _incr(count_key, timeout)
+        available = start + num * elapsed / duration
+        if count <= available:
+            return True
+        _release(count_key)
+        self.wait_seconds = (count - available) * duration / num
+        return False
+
+
+class SlidingWindowThrottle(CacheThrottle):
+    def consume(self, key, num, duration, now):
+        window = int(now // duration)
+        overlap = 1 - (now - window * duration) / duration
+        current_key = f'{key}:{window}'
+        count = _incr(current_key, duration * 2)
+        previous = cache.get(f'{key}:{window - 1}', 0)
+        if count + previous * overlap <= num:
+            return True
+        _release(current_key)
+        # 이전 구간 몫이 빠지거나 다음 구간으로 넘어갈 때까지
+        excess = count + previous * overlap - num
+        self.wait_seconds = min(excess / previous * duration, overlap * duration) if previous else overlap * duration
+        return False
+
+
+class UserTokenBucket(TokenBucketThrottle):
+    key_by = 'user'
+
+
+class IPTokenBucket(TokenBucketThrottle):
+    key_by = 'ip'
+
+
+class UserSlidingWindow(SlidingWindowThrottle):
+    key_by = 'user'
+
+
+class IPSlidingWindow(SlidingWindowThrottle):
+    key_by = 'ip'